@@ -0,0 +1,98 @@
+import unicodedata
+from functools import lru_cache
+
+# 정규화한 답의 길이 NEAR_MISS_RATIO당 한 글자까지 틀리면 '아까운 오답'으로 봅니다. (5글자 미만은 정확히 같아야 함)
+NEAR_MISS_RATIO = 5
+# 가타카나 -> 히라가나 (ァ~ヶ를 ぁ~ゖ로)
+KANA_FOLD = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+# 일본어 탁점/반탁점은 다른 글자이므로 악센트처럼 지우지 않음
+KEPT_MARKS = {"゙", "゚"}
+
+@lru_cache(maxsize=65536)
+def normalize(text):
+    """
+    답을 비교하기 위한 형태로 바꿉니다. 같은 문자열은 한 번만 계산합니다.
+    NFKC(전각/반각 통일) -> 소문자 -> NFD(한글은 자모로, 악센트는 결합 문자로 분리) -> 악센트 제거
+    -> 가타카나를 히라가나로 -> 공백 정리 순서입니다.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = unicodedata.normalize("NFD", text)
+    text = "".join(c for c in text if c in KEPT_MARKS or not unicodedata.combining(c))
+    return " ".join(text.translate(KANA_FOLD).split())
+
+def allowed_distance(normalized):
+    return len(normalized) // NEAR_MISS_RATIO
+
+@lru_cache(maxsize=65536)
+def _pattern(text):
+    # 글자 -> text에서 그 글자가 있는 위치들의 비트 (정답마다 한 번만 만듦)
+    peq = {}
+    for i, c in enumerate(text):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+def bounded_distance(a, b, limit):
+    """
+    a와 b의 편집 거리(삽입/삭제/교체/인접 글자 뒤바꿈)를 구하고, limit을 넘으면 limit + 1을 반환합니다.
+    길이 차이만으로 limit을 넘는 쌍은 바로 거르고, 나머지는 비트 병렬 알고리즘(Hyyrö 2003)으로
+    b의 글자마다 정수 연산 몇 번으로 한 열을 통째로 계산합니다. a(정답 쪽)의 비트 표는 캐시됩니다.
+    글자 하나마다 점수는 1까지만 줄 수 있으므로, 남은 글자를 다 써도 limit 안으로 돌아올 수 없으면 바로 멈춥니다.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if not a or not b:
+        return min(len(a) + len(b), limit + 1)
+
+    peq = _pattern(a)
+    full = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    vp, vn, d0, pm_prev = full, 0, 0, 0
+    distance = len(a)
+    remaining = len(b)
+    for c in b:
+        remaining -= 1
+        pm = peq.get(c, 0)
+        tr = (((~d0) & pm) << 1) & pm_prev # 인접 글자 뒤바뀜
+        d0 = ((((pm & vp) + vp) ^ vp) | pm | vn | tr) & full
+        hp = (vn | ~(d0 | vp)) & full
+        hn = d0 & vp
+        if hp & last:
+            distance += 1
+        elif hn & last:
+            distance -= 1
+        if distance - remaining > limit:
+            return limit + 1
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = (hn | ~(d0 | hp)) & full
+        vn = hp & d0
+        pm_prev = pm
+    return min(distance, limit + 1)
+
+def normalized_answers(answers):
+    """정답 목록의 정규화 형태. 문제를 미리 만들 때 함께 계산해 둡니다."""
+    return tuple(normalize(answer) for answer in answers)
+
+def find_near_miss(user_answer, answers, normalized=None):
+    """
+    틀린 답과 가장 가까운 정답을 찾습니다. 허용 거리 안에 있는 정답이 없으면 None.
+    normalized에 정답들의 정규화 형태를 넘기면 다시 계산하지 않습니다.
+    """
+    typed = normalize(user_answer)
+    if normalized is None:
+        normalized = normalized_answers(answers)
+    best, best_distance = None, None
+    for answer, target in zip(answers, normalized):
+        limit = allowed_distance(target)
+        if best_distance is not None:
+            limit = min(limit, best_distance - 1) # 이미 찾은 것보다 가까운 것만 찾음
+        if limit < 0:
+            continue
+        distance = bounded_distance(target, typed, limit)
+        if distance <= limit:
+            best, best_distance = answer, distance
+            if distance == 0:
+                break
+    return best
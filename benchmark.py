@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from question_prefetch import build_question
+
+DECK_NAME = "benchmark"
+SIZES = (1000, 10000, 100000)
+REPEAT = 3
+MODES = ("study_to_native", "native_to_study")
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+SEARCH_QUERIES = ("a", "ing", "tion", "없는검색어")
+
+def make_app_data(n_words, seed=0, days=365):
+    """
+    실제 app_data.json과 같은 형식의 합성 데이터를 만듭니다.
+    단어 n_words개짜리 덱 하나와 days일 동안의 학습 기록이 들어갑니다.
+    """
+    rng = random.Random(seed)
+    now = datetime.now().replace(second=0, microsecond=0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    syllables = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+
+    def text(now_offset_minutes):
+        return (now + timedelta(minutes=now_offset_minutes)).strftime(TIME_FORMAT)
+
+    words = []
+    for i in range(n_words):
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(3, 10))) + str(i)
+        meanings = ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 5))) for _ in range(rng.randint(1, 3))]
+        created = -rng.randint(0, days * 1440)
+        review_stats = {}
+        for mode in MODES:
+            correct, incorrect = rng.randint(0, 12), rng.randint(0, 4)
+            reviewed = correct + incorrect > 0
+            last = rng.randint(created, 0) if reviewed else None
+            review_stats[mode] = {
+                "correct_cnt": correct,
+                "incorrect_cnt": incorrect,
+                "prob_mode": "objective",
+                "last_reviewed": text(last) if reviewed else None,
+                # 절반쯤은 이미 복습 시각이 지난 단어
+                "next_review": text(rng.randint(-7 * 1440, 7 * 1440)),
+            }
+        words.append({"word": word, "meaning": meanings, "example": "", "created_at": text(created),
+                      "review_stats": review_stats})
+
+    study_log = {}
+    for day in range(days):
+        date = (now - timedelta(days=day)).strftime("%Y-%m-%d")
+        studied = rng.sample(range(n_words), min(n_words, rng.randint(0, 40)))
+        study_log[date] = {
+            "studied_word_count": len(studied),
+            "correct_count": rng.randint(0, 80),
+            "incorrect_count": rng.randint(0, 20),
+            "studied_words_today": [words[i]["word"] for i in studied],
+        }
+    deck = {"settings": {"native_lang": "한국어", "study_lang": "English"}, "words": words, "study_log": study_log}
+    return {"decks": {DECK_NAME: deck}, "study_log": {}}
+
+def measure(func, repeat=REPEAT, setup=None):
+    """func를 repeat번 실행한 시간(초) 목록. setup이 있으면 매번 실행 전에 호출합니다. (시간에는 미포함)"""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+def run_size(n_words, backend, repeat=REPEAT, seed=0):
+    """단어 n_words개 덱에서 각 작업의 시간을 재서 결과 목록을 반환합니다. 임시 디렉터리에서 실행합니다."""
+    from data_manager import DataManager
+
+    results = []
+    def record(op, times, **extra):
+        results.append({"size": n_words, "backend": backend, "op": op, "repeat": len(times),
+                        "min": min(times), "median": statistics.median(times), **extra})
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            os.makedirs("data")
+            with open("data/app_data.json", "w", encoding="utf-8") as f:
+                json.dump(make_app_data(n_words, seed), f, ensure_ascii=False)
+            # 저장소 형식 변환(바이너리/SQLite로 옮기기)은 처음 한 번이므로 측정에서 뺌
+            DataManager(backend).close()
+
+            managers = []
+            def load():
+                data_manager = DataManager(backend)
+                data_manager.count_words(DECK_NAME) # 덱을 늦게 읽는 저장소도 덱까지 읽고 단어 인덱스를 만들게 함
+                managers.append(data_manager)
+            record("load_data", measure(load, repeat))
+            data_manager = managers[-1]
+            for other in managers[:-1]:
+                other.close()
+
+            record("save_data", measure(data_manager.save_data, repeat))
+
+            # 학습 시작 (start_new_study_session): 복습 인덱스를 처음 만드는 경우와 이미 있는 경우
+            def drop_caches():
+                data_manager.notify_words_changed(DECK_NAME) # 복습 인덱스, 보기 후보, 검색 색인을 비움
+            due = []
+            record("due_selection_cold", measure(
+                lambda: due.append(data_manager.get_due_words(DECK_NAME, MODES[0])), repeat, drop_caches))
+            record("due_selection", measure(lambda: data_manager.get_due_words(DECK_NAME, MODES[0]), repeat),
+                   due_words=len(due[-1]))
+
+            # 문제 만들기 (보기 추출 포함) 100개
+            entries = list(data_manager.iter_words(DECK_NAME))
+            sample = [random.Random(seed + i).choice(entries) for i in range(100)] if entries else []
+            record("distractor_pool_build", measure(
+                lambda: data_manager.get_distractor_pool(DECK_NAME, MODES[0]), repeat, drop_caches))
+            record("build_question_x100", measure(
+                lambda: [build_question(data_manager, DECK_NAME, MODES[0], entry) for entry in sample], repeat))
+
+            # 단어 목록 검색 (filter_words): 색인 만들기와 검색어별 전체 결과
+            record("search_index_build", measure(
+                lambda: data_manager.get_search_index(DECK_NAME), repeat, drop_caches))
+            index = data_manager.get_search_index(DECK_NAME)
+            for query in SEARCH_QUERIES:
+                found = []
+                record("search", measure(lambda: found.append(sum(map(len, index.search(query)))), repeat),
+                       query=query, matches=found[-1])
+
+            # 통계 화면 (load_stats_data): 학습 기록 전체에서 합계를 다시 계산하는 경우와 이미 있는 경우
+            today = datetime.now().date()
+            def load_stats():
+                history = data_manager.history
+                for deck_name in (DECK_NAME, None):
+                    history.daily_range(today - timedelta(days=125), today, deck_name)
+                    history.totals(deck_name)
+            record("stats_rebuild", measure(data_manager.history.rebuild, repeat))
+            record("stats", measure(load_stats, repeat))
+            data_manager.close()
+        finally:
+            os.chdir(cwd)
+    return results
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def result_key(result):
+    return (result["size"], result["backend"], result["op"], result.get("query"))
+
+def label(result):
+    return result["op"] + (f" '{result['query']}'" if "query" in result else "")
+
+def compare(results, old_results):
+    """이전 결과 파일과 중앙값을 비교해 (결과, 이전 중앙값, 비율) 목록을 반환합니다."""
+    old = {result_key(r): r for r in old_results}
+    rows = []
+    for result in results:
+        previous = old.get(result_key(result))
+        if previous and previous["median"] > 0:
+            rows.append((result, previous["median"], result["median"] / previous["median"]))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 덱으로 데이터 처리 시간을 잽니다. (GUI 없이 실행)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="덱의 단어 수들")
+    parser.add_argument("--backends", nargs="+", default=["json"], help="저장소 종류들 (json, sharded, binary, sqlite)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="작업마다 반복 횟수")
+    parser.add_argument("--output", default="benchmark_results.json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    results = []
+    for backend in args.backends:
+        for size in args.sizes:
+            print(f"[{backend}] 단어 {size}개 측정 중...", flush=True)
+            results.extend(run_size(size, backend, args.repeat))
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for result in results:
+        print(f"{result['backend']:7s} {result['size']:7d}  {label(result):28s} "
+              f"중앙값 {result['median'] * 1000:9.2f} ms  최소 {result['min'] * 1000:9.2f} ms")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old_results = json.load(f)["results"]
+        print("\n이전 결과와 비교 (중앙값, 1.10 이상은 느려짐)")
+        for result, previous, ratio in compare(results, old_results):
+            mark = " ⚠️" if ratio >= 1.1 else ""
+            print(f"{result['backend']:7s} {result['size']:7d}  {label(result):28s} "
+                  f"{previous * 1000:9.2f} -> {result['median'] * 1000:9.2f} ms  x{ratio:.2f}{mark}")
+    print(f"\n결과를 {args.output}에 저장했습니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,556 @@
+import gc
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from collections.abc import Mapping
+from datetime import date, datetime
+from functools import cached_property, lru_cache
+from itertools import accumulate, repeat
+
+from data_manager import DATA_FILE, JOURNAL_FILE, JsonBackend, LazyDecks
+from due_index import _utc_offset
+from models import MODES, LazyRecord, ReviewStats, WordRecord, plain_deck
+
+BIN_FILE = "data/app_data.bin"
+MAGIC = b"MVOCABIN"
+VERSION = 1
+MODE_SET = frozenset(MODES)
+WORD_KEYS = {"word", "meaning", "example", "created_at", "review_stats"}
+STATS_KEYS = {"correct_cnt", "incorrect_cnt", "prob_mode", "last_reviewed", "next_review"}
+# 복습 주기 계산기 상태. 값이 하나라도 있는 필드만 array('d') 열로 저장하고 NaN은 None을 뜻합니다.
+SCHEDULER_KEYS = ReviewStats.SCHEDULER_FIELDS
+INT_SCHEDULER_KEYS = {"interval", "reps"}
+SEPARATOR = "\0"
+UINT_MAX = 0xFFFFFFFF
+
+# 시각은 1970-01-01 00:00(현지 시각)부터의 분 + 1로 저장하고, 0은 None을 뜻합니다.
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+CLOCK_TEXTS = [f"{h:02d}:{m:02d}" for h in range(24) for m in range(60)]
+
+class _Irregular(Exception):
+    """열 형식에 맞지 않는 단어. 이런 단어는 통째로 JSON으로 보관합니다."""
+
+@lru_cache(maxsize=None)
+def _day_text(day):
+    return date.fromordinal(EPOCH_ORDINAL + day).isoformat()
+
+def _minutes_to_text(value):
+    if not value:
+        return None
+    day, minute = divmod(value - 1, 1440)
+    return _day_text(day) + " " + CLOCK_TEXTS[minute]
+
+@lru_cache(maxsize=None)
+def _hour_epoch(hour):
+    day, hour = divmod(hour, 24)
+    moment = date.fromordinal(EPOCH_ORDINAL + day)
+    return int(datetime(moment.year, moment.month, moment.day, hour).timestamp())
+
+def _minutes_to_epoch(value):
+    # 시간 단위로만 현지 시각 -> epoch 변환을 하고 분은 더함 (서머타임 전환도 정시 단위)
+    if not value:
+        return None
+    hour, minute = divmod(value - 1, 60)
+    return _hour_epoch(hour) + minute * 60
+
+def _text_to_minutes(text):
+    if text is None:
+        return 0
+    try:
+        day = date.fromisoformat(text[:10]).toordinal() - EPOCH_ORDINAL
+        value = day * 1440 + int(text[11:13]) * 60 + int(text[14:16]) + 1
+    except (TypeError, ValueError):
+        raise _Irregular
+    # "%Y-%m-%d %H:%M" 형식 그대로 되돌릴 수 있는 값만 열에 저장
+    if not 0 < value <= UINT_MAX or _minutes_to_text(value) != text:
+        raise _Irregular
+    return value
+
+def _epoch_to_minutes(epoch):
+    # _minutes_to_epoch의 반대. 현지 시각과 UTC의 차이만 더해 분으로 바꿈 (문자열을 거치지 않음)
+    if epoch is None:
+        return 0
+    if type(epoch) is not int:
+        raise _Irregular
+    value = (epoch + _utc_offset(epoch // 900)) // 60 + 1
+    if not 0 < value <= UINT_MAX:
+        raise _Irregular
+    return value
+
+def _record_values(entry):
+    """
+    WordRecord 하나의 열 값 (단어/예문/등록 시각, 뜻 목록, 모드별 통계, ID).
+    속성을 바로 읽고 epoch 시각을 분으로 바로 바꾸므로, 딕셔너리 방식으로 읽어 시각 문자열을 다시 푸는 것보다 빠릅니다.
+    """
+    if entry.extra or type(entry.meaning) is not list:
+        raise _Irregular
+    word_id = entry.id
+    if word_id is not None and (type(word_id) is not int or not 0 < word_id <= UINT_MAX):
+        raise _Irregular
+    if not entry.review_stats.keys() <= MODE_SET:
+        raise _Irregular
+    stats_values = {}
+    for mode, stats in entry.review_stats.items():
+        if stats is None:
+            continue
+        if type(stats) is not ReviewStats or stats.extra:
+            raise _Irregular
+        if stats.prob_mode is not None:
+            _check_text(stats.prob_mode)
+        stats_values[mode] = (
+            stats.prob_mode, _check_count(stats.correct_cnt), _check_count(stats.incorrect_cnt),
+            _epoch_to_minutes(stats.last_reviewed), _epoch_to_minutes(stats.next_review),
+            [_check_number(key, getattr(stats, key)) for key in SCHEDULER_KEYS],
+        )
+    meanings = [_check_text(m) for m in entry.meaning]
+    if len(meanings) > UINT_MAX:
+        raise _Irregular
+    row_values = (_check_text(entry.word), _check_text(entry.example), _epoch_to_minutes(entry.created_at))
+    return row_values, meanings, stats_values, word_id or 0
+
+def _mapping_values(entry):
+    # 딕셔너리(또는 같은 키를 가진 Mapping) 단어 하나의 열 값. 시각 문자열을 분으로 바꿈
+    keys = entry.keys() - {"id"}
+    if keys != WORD_KEYS or not isinstance(entry["meaning"], list):
+        raise _Irregular
+    word_id = entry.get("id", 0)
+    if "id" in entry and (type(word_id) is not int or not 0 < word_id <= UINT_MAX):
+        raise _Irregular
+    review_stats = entry["review_stats"]
+    if not isinstance(review_stats, Mapping) or not review_stats.keys() <= MODE_SET:
+        raise _Irregular
+
+    stats_values = {}
+    for mode in MODES:
+        stats = review_stats.get(mode)
+        if stats is None:
+            continue
+        if not isinstance(stats, Mapping) or not STATS_KEYS <= stats.keys() <= STATS_KEYS.union(SCHEDULER_KEYS):
+            raise _Irregular
+        prob_mode = stats["prob_mode"]
+        if prob_mode is not None:
+            _check_text(prob_mode)
+        stats_values[mode] = (
+            prob_mode, _check_count(stats["correct_cnt"]), _check_count(stats["incorrect_cnt"]),
+            _text_to_minutes(stats["last_reviewed"]), _text_to_minutes(stats["next_review"]),
+            [_check_number(key, stats.get(key)) for key in SCHEDULER_KEYS],
+        )
+    row_meanings = [_check_text(m) for m in entry["meaning"]]
+    row_values = (_check_text(entry["word"]), _check_text(entry["example"]),
+                  _text_to_minutes(entry["created_at"]))
+    if len(row_meanings) > UINT_MAX:
+        raise _Irregular
+    return row_values, row_meanings, stats_values, word_id
+
+def _check_text(text):
+    if not isinstance(text, str) or SEPARATOR in text:
+        raise _Irregular
+    return text
+
+def _check_count(value):
+    if type(value) is not int or not 0 <= value <= UINT_MAX:
+        raise _Irregular
+    return value
+
+def _check_number(key, value):
+    if value is None:
+        return math.nan
+    if key in INT_SCHEDULER_KEYS:
+        if type(value) is not int or abs(value) > 2 ** 53:
+            raise _Irregular
+        return float(value)
+    if type(value) is not float or not math.isfinite(value):
+        raise _Irregular
+    return value
+
+def _le_bytes(arr):
+    # 파일에는 항상 little-endian으로 저장
+    if sys.byteorder == "big":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+def _le_array(typecode, data):
+    arr = array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+def _pack(header, sections):
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return struct.pack("<I", len(header_bytes)) + header_bytes + b"".join(sections)
+
+def _unpack(data):
+    if len(data) < 4:
+        raise ValueError("헤더가 잘렸습니다.")
+    (header_len,) = struct.unpack_from("<I", data)
+    return json.loads(bytes(data[4:4 + header_len]).decode("utf-8")), 4 + header_len
+
+def encode_deck(deck):
+    """
+    덱 하나를 열(column) 단위 바이트로 바꿉니다.
+    단어/뜻/예문은 구분자로 이은 문자열 하나씩, 횟수는 array('I'), 시각은 분 단위 정수 배열로 저장합니다.
+    """
+    words, meanings, examples = [], [], []
+    meaning_counts, created, ids = array("I"), array("I"), array("I")
+    mode_columns = {mode: {"flag": array("B"), "correct_cnt": array("I"), "incorrect_cnt": array("I"),
+                           "last_reviewed": array("I"), "next_review": array("I")} for mode in MODES}
+    scheduler_columns = {mode: {key: array("d") for key in SCHEDULER_KEYS} for mode in MODES}
+    used_scheduler_keys = {mode: set() for mode in MODES}
+    prob_modes = {}
+    raw = {}
+
+    for row, entry in enumerate(deck.get("words", [])):
+        if isinstance(entry, LazyRecord) and (entry.converted or type(entry) is not _ColumnRow):
+            entry = entry.to_record()
+        try:
+            if type(entry) is _ColumnRow:
+                # 한 번도 꺼내지 않은 줄은 읽어 둔 열 값을 그대로 씀
+                row_values, row_meanings, stats_values = entry.columns.values(entry.row)
+                word_id = entry.id or 0
+            elif type(entry) is WordRecord:
+                row_values, row_meanings, stats_values, word_id = _record_values(entry)
+            else:
+                row_values, row_meanings, stats_values, word_id = _mapping_values(entry)
+        except _Irregular:
+            raw[str(row)] = entry.to_dict() if isinstance(entry, WordRecord) else entry
+            row_meanings, row_values, stats_values, word_id = [], ("", "", 0), {}, 0
+
+        words.append(row_values[0])
+        examples.append(row_values[1])
+        created.append(row_values[2])
+        meanings.extend(row_meanings)
+        meaning_counts.append(len(row_meanings))
+        ids.append(word_id)
+        for mode in MODES:
+            columns = mode_columns[mode]
+            values = stats_values.get(mode)
+            if values is None:
+                columns["flag"].append(0)
+                for name in ("correct_cnt", "incorrect_cnt", "last_reviewed", "next_review"):
+                    columns[name].append(0)
+                for column in scheduler_columns[mode].values():
+                    column.append(math.nan)
+                continue
+            # flag: 0은 통계 없음, 1은 prob_mode가 None, 2부터는 prob_modes 목록의 번호 + 2
+            prob_mode = values[0]
+            code = 1 if prob_mode is None else prob_modes.setdefault(prob_mode, len(prob_modes)) + 2
+            if code > 255:
+                raise ValueError("prob_mode 종류가 너무 많습니다.")
+            columns["flag"].append(code)
+            columns["correct_cnt"].append(values[1])
+            columns["incorrect_cnt"].append(values[2])
+            columns["last_reviewed"].append(values[3])
+            columns["next_review"].append(values[4])
+            for key, value in zip(SCHEDULER_KEYS, values[5]):
+                scheduler_columns[mode][key].append(value)
+                if value == value: # NaN이 아니면 값이 있는 것
+                    used_scheduler_keys[mode].add(key)
+
+    sections = [
+        ("word", SEPARATOR.join(words).encode("utf-8")),
+        ("meaning", SEPARATOR.join(meanings).encode("utf-8")),
+        ("example", SEPARATOR.join(examples).encode("utf-8")),
+        ("meaning_count", _le_bytes(meaning_counts)),
+        ("created_at", _le_bytes(created)),
+        ("id", _le_bytes(ids)),
+    ]
+    for mode in MODES:
+        for name, column in mode_columns[mode].items():
+            sections.append((f"{mode}.{name}", _le_bytes(column)))
+        for key in SCHEDULER_KEYS:
+            if key in used_scheduler_keys[mode]:
+                sections.append((f"{mode}.{key}", _le_bytes(scheduler_columns[mode][key])))
+
+    header = {
+        "deck": {k: v for k, v in deck.items() if k != "words"},
+        "count": len(words),
+        "prob_modes": list(prob_modes),
+        "raw": raw,
+        "columns": [[name, len(data)] for name, data in sections],
+    }
+    return _pack(header, [data for _, data in sections])
+
+class _DeckColumns:
+    """
+    decode_deck이 푼 덱 하나의 열 값. 단어 한 줄은 처음 꺼낼 때 record()로 WordRecord를 만들고,
+    한 번도 꺼내지 않은 줄은 저장할 때 values()로 읽어 둔 열 값을 그대로 다시 씁니다.
+    """
+    def __init__(self, header, columns):
+        count = header["count"]
+        def texts(name):
+            return bytes(columns[name]).decode("utf-8").split(SEPARATOR) if count else []
+        def numbers(name, typecode="I"):
+            return _le_array(typecode, columns[name])
+
+        self.words = texts("word")
+        # 예문과 뜻은 단어를 처음 꺼낼 때 풂 (매핑을 닫을 수 있도록 바이트는 복사해 둠)
+        self._example_bytes = bytes(columns["example"]) if count else None
+        self._meaning_bytes = bytes(columns["meaning"])
+        self._meaning_counts = numbers("meaning_count")
+        self.created = numbers("created_at")
+        self.ids = numbers("id")
+        self.prob_modes = [None, None] + header["prob_modes"]
+        # 모드마다 (flag, 맞힌 수, 틀린 수, 마지막 복습, 다음 복습, 계산기 상태 열들). 계산기 상태 열은 값이 있을 때만 저장됨
+        self.modes = [(mode, numbers(f"{mode}.flag", "B"), numbers(f"{mode}.correct_cnt"),
+                       numbers(f"{mode}.incorrect_cnt"), numbers(f"{mode}.last_reviewed"),
+                       numbers(f"{mode}.next_review"),
+                       [numbers(f"{mode}.{key}", "d") if f"{mode}.{key}" in columns else None
+                        for key in SCHEDULER_KEYS])
+                      for mode in MODES]
+        if not len(self.words) == len(self._meaning_counts) == len(self.created) == len(self.ids) == count:
+            raise ValueError("단어 수가 헤더와 다릅니다.")
+
+    @cached_property
+    def examples(self):
+        return self._example_bytes.decode("utf-8").split(SEPARATOR) if self._example_bytes is not None else []
+
+    @cached_property
+    def meanings(self):
+        return self._meaning_bytes.decode("utf-8").split(SEPARATOR)
+
+    @cached_property
+    def meaning_starts(self):
+        return list(accumulate(self._meaning_counts, initial=0))
+
+    def record(self, row, word, word_id):
+        review_stats = {}
+        for mode, flags, correct, incorrect, last, next_review, scheduler in self.modes:
+            flag = flags[row]
+            if not flag:
+                continue
+            stats = ReviewStats(correct[row], incorrect[row], self.prob_modes[flag],
+                                _minutes_to_epoch(last[row]), _minutes_to_epoch(next_review[row]))
+            for key, column in zip(SCHEDULER_KEYS, scheduler):
+                if column is not None and column[row] == column[row]: # NaN은 None
+                    setattr(stats, key, int(column[row]) if key in INT_SCHEDULER_KEYS else column[row])
+            review_stats[mode] = stats
+        start, end = self.meaning_starts[row], self.meaning_starts[row + 1]
+        return WordRecord(word, self.meanings[start:end], self.examples[row],
+                          _minutes_to_epoch(self.created[row]), review_stats, word_id)
+
+    def values(self, row):
+        # _record_values와 같은 형식의 열 값 (ID 제외). 시각은 분 단위 그대로 씀
+        stats_values = {}
+        for mode, flags, correct, incorrect, last, next_review, scheduler in self.modes:
+            flag = flags[row]
+            if flag:
+                stats_values[mode] = (
+                    self.prob_modes[flag], correct[row], incorrect[row], last[row], next_review[row],
+                    [math.nan if column is None else column[row] for column in scheduler],
+                )
+        start, end = self.meaning_starts[row], self.meaning_starts[row + 1]
+        row_values = (self.words[row], self.examples[row], self.created[row])
+        return row_values, self.meanings[start:end], stats_values
+
+class _ColumnRow(LazyRecord):
+    """바이너리 덱의 단어 한 줄. 처음 꺼낼 때 _DeckColumns에서 WordRecord를 만듭니다."""
+    __slots__ = ("columns", "row")
+
+    def __init__(self, columns, row, word, word_id):
+        self.columns = columns
+        self.row = row
+        self.word = word
+        self.id = word_id or None # 열에서 0은 ID 없음
+        self._record = None
+
+    def _make_record(self):
+        return self.columns.record(self.row, self.word, self.id)
+
+def decode_deck(data):
+    """
+    encode_deck으로 만든 바이트를 원래 덱 딕셔너리로 되돌립니다.
+    열만 풀어 두고, 단어는 처음 꺼낼 때 WordRecord가 되는 LazyRecord로 채웁니다.
+    """
+    header, offset = _unpack(data)
+    columns = {}
+    for name, length in header["columns"]:
+        columns[name] = data[offset:offset + length]
+        offset += length
+    if offset > len(data):
+        raise ValueError("덱 데이터가 잘렸습니다.")
+
+    deck_columns = _DeckColumns(header, columns)
+    gc_was_enabled = gc.isenabled()
+    gc.disable() # 작은 객체를 대량으로 만드는 동안 순환 참조 검사를 잠시 멈춤
+    try:
+        entries = list(map(_ColumnRow, repeat(deck_columns), range(len(deck_columns.words)),
+                           deck_columns.words, deck_columns.ids))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    for row, entry in header["raw"].items():
+        entries[int(row)] = entry
+
+    deck = dict(header["deck"])
+    deck["words"] = entries
+    return deck
+
+def encode_app_data(app_data, raw_decks=None):
+    """
+    app_data 전체를 바이너리 스냅샷으로 바꿉니다.
+    raw_decks에 들어 있는 (아직 읽지 않은) 덱은 다시 인코딩하지 않고 그대로 씁니다.
+    """
+    raw_decks = raw_decks or {}
+    decks = app_data.get("decks", {})
+    table, blobs = [], []
+    for name in decks:
+        if isinstance(decks, LazyDecks) and not decks.is_loaded(name):
+            blob = raw_decks[name]
+        else:
+            blob = encode_deck(decks[name])
+        table.append([name, len(blob), zlib.crc32(blob)])
+        blobs.append(blob)
+
+    header = {"app": {k: v for k, v in app_data.items() if k != "decks"}, "decks": table}
+    return MAGIC + struct.pack("<I", VERSION) + _pack(header, blobs)
+
+def read_snapshot(path):
+    """
+    스냅샷 파일을 메모리 매핑으로 열어 (덱 외 데이터, {덱 이름: 덱 바이트})를 반환합니다.
+    덱 바이트는 복사하지 않은 memoryview이고, 이 view가 남아 있는 동안 매핑도 열려 있습니다.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) # 빈 파일이면 ValueError
+    view = memoryview(mm)
+    raw_decks = {}
+    try:
+        if view[:len(MAGIC)] != MAGIC:
+            raise ValueError("바이너리 스냅샷 파일이 아닙니다.")
+        (version,) = struct.unpack_from("<I", view, len(MAGIC))
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전입니다: {version}")
+        start = len(MAGIC) + 4
+        header, offset = _unpack(view[start:])
+        offset += start
+
+        raw_decks = {}
+        for name, length, crc in header["decks"]:
+            blob = view[offset:offset + length]
+            if len(blob) != length or zlib.crc32(blob) != crc:
+                raise ValueError(f"덱 '{name}'의 데이터가 손상되었습니다.")
+            raw_decks[name] = blob
+            offset += length
+    except BaseException:
+        for blob in raw_decks.values():
+            blob.release()
+        _close_map(view)
+        raise
+    return header["app"], raw_decks
+
+def _close_map(view):
+    # view와 그 매핑을 닫음. 아직 쓰고 있는 view가 있으면 매핑은 마지막 view와 함께 정리됨
+    mm = view.obj
+    view.release()
+    try:
+        mm.close()
+    except BufferError:
+        pass
+
+class BinaryBackend(JsonBackend):
+    """
+    app_data.bin 바이너리 스냅샷을 쓰는 저장소. 저널, 세대 보관, 복구 방식은 JsonBackend와 같습니다.
+    파일은 메모리 매핑으로 열어 두고, 덱은 처음 접근할 때 매핑에서 바로 열만 풉니다. 단어는 처음 꺼낼 때
+    WordRecord가 되고, 손대지 않은 덱은 바이트를, 꺼내지 않은 단어는 읽어 둔 열 값을 그대로 다시 씁니다.
+    """
+    def __init__(self, data_file=BIN_FILE, journal_file=JOURNAL_FILE, json_file=DATA_FILE):
+        super().__init__(data_file, journal_file)
+        self.json_file = json_file
+        self._raw_decks = {}
+        # 스냅샷을 새로 쓰는 동안(매핑을 닫고 다시 여는 동안) 덱을 풀지 못하게 함
+        self._map_lock = threading.Lock()
+        self._migrated = False
+
+    def encode(self, app_data, dirty_decks=None):
+        decks = app_data.get("decks", {})
+        with self._map_lock:
+            if isinstance(decks, LazyDecks):
+                for name, _ in decks.loaded_items():
+                    self._raw_decks.pop(name, None)
+            return encode_app_data(app_data, self._raw_decks)
+
+    def decode(self, path):
+        app, raw_decks = read_snapshot(path)
+        self._release_raw_decks()
+        self._raw_decks = raw_decks
+        app_data = dict(app)
+        app_data["decks"] = LazyDecks(list(raw_decks), self._load_deck)
+        return app_data
+
+    def _load_deck(self, deck_name):
+        with self._map_lock:
+            return decode_deck(self._raw_decks[deck_name])
+
+    def write_snapshot(self, data):
+        with self._map_lock:
+            # 매핑된 파일은 (Windows에서) 이름을 바꿀 수 없으므로 닫고 쓴 뒤, 아직 읽지 않은 덱을 새 파일에서 다시 가리킴
+            names = list(self._raw_decks)
+            self._release_raw_decks()
+            super().write_snapshot(data)
+            if names:
+                _, raw_decks = read_snapshot(self.data_file)
+                self._raw_decks = {name: raw_decks.pop(name) for name in names}
+                for view in raw_decks.values():
+                    view.release()
+
+    def close(self):
+        super().close()
+        with self._map_lock:
+            self._release_raw_decks()
+
+    def _release_raw_decks(self):
+        views, self._raw_decks = list(self._raw_decks.values()), {}
+        if views:
+            for view in views[1:]:
+                view.release()
+            _close_map(views[0])
+
+    def load(self):
+        self._migrated = False
+        app_data = super().load()
+        if self._migrated:
+            # 저널은 그대로 두므로 다음 실행에서 다시 재생되어도 같은 값이 됨
+            self.write_snapshot(self.encode(app_data))
+        return app_data
+
+    def _read_snapshot(self):
+        app_data = super()._read_snapshot()
+        if app_data is None and self.json_file and os.path.exists(self.json_file):
+            # 바이너리 스냅샷이 아직 없으면 기존 app_data.json을 읽어 바이너리로 옮김
+            print(f"{self.json_file}를 읽어 바이너리 스냅샷으로 옮깁니다.")
+            with open(self.json_file, "r", encoding="utf-8") as f:
+                app_data = json.load(f)
+            self._migrated = True
+        return app_data
+
+def convert(json_file=DATA_FILE, bin_file=BIN_FILE):
+    """app_data.json을 바이너리 스냅샷으로 바꾸고 크기와 읽기 시간을 출력합니다."""
+    started = time.perf_counter()
+    with open(json_file, "r", encoding="utf-8") as f:
+        app_data = json.load(f)
+    json_load = time.perf_counter() - started
+
+    data = encode_app_data(app_data)
+    with open(bin_file, "wb") as f:
+        f.write(data)
+
+    started = time.perf_counter()
+    app, raw_decks = read_snapshot(bin_file)
+    decks = {name: decode_deck(blob) for name, blob in raw_decks.items()}
+    bin_load = time.perf_counter() - started
+    if {name: plain_deck(deck) for name, deck in decks.items()} != app_data.get("decks", {}):
+        raise ValueError("변환 결과가 원본과 다릅니다.")
+
+    print(f"JSON  : {os.path.getsize(json_file):>12,} bytes, 읽기 {json_load * 1000:8.1f} ms")
+    print(f"Binary: {os.path.getsize(bin_file):>12,} bytes, 읽기 {bin_load * 1000:8.1f} ms (모든 덱 열 풀기 포함)")
+
+if __name__ == "__main__":
+    convert(*sys.argv[1:3])
@@ -0,0 +1,107 @@
+import argparse
+import csv
+import os
+import time
+
+from instrumentation import timed
+
+# 진행 상황은 CHUNK_SIZE 줄마다 알리고, 저장은 COMMIT_ROWS 줄마다 한 번씩 합니다.
+CHUNK_SIZE = 1000
+COMMIT_ROWS = 20000
+
+def _iter_lines(f, counter):
+    # csv 모듈에 넘길 줄을 읽으면서 읽은 바이트 수를 셉니다. (진행률 계산용)
+    for raw_line in f:
+        counter[0] += len(raw_line)
+        yield raw_line.decode('utf-8-sig' if counter[0] == len(raw_line) else 'utf-8')
+
+def iter_csv_chunks(file_path, chunk_size=CHUNK_SIZE):
+    """CSV 파일을 chunk_size 줄씩 읽어 (행 목록, 읽은 바이트, 전체 바이트)를 차례로 돌려줍니다."""
+    total_bytes = os.path.getsize(file_path)
+    counter = [0]
+    with open(file_path, 'rb') as f:
+        reader = csv.DictReader(_iter_lines(f, counter))
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk, counter[0], total_bytes
+                chunk = []
+        if chunk:
+            yield chunk, counter[0], total_bytes
+
+@timed("import_csv")
+def import_csv(data_manager, deck_name, file_path, progress=None, is_cancelled=None,
+               chunk_size=CHUNK_SIZE, commit_rows=COMMIT_ROWS):
+    """
+    CSV 파일(word, meaning, example 열)을 스트리밍으로 읽어 덱에 병합합니다.
+    GUI 없이도 사용할 수 있으며, 화면에서는 작업 스레드에서 호출합니다.
+
+    progress(읽은 바이트, 전체 바이트, 결과)는 chunk마다 호출되고,
+    is_cancelled()가 True를 돌려주면 그때까지 병합한 내용만 저장하고 멈춥니다.
+    """
+    result = {"total": 0, "added": 0, "updated": 0, "duplicate": 0, "cancelled": False}
+    uncommitted = 0
+
+    for rows, bytes_read, total_bytes in iter_csv_chunks(file_path, chunk_size):
+        if is_cancelled and is_cancelled():
+            result["cancelled"] = True
+            break
+
+        now = int(time.time())
+        touched_entries = []
+        # chunk 하나는 락을 잡은 채로 병합 (단어 인덱스로 CSV 안의 중복도 걸러짐)
+        with data_manager.lock:
+            for row in rows:
+                result["total"] += 1
+                word = (row.get('word') or '').strip()
+                if not word: continue
+
+                meanings = [m.strip() for m in (row.get('meaning') or '').split(';') if m.strip()]
+                example = (row.get('example') or '').strip()
+
+                status, entry, _ = data_manager.upsert_word(deck_name, word, meanings, example, now)
+                result[status] += 1
+                if status != "duplicate":
+                    touched_entries.append(entry)
+
+        # 일본어 덱이면 이번 chunk 단어들의 히라가나 읽기를 한꺼번에 변환
+        data_manager.update_readings(deck_name, touched_entries)
+        uncommitted += len(rows)
+        if uncommitted >= commit_rows:
+            data_manager.save_data()
+            uncommitted = 0
+
+        if progress:
+            progress(bytes_read, total_bytes, dict(result))
+
+    if uncommitted:
+        data_manager.save_data()
+    # 하루 복습 상한이 있는 덱이면 새로 등록한 단어들을 여러 날에 나눠 배치
+    if result["added"] and data_manager.get_deck_settings(deck_name).get("daily_cap"):
+        data_manager.spread_due_load(deck_name)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV 파일의 단어를 덱에 등록합니다.")
+    parser.add_argument("deck", help="단어를 추가할 덱 이름 (없으면 새로 만듦)")
+    parser.add_argument("csv_file", help="word, meaning, example 열이 있는 CSV 파일")
+    parser.add_argument("--native", help="새 덱의 기본 언어 (예: 한국어)")
+    parser.add_argument("--study", help="새 덱의 학습 언어 (예: English)")
+    args = parser.parse_args()
+
+    from data_manager import DataManager
+    data_manager = DataManager()
+    if data_manager.add_deck(args.deck) and args.native and args.study:
+        data_manager.update_deck_settings(args.deck, args.native, args.study)
+
+    def print_progress(bytes_read, total_bytes, result):
+        percent = bytes_read * 100 // max(total_bytes, 1)
+        print(f"\r{percent:3d}% - {result['total']}줄 처리", end="", flush=True)
+
+    result = import_csv(data_manager, args.deck, args.csv_file, progress=print_progress)
+    data_manager.close()
+    print(f"\n신규 등록: {result['added']}개, 뜻 추가: {result['updated']}개, 중복: {result['duplicate']}개")
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,671 @@
 import json
 import os
+import struct
+import threading
+import time
+from collections.abc import MutableMapping
+
+from distractors import DistractorPool
+from due_index import DueIndex, day_of, day_start
+from instrumentation import timed
+from models import MODES, LazyRecord, ReviewStats, WordRecord, plain_deck
+from reading_cache import ReadingCache, japanese_texts
+from review_events import ReviewEventLog
+from scheduler import DEFAULT_SCHEDULER, create_scheduler
+from search_index import SearchIndex
+from study_history import StudyHistory
+from word_index import WordIndex, make_word_entry
 
 DATA_FILE = "data/app_data.json"
+JOURNAL_FILE = "data/app_data.journal"
+# 이전 형식의 전체 학습 기록 (날짜별 세션과 학습 시간). 학습 기록으로 옮긴 뒤 .migrated로 이름을 바꿈
+LEGACY_STUDY_LOG = "data/study_log.json"
+# 스냅샷을 저장할 때 이전 스냅샷을 이 개수만큼 app_data.json.1, .2, ... 로 보관합니다.
+SNAPSHOT_GENERATIONS = 3
+# 저널 레코드가 이 개수를 넘으면 백그라운드에서 스냅샷으로 압축합니다.
+COMPACT_THRESHOLD = 500
+# 복습 결과는 모아 두었다가 답 FLUSH_EVERY개마다, 또는 FLUSH_INTERVAL초마다 한 번에 기록합니다.
+FLUSH_EVERY = 20
+FLUSH_INTERVAL = 5.0
+# 복습량 예측은 기본으로 FORECAST_DAYS일을 보여 줍니다.
+FORECAST_DAYS = 7
+# 덱에 하루 복습 상한(daily_cap)이 있으면, 하루 이상 뒤로 잡힌 복습을 간격의 ±LOAD_BALANCE_FUZZ 안에서
+# 가장 한가한 날로 옮깁니다.
+LOAD_BALANCE_FUZZ = 0.1
+# 사용할 저장소 종류 ("sharded", "json", "binary" 또는 "sqlite")
+STORAGE_BACKEND = "sharded"
+
+def _fsync_dir(path):
+    # 이름 바꾸기까지 디스크에 반영 (디렉터리를 열 수 없는 Windows에서는 건너뜀)
+    try:
+        fd = os.open(path or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _indented(value, level):
+    # 작은 값은 기존처럼 들여 쓴 JSON으로 (이어지는 줄은 level단계만큼 더 들여 씀)
+    return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + "  " * level)
+
+def _json_object(items, level):
+    if not items:
+        return "{}"
+    pad = "  " * (level + 1)
+    body = ",\n".join(f"{pad}{json.dumps(key, ensure_ascii=False)}: {text}" for key, text in items)
+    return "{\n" + body + "\n" + "  " * level + "}"
+
+_WORD_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+def _dumps_deck(deck):
+    items = []
+    for key, value in deck.items():
+        if key == "words" and value:
+            pad = "  " * 4
+            lines = pad + (",\n" + pad).join(map(_WORD_ENCODER.encode, value))
+            items.append((key, "[\n" + lines + "\n" + "  " * 3 + "]"))
+        else:
+            items.append((key, _indented(value, 3)))
+    return _json_object(items, 2)
+
+def dumps_app_data(app_data):
+    """
+    app_data를 사람이 읽을 수 있는 JSON 문자열로 바꿉니다. 단어는 한 줄에 하나씩 씁니다.
+    json.dumps(indent=2)는 파이썬으로 구현된 느린 인코더를 쓰므로, 양이 많은 단어 줄만은
+    들여쓰기 없이 C 인코더로 만들고 나머지 작은 값만 들여 씁니다. WordRecord는 to_dict()로 바꿔 씁니다.
+    """
+    items = []
+    for key, value in app_data.items():
+        if key == "decks":
+            decks = [(name, _dumps_deck(plain_deck(deck))) for name, deck in value.items()]
+            items.append((key, _json_object(decks, 1)))
+        else:
+            items.append((key, _indented(value, 1)))
+    return _json_object(items, 0)
+
+def rotate_generations(path):
+    """path -> path.1 -> path.2 ... 순서로 밀고, SNAPSHOT_GENERATIONS개를 넘는 것은 버립니다."""
+    if SNAPSHOT_GENERATIONS <= 0:
+        return
+    for n in range(SNAPSHOT_GENERATIONS - 1, 0, -1):
+        if os.path.exists(f"{path}.{n}"):
+            os.replace(f"{path}.{n}", f"{path}.{n + 1}")
+    if os.path.exists(path):
+        os.replace(path, f"{path}.1")
+
+def default_app_data():
+    """비어있는 앱 데이터의 기본 구조를 반환합니다."""
+    return {"decks": {}}
+
+class LazyDecks(MutableMapping):
+    """
+    덱 이름 목록만 먼저 가지고 있다가, 덱 데이터는 처음 접근할 때
+    loader(deck_name)를 호출해 읽어오는 딕셔너리입니다.
+    """
+    _NOT_LOADED = object()
+
+    def __init__(self, deck_names, loader):
+        self._decks = dict.fromkeys(deck_names, self._NOT_LOADED)
+        self._loader = loader
+
+    def __getitem__(self, deck_name):
+        deck = self._decks[deck_name]
+        if deck is self._NOT_LOADED:
+            deck = self._loader(deck_name)
+            self._decks[deck_name] = deck
+        return deck
+
+    def __setitem__(self, deck_name, deck):
+        self._decks[deck_name] = deck
+
+    def __delitem__(self, deck_name):
+        del self._decks[deck_name]
+
+    def __iter__(self):
+        return iter(self._decks)
+
+    def __len__(self):
+        return len(self._decks)
+
+    def __contains__(self, deck_name):
+        # 기본 구현은 __getitem__을 호출하므로, 덱을 읽지 않고 이름만 확인
+        return deck_name in self._decks
+
+    def add_unloaded(self, deck_name):
+        """아직 읽지 않은 덱 이름을 추가합니다. (처음 접근할 때 loader로 읽음)"""
+        self._decks[deck_name] = self._NOT_LOADED
+
+    def is_loaded(self, deck_name):
+        return self._decks.get(deck_name, self._NOT_LOADED) is not self._NOT_LOADED
+
+    def loaded_items(self):
+        """이미 읽어온 덱만 (이름, 데이터) 목록으로 반환합니다."""
+        return [(name, deck) for name, deck in self._decks.items() if deck is not self._NOT_LOADED]
+
+def loaded_deck_items(decks):
+    """일반 dict와 LazyDecks 모두에서 메모리에 올라온 덱만 반환합니다."""
+    if isinstance(decks, LazyDecks):
+        return decks.loaded_items()
+    return list(decks.items())
+
+def apply_journal_record(entry, record):
+    """저널 기록 하나(한 모드의 복습 통계)를 단어에 적용합니다. 이미 WordRecord로 바뀐 단어면 ReviewStats로 넣습니다."""
+    if isinstance(entry, LazyRecord):
+        entry = entry.to_record()
+    if isinstance(entry, WordRecord):
+        entry.review_stats[record["mode"]] = ReviewStats.from_dict(record["stats"])
+    else:
+        entry.setdefault("review_stats", {})[record["mode"]] = record["stats"]
+
+class JsonBackend:
+    """
+    app_data.json 스냅샷과 저널 파일로 데이터를 저장하는 기본 저장소.
+    복습 결과는 저널에 한 줄씩 추가하고, 스냅샷을 쓸 때 저널을 비웁니다.
+    """
+    def __init__(self, data_file=DATA_FILE, journal_file=JOURNAL_FILE):
+        self.data_file = data_file
+        self.journal_file = journal_file
+        self._journal = None
+        self._journal_count = 0
+
+    def load(self):
+        """스냅샷을 읽고, 이전 실행에서 스냅샷에 합쳐지지 못한 저널을 재생합니다."""
+        app_data = self._read_snapshot()
+        if app_data is None:
+            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+            # 읽을 수 있는 스냅샷이 없으면 기본 구조로 새로 만듭니다.
+            app_data = default_app_data()
+            self.write_snapshot(self.encode(app_data))
+
+        replayed = self._replay_journal(app_data, self.journal_file + ".old")
+        replayed += self._replay_journal(app_data, self.journal_file)
+        self._open_journal()
+        self._journal_count = replayed
+        return app_data
+
+    def needs_compaction(self):
+        return self._journal_count >= COMPACT_THRESHOLD
+
+    def has_pending_changes(self):
+        return self._journal_count > 0
+
+    def deck_summary(self, deck_name):
+        """덱을 읽지 않고 알 수 있는 요약({"word_count": ...}). 이 저장소는 덱을 모두 읽어 두므로 없음."""
+        return None
+
+    def prepare_snapshot(self, app_data, dirty_decks=None):
+        """
+        저장할 스냅샷 내용을 만들고 저널을 교체합니다. (DataManager.lock 안에서 호출)
+        dirty_decks는 마지막 저장 이후 바뀐 덱 이름들이고, None이면 읽어 둔 덱이 모두 바뀐 것으로 봅니다.
+        스냅샷 쓰기가 끝나기 전에 종료되어도 .old 저널이 남아 다음 실행에서 재생됩니다.
+        """
+        data = self.encode(app_data, dirty_decks)
+        if self._journal is not None:
+            self._journal.close()
+            if self._journal_count:
+                os.replace(self.journal_file, self.journal_file + ".old")
+            self._open_journal()
+            self._journal_count = 0
+        return data
+
+    def encode(self, app_data, dirty_decks=None):
+        """app_data를 스냅샷 파일에 쓸 바이트로 바꿉니다. 파일 하나에 모두 쓰므로 dirty_decks는 쓰지 않습니다."""
+        return dumps_app_data(app_data).encode('utf-8')
+
+    def decode(self, path):
+        """스냅샷 파일을 읽어 app_data를 반환합니다. 깨진 파일이면 ValueError를 냅니다."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def write_snapshot(self, data):
+        # 임시 파일에 다 쓰고 디스크에 반영한 뒤 이름을 바꿔, 쓰는 도중 종료되어도 기존 파일이 깨지지 않게 함
+        temp_file = self.data_file + ".tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        rotate_generations(self.data_file)
+        os.replace(temp_file, self.data_file)
+        _fsync_dir(os.path.dirname(self.data_file))
+        # 스냅샷에 반영된 이전 저널은 더 이상 필요 없습니다.
+        if os.path.exists(self.journal_file + ".old"):
+            os.remove(self.journal_file + ".old")
+
+    def record_reviews(self, records):
+        """
+        (덱 이름, 단어, 학습 모드, 복습 통계) 목록을 저널에 한 줄씩 추가하고
+        한 번만 디스크에 반영합니다. 압축이 필요한지 반환합니다.
+        """
+        lines = [
+            json.dumps({"deck": deck_name, "word": word, "mode": mode, "stats": stats}, ensure_ascii=False) + "\n"
+            for deck_name, word, mode, stats in records
+        ]
+        self._journal.writelines(lines)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_count += len(lines)
+        return self.needs_compaction()
+
+    def close(self):
+        if self._journal:
+            self._journal.close()
+            self._journal = None
+
+    def _generation_file(self, n):
+        return f"{self.data_file}.{n}"
+
+    def _read_snapshot(self):
+        """
+        최신 스냅샷부터 차례로 읽어, 처음으로 제대로 읽히는 것을 반환합니다.
+        최신 스냅샷이 깨져 있으면 .corrupt로 옮겨 두고 이전 세대에서 복구합니다.
+        """
+        candidates = [self.data_file] + [self._generation_file(n) for n in range(1, SNAPSHOT_GENERATIONS + 1)]
+        for path in candidates:
+            if not os.path.exists(path):
+                continue
+            try:
+                app_data = self.decode(path)
+                if not isinstance(app_data, dict) or not isinstance(app_data.get("decks", {}), MutableMapping):
+                    raise ValueError("app_data 구조가 올바르지 않습니다.")
+            except (OSError, ValueError, KeyError, struct.error) as e: # JSONDecodeError, UnicodeDecodeError 포함
+                print(f"손상된 스냅샷을 건너뜁니다: {path} ({e})")
+                continue
+
+            if path != self.data_file:
+                print(f"최신 스냅샷을 읽을 수 없어 {path}에서 복구했습니다.")
+                if os.path.exists(self.data_file):
+                    # 깨진 파일이 다음 저장 때 세대 목록에 섞이지 않도록 따로 보관
+                    os.replace(self.data_file, self.data_file + ".corrupt")
+            return app_data
+
+        if os.path.exists(self.data_file):
+            os.replace(self.data_file, self.data_file + ".corrupt")
+        return None
+
+    def _open_journal(self):
+        self._journal = open(self.journal_file, 'a', encoding='utf-8')
+
+    def _replay_journal(self, app_data, path):
+        """저널 파일의 복습 기록을 app_data에 다시 적용하고, 적용한 개수를 반환합니다."""
+        if not os.path.exists(path):
+            return 0
+
+        decks = app_data.get("decks", {})
+        word_maps = {}
+        count = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 종료되어 잘린 마지막 줄은 건너뜁니다.
+                    continue
+
+                deck_name = record.get("deck")
+                if deck_name not in decks:
+                    continue
+                if deck_name not in word_maps:
+                    word_maps[deck_name] = {w["word"]: w for w in decks[deck_name].get("words", [])}
+
+                entry = word_maps[deck_name].get(record.get("word"))
+                if entry is not None:
+                    apply_journal_record(entry, record)
+                    count += 1
+        return count
 
 class DataManager:
     """
     앱의 모든 데이터(app_data.json)를 읽고, 쓰고, 관리하는
     유일한 클래스. 앱의 '데이터베이스' 역할을 합니다.
+
+    실제 파일 입출력은 저장소(ShardedBackend, JsonBackend, SqliteBackend 등)에 맡기고,
+    화면들은 지금처럼 app_data 딕셔너리를 통해 데이터에 접근합니다.
     """
-    def __init__(self):
+    def __init__(self, backend=None):
         self.app_data = {}
+        # app_data 구조(딕셔너리 키)를 바꾸는 코드는 이 락을 잡고 수정해야
+        # 백그라운드 압축과 충돌하지 않습니다.
+        self.lock = threading.RLock()
+        self._snapshot_lock = threading.Lock()
+        self._compact_thread = None
+        # 아직 저장소에 기록하지 않은 복습 결과: (덱 이름, 단어, 학습 모드) -> 단어 데이터
+        self._dirty_reviews = {}
+        # 마지막 저장 이후 단어, 복습 통계, 설정이 바뀐 덱 이름 (저장소는 이 덱만 다시 인코딩함)
+        self._dirty_decks = set()
+        self._flush_event = threading.Event()
+        self._writer_thread = None
+        self._writer_stopping = False
+        # 덱 이름 -> WordIndex (단어/ID로 항목을 바로 찾기 위한 인덱스)
+        self._word_indexes = {}
+        # (덱 이름, 학습 모드) -> DueIndex. 처음 조회할 때 만들어집니다.
+        self._due_indexes = {}
+        # (덱 이름, 학습 모드) -> DistractorPool. 단어가 바뀔 때만 다시 만듭니다.
+        self._distractor_pools = {}
+        # 덱 이름 -> SearchIndex. 단어 목록 화면에서 처음 검색할 때 만들어집니다.
+        self._search_indexes = {}
+        # 학습 세션과 답의 시간순 기록, 일/주/월 합계 (통계 화면용)
+        self.history = StudyHistory()
+        self.readings = ReadingCache(self.lock)
+        # 답 하나하나의 기록 (복습 주기 파라미터 최적화용, scheduler_optimizer.py)
+        self.review_events = ReviewEventLog()
+        self.backend = self._create_backend(backend or STORAGE_BACKEND)
         self.load_data()
 
+    def _create_backend(self, backend):
+        if backend == "json":
+            return JsonBackend()
+        if backend == "sharded":
+            from sharded_backend import ShardedBackend
+            return ShardedBackend()
+        if backend == "sqlite":
+            from sqlite_backend import SqliteBackend
+            return SqliteBackend()
+        if backend == "binary":
+            from binary_backend import BinaryBackend
+            return BinaryBackend()
+        if isinstance(backend, str):
+            raise ValueError(f"알 수 없는 저장소 종류입니다: {backend}")
+        return backend
+
+    @timed("load_data")
     def load_data(self):
-        """앱 시작 시 app_data.json 파일을 읽어와 데이터를 로드합니다."""
-        if not os.path.exists(DATA_FILE):
-            os.makedirs("data", exist_ok=True)
-            # 파일이 없으면 기본 구조로 새로 만듭니다.
-            default_data = {"decks": {}, "study_log": {}}
-            self.app_data = default_data
-            self.save_data()
-        else:
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                try:
-                    self.app_data = json.load(f)
-                except json.JSONDecodeError:
-                    self.app_data = {"decks": {}, "study_log": {}}
-                    self.save_data()
+        """앱 시작 시 저장소에서 데이터를 읽어옵니다."""
+        with self.lock:
+            self.app_data = self.backend.load()
+            self._clear_deck_caches()
+            self._dirty_decks.clear()
+        is_new_history = not self.history.exists()
+        self.history.load()
+        if is_new_history:
+            self._import_study_logs()
+        if os.path.exists(LEGACY_STUDY_LOG):
+            self._import_legacy_sessions()
+        if self.backend.needs_compaction():
+            self.compact_in_background()
 
+    def _import_study_logs(self):
+        """
+        이전 형식의 날짜별 학습 기록(덱의 study_log)을 학습 기록(StudyHistory)으로 옮기고 덱에서 지웁니다.
+        처음 한 번은 모든 덱을 읽어야 합니다.
+        """
+        with self.lock:
+            for deck_name, deck in self.app_data["decks"].items():
+                if "study_log" in deck:
+                    self._dirty_decks.add(deck_name)
+                for date, counts in sorted(deck.pop("study_log", {}).items()):
+                    self.history.import_daily(deck_name, date, counts)
+            # 전체 합계는 학습 기록이 계산함
+            self.app_data.pop("study_log", None)
+            self.app_data.pop("stats_summary", None)
+        self.history.save()
+        self.save_data()
+
+    def _import_legacy_sessions(self):
+        """
+        이전 형식의 전체 학습 기록(data/study_log.json)의 세션을 덱 없는 세션 기록으로 한 번만 옮기고,
+        다시 옮기지 않도록 파일 이름을 .migrated로 바꿉니다. (날짜별 단어/정답 수는 덱별 study_log에서 옮김)
+        """
+        try:
+            with open(LEGACY_STUDY_LOG, "r", encoding="utf-8") as f:
+                self.history.import_sessions(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"이전 학습 기록을 옮기지 못했습니다: {LEGACY_STUDY_LOG} ({e})")
+            return
+        self.history.save()
+        os.replace(LEGACY_STUDY_LOG, LEGACY_STUDY_LOG + ".migrated")
+
+    @timed("save_data")
     def save_data(self):
-        """현재 데이터를 app_data.json 파일에 저장합니다."""
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.app_data, f, ensure_ascii=False, indent=2)
+        """현재 데이터를 저장소에 저장합니다."""
+        with self._snapshot_lock:
+            with self.lock:
+                self._compact_word_indexes()
+                dirty_decks, self._dirty_decks = self._dirty_decks, set()
+                try:
+                    snapshot = self.backend.prepare_snapshot(self.app_data, dirty_decks)
+                except BaseException:
+                    self._dirty_decks |= dirty_decks
+                    raise
+                # 스냅샷에 이미 들어간 복습 결과는 따로 기록할 필요가 없음
+                self._dirty_reviews.clear()
+            try:
+                self.backend.write_snapshot(snapshot)
+            except BaseException:
+                # 쓰지 못한 덱은 다음 저장 때 다시 인코딩
+                with self.lock:
+                    self._dirty_decks |= dirty_decks
+                raise
+
+    def _mark_dirty(self, deck_name):
+        """덱의 단어, 복습 통계, 설정이 바뀌었음을 표시합니다. 다음 저장 때 이 덱을 다시 씁니다."""
+        with self.lock:
+            self._dirty_decks.add(deck_name)
+
+    def record_review(self, deck_name, word_entry, mode):
+        """
+        단어 하나의 복습 통계가 바뀌었음을 표시만 하고 바로 돌아옵니다.
+        실제 기록은 백그라운드 스레드가 모아서 합니다. (flush_reviews 참고)
+        """
+        with self.lock:
+            self._dirty_reviews[(deck_name, word_entry["word"], mode)] = word_entry
+            self._dirty_decks.add(deck_name)
+            index = self._due_indexes.get((deck_name, mode))
+            if index is not None:
+                index.update(word_entry)
+            pending = len(self._dirty_reviews)
+
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+        if pending >= FLUSH_EVERY:
+            self._flush_event.set()
+
+    def record_answer(self, deck_name, word_entry, mode, is_correct, latency_ms=0, subjective=False, now=None):
+        """답 하나를 복습 기록에 남기고 record_review()로 바뀐 통계를 표시합니다."""
+        now = word_entry.review_stats[mode].last_reviewed if now is None else now
+        self.review_events.append(deck_name, word_entry["id"], mode, now, is_correct, latency_ms, subjective)
+        self.history.record_answer(deck_name, word_entry["id"], mode, now, is_correct)
+        self._balance_load(deck_name, mode, word_entry.review_stats[mode], now)
+        self.record_review(deck_name, word_entry, mode)
+
+    def _balance_load(self, deck_name, mode, stats, now):
+        cap = self.get_deck_settings(deck_name).get("daily_cap")
+        if not cap or stats.next_review is None or stats.next_review - now < 86400:
+            return
+        index = self.get_due_index(deck_name, mode)
+        target = day_of(stats.next_review)
+        fuzz = max(1, int((stats.next_review - now) / 86400 * LOAD_BALANCE_FUZZ))
+        today = day_of(now)
+        candidates = [day for day in range(target - fuzz, target + fuzz + 1) if day > today]
+        # 상한 아래인 날 중 원래 날에 가장 가까운 날, 모두 찼으면 가장 한가한 날
+        def cost(day):
+            load = index.count_on_day(day)
+            return (load >= cap, load if load >= cap else 0, abs(day - target))
+        best = min(candidates, key=cost)
+        if best != target:
+            moved = day_start(best) - day_start(target)
+            stats.next_review += moved
+            if stats.interval is not None:
+                stats.interval += moved // 60
+
+    def get_forecast(self, deck_name, days=FORECAST_DAYS, mode=None, now=None):
+        """
+        오늘부터 days일 동안 날마다 복습할 단어 수 목록을 반환합니다. (mode가 없으면 두 학습 모드의 합)
+        단어를 훑지 않고 복습 인덱스의 날짜별 히스토그램만 읽습니다.
+        """
+        counts = [0] * days
+        for m in ([mode] if mode else MODES):
+            for i, count in enumerate(self.get_due_index(deck_name, m).forecast(days, now)):
+                counts[i] += count
+        return counts
+
+    def set_daily_cap(self, deck_name, cap):
+        """
+        덱의 하루 복습 상한을 정하고(None이면 해제) 이미 잡힌 복습을 상한에 맞게 나눕니다.
+        다음 날들로 옮긴 복습 수를 반환합니다.
+        """
+        with self.lock:
+            settings = self.app_data["decks"][deck_name].setdefault("settings", {})
+            self._dirty_decks.add(deck_name)
+            if cap:
+                settings["daily_cap"] = int(cap)
+            else:
+                settings.pop("daily_cap", None)
+        if cap:
+            return self.spread_due_load(deck_name)
+        self.save_data()
+        return 0
+
+    def spread_due_load(self, deck_name, now=None):
+        """
+        날마다 복습할 단어가 덱의 하루 상한(daily_cap)을 넘지 않도록, 넘치는 단어를 다음 날들의 시작 시각으로 미룹니다.
+        복습 시각이 이른 단어부터 자리를 주므로 밀린 단어와 CSV로 한꺼번에 등록한 새 단어가 며칠에 걸쳐 나뉩니다.
+        옮긴 단어 수를 반환합니다.
+        """
+        cap = self.get_deck_settings(deck_name).get("daily_cap")
+        if not cap:
+            return 0
+        today = day_of(time.time() if now is None else now)
+        moved = 0
+        with self.lock:
+            for mode in MODES:
+                index = self.get_due_index(deck_name, mode)
+                loads = {}
+                changes = []
+                for due_at, entry in index.next_due(len(index)):
+                    day = max(day_of(due_at), today)
+                    while loads.get(day, 0) >= cap:
+                        day += 1
+                    loads[day] = loads.get(day, 0) + 1
+                    if day > max(day_of(due_at), today):
+                        changes.append((entry, day_start(day)))
+                for entry, due_at in changes:
+                    stats = entry.review_stats[mode]
+                    if stats.interval is not None and stats.last_reviewed is not None:
+                        stats.interval = (due_at - stats.last_reviewed) // 60
+                    stats.next_review = due_at
+                    index.update(entry)
+                moved += len(changes)
+            if moved:
+                self._dirty_decks.add(deck_name)
+        self.save_data()
+        return moved
+
+    def flush_reviews(self, wait=False):
+        """모아 둔 복습 결과를 기록합니다. wait=True면 이 스레드에서 바로 기록합니다."""
+        if wait or self._writer_thread is None:
+            self._write_dirty_reviews()
+        else:
+            self._flush_event.set()
+
+    def _writer_loop(self):
+        while not self._writer_stopping:
+            self._flush_event.wait(FLUSH_INTERVAL)
+            self._flush_event.clear()
+            self._write_dirty_reviews()
+
+    def _write_dirty_reviews(self):
+        self.review_events.flush()
+        self.history.flush()
+        # 스냅샷 저장과 겹치지 않게 해서, 저널에 스냅샷보다 오래된 통계가 남지 않게 함
+        with self._snapshot_lock:
+            with self.lock:
+                records = [
+                    (deck_name, word, mode, dict(entry["review_stats"][mode]))
+                    for (deck_name, word, mode), entry in self._dirty_reviews.items()
+                ]
+                self._dirty_reviews.clear()
+            if not records:
+                return
+            should_compact = self.backend.record_reviews(records)
+        if should_compact:
+            self.compact_in_background()
+
+    def compact_in_background(self):
+        """저널을 스냅샷에 합치는 작업을 백그라운드 스레드에서 실행합니다."""
+        if self._compact_thread and self._compact_thread.is_alive():
+            return
+        self._compact_thread = threading.Thread(target=self.save_data, daemon=True)
+        self._compact_thread.start()
+
+    def close(self):
+        """앱 종료 시 진행 중인 압축을 기다리고 남은 변경사항을 저장합니다."""
+        if self._writer_thread is not None:
+            self._writer_stopping = True
+            self._flush_event.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+        self._write_dirty_reviews()
+        if self._compact_thread and self._compact_thread.is_alive():
+            self._compact_thread.join()
+        if self.backend.has_pending_changes():
+            self.save_data()
+        self.history.save()
+        with self.lock:
+            self.backend.close()
+
+    def export_json(self, path):
+        """모든 덱을 불러와 기존 app_data.json 형식으로 내보냅니다. 학습 기록은 덱별 study_log로 넣습니다. (백업용)"""
+        with self.lock:
+            self._compact_word_indexes()
+            data = dict(self.app_data)
+            study_logs = self.history.to_study_logs()
+            data["decks"] = {name: {**deck, "study_log": study_logs.get(name, {})}
+                             for name, deck in self.app_data.get("decks", {}).items()}
+            text = dumps_app_data(data)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def import_json(self, path):
+        """app_data.json 형식의 파일로 현재 데이터를 모두 교체합니다. (복원용)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        with self.lock:
+            decks = self.app_data.setdefault("decks", {})
+            for deck_name in list(decks.keys()):
+                del decks[deck_name]
+            for deck_name, deck in data.get("decks", {}).items():
+                decks[deck_name] = deck
+                self._dirty_decks.add(deck_name)
+            for key, value in data.items():
+                if key != "decks":
+                    self.app_data[key] = value
+            self._clear_deck_caches()
+            # 학습 기록은 가져온 덱들의 study_log로 새로 만듦
+            self.history.clear()
+        self._import_study_logs()
 
     def get_deck_names(self):
         """모든 덱의 이름 목록을 반환합니다."""
         return list(self.app_data.get("decks", {}).keys())
 
+    def get_word_counts(self):
+        """
+        덱 이름 -> 단어 수. 아직 읽지 않은 덱은 저장소의 요약(매니페스트)에서 가져오므로
+        덱 목록 화면을 그릴 때 덱 파일을 읽지 않습니다.
+        """
+        decks = self.app_data.get("decks", {})
+        counts = {}
+        for deck_name in decks:
+            if isinstance(decks, LazyDecks) and not decks.is_loaded(deck_name):
+                summary = self.backend.deck_summary(deck_name)
+                if summary is not None:
+                    counts[deck_name] = summary["word_count"]
+                    continue
+            index = self._word_indexes.get(deck_name)
+            counts[deck_name] = len(index) if index is not None else len(decks[deck_name].get("words", []))
+        return counts
+
     def add_deck(self, deck_name):
         """새로운 덱을 추가합니다."""
         if deck_name not in self.app_data["decks"]:
-            self.app_data["decks"][deck_name] = {"settings": {}, "words": [], "study_log": {}}
+            with self.lock:
+                self.app_data["decks"][deck_name] = {"settings": {}, "words": []}
+                self._dirty_decks.add(deck_name)
             self.save_data()
             return True
         return False
@@ -48,29 +673,259 @@ class DataManager:
     def delete_deck(self, deck_name):
         """기존 덱을 삭제합니다."""
         if deck_name in self.app_data["decks"]:
-            del self.app_data["decks"][deck_name]
+            with self.lock:
+                self.history.remove_deck(deck_name)
+                del self.app_data["decks"][deck_name]
+                self._dirty_decks.discard(deck_name)
+                self._word_indexes.pop(deck_name, None)
+                self.review_events.delete(deck_name)
+            self.notify_words_changed(deck_name)
             self.save_data()
 
     def update_deck_settings(self, deck_name, native_lang, study_lang):
         """덱의 언어 설정을 업데이트합니다."""
         if deck_name in self.app_data["decks"]:
             settings = self.app_data["decks"][deck_name]["settings"]
-            settings["native_lang"] = native_lang
-            settings["study_lang"] = study_lang
+            with self.lock:
+                settings["native_lang"] = native_lang
+                settings["study_lang"] = study_lang
+                self._dirty_decks.add(deck_name)
             self.save_data()
 
     def get_deck_settings(self, deck_name):
         """특정 덱의 언어 설정을 반환합니다."""
         return self.app_data["decks"].get(deck_name, {}).get("settings", {})
 
+    def get_scheduler(self, deck_name):
+        """덱 설정("scheduler", "scheduler_params")에 맞는 복습 주기 계산기를 반환합니다."""
+        settings = self.get_deck_settings(deck_name)
+        return create_scheduler(settings.get("scheduler", DEFAULT_SCHEDULER), settings.get("scheduler_params"))
+
+    def set_deck_scheduler(self, deck_name, name, params=None):
+        """
+        덱의 복습 주기 계산기와 파라미터를 바꾸고, 이미 복습한 단어들의 다음 복습 시각을 새 기준으로 다시 계산합니다.
+        같은 계산기의 파라미터만 바꾸면 단어별 상태는 그대로 두고 간격만 다시 계산합니다.
+        """
+        scheduler = create_scheduler(name, params) # 잘못된 이름/파라미터면 여기서 ValueError
+        with self.lock:
+            settings = self.app_data["decks"][deck_name].setdefault("settings", {})
+            self._dirty_decks.add(deck_name)
+            keep_state = settings.get("scheduler", DEFAULT_SCHEDULER) == scheduler.name
+            settings["scheduler"] = scheduler.name
+            if params:
+                settings["scheduler_params"] = dict(params)
+            else:
+                settings.pop("scheduler_params", None)
+            stats_list = [stats for entry in self.iter_words(deck_name) for stats in entry.review_stats.values()]
+            count = scheduler.reschedule(stats_list, keep_state)
+            for key in [k for k in self._due_indexes if k[0] == deck_name]:
+                del self._due_indexes[key]
+        self.save_data()
+        return count
+
     def get_words_for_deck(self, deck_name):
         """특정 덱의 모든 단어 목록을 반환합니다."""
-        return self.app_data["decks"].get(deck_name, {}).get("words", [])
+        if deck_name not in self.app_data["decks"]:
+            return []
+        with self.lock:
+            index = self._get_word_index(deck_name)
+            index.compact() # 삭제 표시만 된 자리를 정리한 뒤 반환
+            return index.records()
+
+    # --- 단어 단위 API (단어 → 항목 인덱스를 통해 O(1)로 조회/추가/삭제) ---
+    def _get_word_index(self, deck_name):
+        with self.lock:
+            index = self._word_indexes.get(deck_name)
+            if index is None:
+                index = WordIndex(self.app_data["decks"][deck_name])
+                self._word_indexes[deck_name] = index
+                if index.assigned_ids:
+                    self._dirty_decks.add(deck_name)
+            return index
+
+    def _compact_word_indexes(self):
+        for index in self._word_indexes.values():
+            index.compact()
+
+    def iter_words(self, deck_name):
+        """덱의 단어 항목을 순서대로 돌려줍니다. (삭제 표시된 자리는 건너뜀)"""
+        if deck_name not in self.app_data["decks"]:
+            return iter(())
+        return iter(self._get_word_index(deck_name))
+
+    def count_words(self, deck_name):
+        """덱에 등록된 단어 수를 반환합니다."""
+        return len(self._get_word_index(deck_name))
+
+    def get_word(self, deck_name, word):
+        """단어로 항목을 찾습니다. 없으면 None."""
+        return self._get_word_index(deck_name).get(word)
+
+    def get_word_by_id(self, deck_name, word_id):
+        """단어 ID로 항목을 찾습니다. 없으면 None."""
+        return self._get_word_index(deck_name).get_by_id(word_id)
+
+    def upsert_word(self, deck_name, word, meanings, example="", now=None):
+        """
+        새 단어는 추가하고, 이미 있는 단어에는 새로운 뜻만 덧붙입니다.
+        (결과, 항목, 추가된 뜻 목록)을 반환하며 결과는 "added", "updated", "duplicate" 중 하나입니다.
+        저장은 하지 않으므로 필요한 만큼 호출한 뒤 save_data()를 부르세요.
+        """
+        with self.lock:
+            index = self._get_word_index(deck_name)
+            entry = index.get(word)
+            if entry is None:
+                entry = index.add(make_word_entry(word, meanings, example, now))
+                status, added_meanings = "added", list(meanings)
+                self._update_due_indexes(deck_name, entry)
+                self._dirty_decks.add(deck_name)
+            else:
+                added_meanings = [m for m in dict.fromkeys(meanings) if m not in entry.get("meaning", [])]
+                entry.setdefault("meaning", []).extend(added_meanings)
+                status = "updated" if added_meanings else "duplicate"
+
+            if status != "duplicate":
+                self._dirty_decks.add(deck_name)
+                self._update_search_index(deck_name, entry)
+                self._drop_distractor_pools(deck_name)
+        return status, entry, added_meanings
+
+    def update_word(self, deck_name, word, meanings=None, example=None):
+        """단어의 뜻이나 예문을 수정합니다. 수정한 항목을 반환합니다."""
+        with self.lock:
+            entry = self._get_word_index(deck_name).get(word)
+            if entry is None:
+                return None
+            if meanings is not None:
+                entry["meaning"] = meanings
+            if example is not None:
+                entry["example"] = example
+            self._dirty_decks.add(deck_name)
+            self._update_search_index(deck_name, entry)
+            self._drop_distractor_pools(deck_name)
+        return entry
+
+    def delete_word(self, deck_name, word):
+        """단어를 삭제합니다. 목록 정리는 다음 저장 때 한 번에 합니다."""
+        with self.lock:
+            entry = self._get_word_index(deck_name).delete(word)
+            if entry is not None:
+                self._dirty_decks.add(deck_name)
+                self._update_due_indexes(deck_name, entry, removed=True)
+                self._update_search_index(deck_name, entry, removed=True)
+                self._drop_distractor_pools(deck_name)
+        return entry is not None
+
+    def _update_due_indexes(self, deck_name, entry, removed=False):
+        # 이미 만들어 둔 복습 인덱스는 다시 만들지 않고 해당 단어만 반영
+        for (name, _), index in self._due_indexes.items():
+            if name != deck_name:
+                continue
+            if removed:
+                index.remove(entry["word"])
+            else:
+                index.update(entry)
+
+    def _update_search_index(self, deck_name, entry, removed=False):
+        index = self._search_indexes.get(deck_name)
+        if index is None:
+            return
+        if removed:
+            index.remove(entry)
+        else:
+            index.update(entry)
+
+    def _drop_distractor_pools(self, deck_name):
+        for key in [k for k in self._distractor_pools if k[0] == deck_name]:
+            del self._distractor_pools[key]
+
+    def notify_words_changed(self, deck_name):
+        """덱의 단어가 추가/수정/삭제되었을 때 호출해 덱별 캐시를 비웁니다."""
+        with self.lock:
+            for cache in (self._due_indexes, self._distractor_pools):
+                for key in [k for k in cache if k[0] == deck_name]:
+                    del cache[key]
+            self._search_indexes.pop(deck_name, None)
+
+    def _clear_deck_caches(self):
+        self._word_indexes.clear()
+        self._due_indexes.clear()
+        self._distractor_pools.clear()
+        self._search_indexes.clear()
+
+    def get_due_index(self, deck_name, mode):
+        """덱과 학습 모드에 대한 복습 시각 인덱스를 반환합니다. (없으면 한 번 만듦)"""
+        with self.lock:
+            index = self._due_indexes.get((deck_name, mode))
+            if index is None:
+                index = DueIndex(self.iter_words(deck_name), mode)
+                self._due_indexes[(deck_name, mode)] = index
+            return index
+
+    def get_due_words(self, deck_name, mode, now=None):
+        """지금(now, epoch 초) 복습할 단어 목록을 반환합니다."""
+        return self.get_due_index(deck_name, mode).due_words(now)
+
+    def count_due(self, deck_name, mode, now=None):
+        """지금(now, epoch 초) 복습할 단어 수를 반환합니다."""
+        return self.get_due_index(deck_name, mode).count_due(now)
+
+    def get_next_due(self, deck_name, mode, n):
+        """복습 시각이 가장 이른 n개의 (epoch 시각, 단어 데이터) 목록을 반환합니다."""
+        return self.get_due_index(deck_name, mode).next_due(n)
+
+    def get_search_index(self, deck_name):
+        """덱의 단어/뜻 검색 색인을 반환합니다. (없으면 한 번 만듦)"""
+        with self.lock:
+            index = self._search_indexes.get(deck_name)
+            if index is None:
+                index = SearchIndex(self.iter_words(deck_name))
+                self._search_indexes[deck_name] = index
+            return index
+
+    def get_distractor_pool(self, deck_name, mode):
+        """덱과 학습 모드에 대한 객관식 오답 보기 후보를 반환합니다. (없으면 한 번 만듦)"""
+        with self.lock:
+            pool = self._distractor_pools.get((deck_name, mode))
+            if pool is None:
+                pool = DistractorPool(list(self.iter_words(deck_name)), mode)
+                self._distractor_pools[(deck_name, mode)] = pool
+            return pool
+
+    def record_study_session(self, deck_name, mode, started_at, correct, incorrect, now=None):
+        """
+        학습 세션 하나(시작~끝 시각)를 학습 기록에 남기고 합계를 저장합니다.
+        답마다의 정답/오답과 오늘 학습한 단어는 record_answer()에서 이미 기록되었습니다.
+        """
+        self.history.record_session(deck_name, mode, started_at, time.time() if now is None else now,
+                                    correct, incorrect)
+        self.history.save()
+
+    def update_readings(self, deck_name, entries):
+        """일본어 덱이면 단어(또는 뜻)의 히라가나 읽기를 미리 변환해 덱에 저장합니다."""
+        texts = japanese_texts(self.get_deck_settings(deck_name), entries)
+        if not texts:
+            return 0
+        filled = self.readings.fill(self.app_data["decks"][deck_name], texts)
+        if filled:
+            self._mark_dirty(deck_name)
+        return filled
+
+    def get_reading(self, deck_name, text, convert=False):
+        """저장된 히라가나 읽기를 반환합니다. convert=True면 없을 때 변환해서 저장합니다."""
+        deck_data = self.app_data["decks"].get(deck_name)
+        if deck_data is None:
+            return None
+        if convert:
+            if self.readings.get(deck_data, text) is None:
+                self._mark_dirty(deck_name) # 변환한 읽기를 덱에 저장함
+            return self.readings.get_or_convert(deck_data, text)
+        return self.readings.get(deck_data, text)
 
     def get_study_log_for_deck(self, deck_name):
-        """특정 덱의 학습 기록을 반환합니다."""
-        return self.app_data["decks"].get(deck_name, {}).get("study_log", {})
-    
+        """특정 덱의 날짜별 학습 합계를 반환합니다."""
+        return self.history.daily_log(deck_name)
+
     def get_all_decks_data(self):
         """모든 덱의 데이터를 반환합니다."""
         return self.app_data.get("decks", {})
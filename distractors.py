@@ -0,0 +1,58 @@
+import random
+
+from instrumentation import timed
+
+# 후보가 적어 거절 샘플링이 계속 실패하면 전체 목록을 걸러서 고릅니다.
+MAX_ATTEMPTS_PER_CHOICE = 8
+
+def similarity_key(text):
+    """첫 글자와 길이대가 같은 보기끼리 '헷갈리는 보기' 묶음으로 취급합니다."""
+    text = text.strip().lower()
+    return (text[:1], len(text) // 3)
+
+class DistractorPool:
+    """
+    덱 하나, 학습 모드 하나에 대한 객관식 오답 보기 후보 목록.
+    한 번 만들어 두면 단어가 바뀌기 전까지 문제마다 다시 만들 필요가 없습니다.
+    """
+    def __init__(self, words, mode):
+        if mode == 'study_to_native':
+            candidates = (m for w in words for m in w.get('meaning', []))
+        else:
+            candidates = (w['word'] for w in words)
+        # 순서를 유지한 중복 제거
+        self.values = list(dict.fromkeys(candidates))
+        self._buckets = {}
+        for value in self.values:
+            self._buckets.setdefault(similarity_key(value), []).append(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    @timed("distractors")
+    def sample(self, correct_answers, k=3, hard_for=None):
+        """
+        정답(correct_answers)을 제외한 보기를 최대 k개 고릅니다.
+        hard_for가 주어지면 그 답과 비슷한 보기를 먼저 고릅니다.
+        """
+        excluded = set(correct_answers)
+        picked = []
+        if hard_for:
+            self._rejection_sample(self._buckets.get(similarity_key(hard_for), []), excluded, picked, k)
+        self._rejection_sample(self.values, excluded, picked, k)
+
+        if len(picked) < k:
+            # 후보가 거의 정답뿐인 작은 덱: 남은 후보를 전부 걸러서 채움
+            rest = [v for v in self.values if v not in excluded and v not in picked]
+            picked.extend(random.sample(rest, min(len(rest), k - len(picked))))
+        return picked
+
+    def _rejection_sample(self, values, excluded, picked, k):
+        if not values:
+            return
+        attempts = MAX_ATTEMPTS_PER_CHOICE * k
+        while len(picked) < k and attempts > 0:
+            attempts -= 1
+            value = random.choice(values)
+            if value not in excluded and value not in picked:
+                picked.append(value)
@@ -0,0 +1,129 @@
+import bisect
+import itertools
+import time
+from collections import Counter
+from datetime import date, datetime
+from functools import lru_cache
+
+from models import ReviewStats, to_epoch
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+@lru_cache(maxsize=65536)
+def _utc_offset(block):
+    # 현지 시각과 UTC의 차이(초). 서머타임 전환은 15분 단위 시각에만 일어나므로 15분 구간마다 한 번만 구함
+    return time.localtime(block * 900).tm_gmtoff
+
+def day_of(epoch):
+    """epoch 초가 속한 날(현지 날짜의 ordinal)"""
+    epoch = int(epoch)
+    return (epoch + _utc_offset(epoch // 900)) // 86400 + EPOCH_ORDINAL
+
+def day_start(day):
+    """날(ordinal)이 시작되는 시각(epoch 초)"""
+    moment = date.fromordinal(day)
+    return int(datetime(moment.year, moment.month, moment.day).timestamp())
+
+class DueIndex:
+    """
+    한 덱의 한 학습 모드에 대해, 단어들을 다음 복습 시각(epoch) 순으로 정렬해 둔 인덱스.
+    (시각, 순번) 튜플의 정렬된 리스트를 이진 탐색하므로
+    '지금 복습할 단어 수'는 O(log N), 앞에서 n개는 O(log N + n)에 구합니다.
+    단어 하나의 위치를 고치는 것(update/remove)은 이진 탐색 뒤 리스트 삽입/삭제이므로 O(N)의 메모리 이동입니다.
+    날짜별 단어 수 히스토그램은 처음 예측할 때 한 번 만들고 이후로는 단어가 바뀔 때마다 고치므로
+    앞으로 며칠의 복습량 예측은 O(일 수)입니다.
+    """
+    def __init__(self, words, mode):
+        self.mode = mode
+        self._seq = itertools.count()
+        self._keys = {}      # 단어 -> (다음 복습 시각, 순번)
+        self._entries = {}   # 순번 -> 단어 데이터
+        self._days = None    # 날(ordinal) -> 그날 복습할 단어 수 (처음 예측할 때 만듦)
+        order = []
+        for entry in words:
+            key = self._make_key(entry)
+            if key is not None:
+                order.append(key)
+        order.sort()
+        self._order = order
+
+    def __len__(self):
+        return len(self._order)
+
+    def _make_key(self, entry):
+        stats = entry.get("review_stats", {}).get(self.mode)
+        if isinstance(stats, ReviewStats):
+            due_at = stats.next_review # 이미 epoch 정수
+        else:
+            due_at = to_epoch((stats or {}).get("next_review") or None)
+        if due_at is None:
+            return None
+        key = (due_at, next(self._seq))
+        self._keys[entry["word"]] = key
+        self._entries[key[1]] = entry
+        if self._days is not None:
+            self._days[day_of(due_at)] += 1
+        return key
+
+    def update(self, entry):
+        """단어의 다음 복습 시각이 바뀌었을 때 위치만 다시 잡습니다."""
+        self.remove(entry["word"])
+        key = self._make_key(entry)
+        if key is not None:
+            bisect.insort(self._order, key)
+
+    def remove(self, word):
+        key = self._keys.pop(word, None)
+        if key is None:
+            return
+        del self._entries[key[1]]
+        if self._days is not None:
+            day = day_of(key[0])
+            self._days[day] -= 1
+            if not self._days[day]:
+                del self._days[day]
+        pos = bisect.bisect_left(self._order, key)
+        if pos < len(self._order) and self._order[pos] == key:
+            del self._order[pos]
+
+    def count_due(self, now=None):
+        """now(epoch 초, 기본값은 현재 시각)까지 복습 시각이 된 단어 수를 반환합니다."""
+        if now is None:
+            now = time.time()
+        # (now + 1,)은 시각이 now 이하인 모든 (시각, 순번) 튜플보다 큽니다.
+        return bisect.bisect_left(self._order, (int(now) + 1,))
+
+    def due_words(self, now=None):
+        """지금 복습할 단어 목록을 복습 시각이 이른 순서로 반환합니다."""
+        return [self._entries[seq] for _, seq in self._order[:self.count_due(now)]]
+
+    def next_due(self, n):
+        """복습 시각이 가장 이른 n개의 (epoch 시각, 단어 데이터) 목록을 반환합니다."""
+        return [(due_at, self._entries[seq]) for due_at, seq in self._order[:n]]
+
+    def _day_counts(self):
+        if self._days is None:
+            # 15분 구간별로 먼저 세고 구간마다 한 번만 날짜로 바꿈
+            blocks = Counter(due_at // 900 for due_at, _ in self._order)
+            days = Counter()
+            for block, count in blocks.items():
+                days[day_of(block * 900)] += count
+            self._days = days
+        return self._days
+
+    def count_on_day(self, day):
+        """날(ordinal)에 복습할 단어 수"""
+        return self._day_counts().get(day, 0)
+
+    def forecast(self, days, now=None):
+        """
+        오늘부터 days일 동안 날마다 복습할 단어 수 목록을 반환합니다.
+        오늘 값에는 이미 밀린(복습 시각이 지난) 단어도 들어갑니다.
+        """
+        if now is None:
+            now = time.time()
+        today = day_of(now)
+        counts = [self.count_due(day_start(today + 1) - 1)]
+        day_counts = self._day_counts()
+        counts.extend(day_counts.get(today + i, 0) for i in range(1, days))
+        return counts[:days]
@@ -0,0 +1,119 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# 작업마다 최근 WINDOW번의 소요 시간으로 p50/p95/p99를 계산합니다.
+WINDOW = 1000
+# 앱을 시작할 때부터 측정하려면 환경 변수 VOCA_METRICS=1 (설정 화면에서도 켜고 끌 수 있음)
+ENV_VAR = "VOCA_METRICS"
+
+_enabled = os.environ.get(ENV_VAR) == "1"
+_lock = threading.Lock()
+_timings = {} # 작업 이름 -> _Timing
+_counters = {} # 이름 -> 횟수
+
+class _Timing:
+    __slots__ = ("count", "total", "max", "recent")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=WINDOW)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+def is_enabled():
+    return _enabled
+
+def set_enabled(enabled):
+    """측정을 켜거나 끕니다. 꺼져 있으면 timed/timer/count는 플래그 확인 한 번만 합니다."""
+    global _enabled
+    _enabled = bool(enabled)
+
+def reset():
+    with _lock:
+        _timings.clear()
+        _counters.clear()
+
+def record(name, seconds):
+    """작업 name이 seconds초 걸렸음을 기록합니다."""
+    with _lock:
+        timing = _timings.get(name)
+        if timing is None:
+            timing = _timings[name] = _Timing()
+        timing.add(seconds)
+
+def count(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+def timed(name):
+    """함수 실행 시간을 name으로 기록하는 데코레이터."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+@contextmanager
+def timer(name):
+    """with 블록의 실행 시간을 name으로 기록합니다."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+def _percentile(sorted_values, fraction):
+    # nearest-rank 방식
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def snapshot():
+    """
+    지금까지의 측정 결과를 딕셔너리로 반환합니다. 시간은 밀리초입니다.
+    {"timings": {이름: {count, total_ms, mean_ms, max_ms, p50_ms, p95_ms, p99_ms}}, "counters": {이름: 횟수}}
+    """
+    with _lock:
+        items = [(name, t.count, t.total, t.max, sorted(t.recent)) for name, t in _timings.items()]
+        counters = dict(_counters)
+    timings = {}
+    for name, n, total, longest, recent in sorted(items):
+        timings[name] = {
+            "count": n,
+            "total_ms": total * 1000,
+            "mean_ms": total / n * 1000,
+            "max_ms": longest * 1000,
+            "p50_ms": _percentile(recent, 0.50) * 1000,
+            "p95_ms": _percentile(recent, 0.95) * 1000,
+            "p99_ms": _percentile(recent, 0.99) * 1000,
+        }
+    return {"enabled": _enabled, "window": WINDOW, "timings": timings, "counters": counters}
+
+def export_json(path):
+    """측정 결과를 JSON 파일로 저장합니다. (오프라인 분석용)"""
+    data = snapshot()
+    data["exported_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
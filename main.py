@@ -1,9 +1,16 @@
-import sys, json, os, pyttsx3, pykakasi
+import time
+_PROCESS_START = time.perf_counter() # 시작 시간 측정용 (다른 import보다 먼저)
+
+import sys, json, os, signal, threading
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QStackedWidget, QWidget, 
                              QVBoxLayout, QHBoxLayout, QPushButton, QMessageBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
 from data_manager import DataManager
+from models import MODES
+from instrumentation import timed
+from profiler import Profiler
+from tts_worker import TTSWorker
 from ui.deck_selection_screen import DeckSelectionScreen
 from ui.language_setup_screen import LanguageSetupScreen
 from ui.home_screen import HomeScreen
@@ -27,16 +34,55 @@ LANGUAGE_MAP = {
     "Русский": "ru", 
 }
 
+class StartupTimer:
+    """앱 시작 단계별 소요 시간을 기록해 두었다가 보고서로 출력합니다."""
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self.last = self.start
+        self.marks = []
+        self._lock = threading.Lock()
+
+    def mark(self, name, echo=False):
+        """직전 기록 이후 걸린 시간을 name으로 기록합니다. echo=True면 바로 출력합니다."""
+        with self._lock:
+            now = time.perf_counter()
+            self.marks.append((name, (now - self.last) * 1000, (now - self.start) * 1000))
+            self.last = now
+        if echo:
+            print(self._format(self.marks[-1]))
+
+    def _format(self, mark):
+        name, step_ms, total_ms = mark
+        return f"  {name:<28}{step_ms:8.1f} ms  (누적 {total_ms:8.1f} ms)"
+
+    def report(self):
+        with self._lock:
+            lines = ["--- [Startup Timing] ---"]
+            lines += [self._format(mark) for mark in self.marks]
+            lines.append("------------------------")
+        print("\n".join(lines))
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # 화면은 처음 이동할 때 만들어짐 (시작 시에는 덱 선택 화면만 생성)
+    language_setup_screen = property(lambda self: self._screen("language_setup_screen"))
+    home_screen = property(lambda self: self._screen("home_screen"))
+    stats_screen = property(lambda self: self._screen("stats_screen"))
+    register_manual_screen = property(lambda self: self._screen("register_manual_screen"))
+    register_csv_screen = property(lambda self: self._screen("register_csv_screen"))
+    word_list_screen = property(lambda self: self._screen("word_list_screen"))
+    study_mode_select_screen = property(lambda self: self._screen("study_mode_select_screen"))
+    study_screen = property(lambda self: self._screen("study_screen"))
+    settings_screen = property(lambda self: self._screen("settings_screen"))
+
+    def __init__(self, startup_timer=None):
         super().__init__()
+        self.startup_timer = startup_timer or StartupTimer()
         self.setWindowTitle("My Voca App")
         self.setGeometry(100, 100, 400, 600)
-        self.kks = pykakasi.kakasi()
-        try: self.voice_map = self.map_available_voices() 
-        except Exception as e:
-            print(f"TTS engine initailization failed: {e}")
-            self.tts_engine = None
+        # 음성 합성/재생은 전용 스레드에서 처리 (음성 목록 조회도 스레드 시작 후 진행)
+        self.tts_worker = TTSWorker()
+        # 설정 화면에서 켜는 프로파일링 모드 (data/profiles/에 결과 저장)
+        self.profiler = Profiler()
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -55,52 +101,117 @@ class MainWindow(QMainWindow):
         nav_bar.addWidget(btn_settings)
         
         main_layout.addLayout(nav_bar)
+        self.startup_timer.mark("main window")
         self.data_manager = DataManager()
         self.current_deck = None
+        self._install_flush_handlers()
+        self.startup_timer.mark("data load")
 
         # --- 화면 인스턴스 생성 ---
+        self._screens = {}
+        self._screen_factories = {
+            "language_setup_screen": self._create_language_setup_screen,
+            "home_screen": self._create_home_screen,
+            "stats_screen": lambda: StatsScreen(self),
+            "register_manual_screen": lambda: RegisterManualScreen(self),
+            "register_csv_screen": lambda: RegisterCSVScreen(self),
+            "word_list_screen": lambda: WordListScreen(self),
+            "study_mode_select_screen": self._create_study_mode_select_screen,
+            "study_screen": lambda: StudyScreen(self),
+            "settings_screen": lambda: SettingsScreen(self),
+        }
         self.deck_selection_screen = DeckSelectionScreen()
-        self.language_setup_screen = LanguageSetupScreen()
-        self.stats_screen = StatsScreen(self)
-        self.register_manual_screen = RegisterManualScreen(self)
-        self.register_csv_screen = RegisterCSVScreen(self)
-        self.word_list_screen = WordListScreen(self)
-        self.study_mode_select_screen = StudyModeSelectScreen(self) 
-        self.study_screen = StudyScreen(self)
-        self.settings_screen = SettingsScreen(self) 
-        self.home_screen = HomeScreen(
-            switch_to_register_callback=self.open_manual_register,
-            switch_to_csv_callback=self.open_csv_register,
-            switch_to_wordlist_callback=self.open_word_list,
-            switch_to_study_mode_callback=self.open_study_mode_select,
-            switch_to_deck_stats_callback=self.open_deck_stats
-        )
-
-        # --- 화면 스택에 추가 ---
         self.stack.addWidget(self.deck_selection_screen)
-        self.stack.addWidget(self.language_setup_screen)
-        self.stack.addWidget(self.home_screen)
-        self.stack.addWidget(self.stats_screen)
-        self.stack.addWidget(self.register_manual_screen)
-        self.stack.addWidget(self.register_csv_screen)
-        self.stack.addWidget(self.word_list_screen)
-        self.stack.addWidget(self.study_mode_select_screen) 
-        self.stack.addWidget(self.study_screen)
-        self.stack.addWidget(self.settings_screen)
 
         # --- 시그널 연결 ---
-        # ... (이전 시그널 연결)
         self.deck_selection_screen.deck_selected.connect(self.handle_deck_selection)
         self.deck_selection_screen.deck_deleted.connect(self.handle_deck_deletion)
-        self.language_setup_screen.setup_complete.connect(self.handle_setup_complete)
-        self.study_mode_select_screen.mode_selected.connect(self.start_study) # [추가]
         
         btn_home.clicked.connect(self.go_to_first_screen)
         btn_stats.clicked.connect(self.go_to_stats_screen)
         btn_settings.clicked.connect(self.go_to_settings_screen)
 
         self.go_to_first_screen()
+        self.startup_timer.mark("first screen")
         self.show()
+        # 첫 화면이 그려진 뒤에 TTS와 일본어 변환기를 백그라운드에서 준비
+        QTimer.singleShot(0, self._start_background_services)
+
+    def _screen(self, name):
+        """화면을 처음 요청할 때 만들어 스택에 추가합니다."""
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._screen_factories[name]()
+            self.stack.addWidget(screen)
+            self._screens[name] = screen
+        return screen
+
+    def _create_language_setup_screen(self):
+        screen = LanguageSetupScreen()
+        screen.setup_complete.connect(self.handle_setup_complete)
+        return screen
+
+    def _create_home_screen(self):
+        return HomeScreen(
+            switch_to_register_callback=self.open_manual_register,
+            switch_to_csv_callback=self.open_csv_register,
+            switch_to_wordlist_callback=self.open_word_list,
+            switch_to_study_mode_callback=self.open_study_mode_select,
+            switch_to_deck_stats_callback=self.open_deck_stats,
+            set_daily_cap_callback=self.change_daily_cap
+        )
+
+    def _create_study_mode_select_screen(self):
+        screen = StudyModeSelectScreen(self)
+        screen.mode_selected.connect(self.start_study)
+        return screen
+
+    def _start_background_services(self):
+        self.startup_timer.mark("first paint")
+        self.startup_timer.report()
+        self.tts_worker.ready_callback = lambda: self.startup_timer.mark("tts ready (background)", echo=True)
+        self.tts_worker.start()
+        threading.Thread(target=self._warm_up_readings, daemon=True).start()
+
+    def _warm_up_readings(self):
+        self.data_manager.readings.warm_up()
+        self.startup_timer.mark("kakasi ready (background)", echo=True)
+
+    def _install_flush_handlers(self):
+        # 예외로 죽거나 종료 시그널을 받아도 모아 둔 복습 결과는 기록하고 끝냄
+        previous_hook = sys.excepthook
+
+        def excepthook(exc_type, exc, tb):
+            # PyQt5는 기본 excepthook이면 처리되지 않은 예외에서 프로그램을 중단하므로, 기록한 뒤 이벤트 루프를 끝냄
+            try:
+                self.data_manager.flush_reviews(wait=True)
+            finally:
+                previous_hook(exc_type, exc, tb)
+                sys.stderr.flush()
+                QApplication.exit(1)
+
+        def on_signal(signum, frame):
+            self.data_manager.flush_reviews(wait=True)
+            self.close()
+
+        sys.excepthook = excepthook
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, on_signal)
+        # 파이썬 시그널 처리기는 Qt 이벤트 루프가 쉬는 동안에는 돌지 않으므로, 200ms마다 파이썬 코드로 돌아오게 함
+        self._signal_timer = QTimer(self)
+        self._signal_timer.timeout.connect(lambda: None)
+        self._signal_timer.start(200)
+
+    def closeEvent(self, event):
+        # 종료 전에 모아 둔 복습 결과를 기록하고, 저널에 쌓인 기록을 스냅샷에 합침
+        self.tts_worker.shutdown()
+        self.profiler.stop()
+        # 문제를 미리 만드는 스레드가 데이터를 읽는 중이면 끝난 뒤에 저장 (학습 화면을 연 적이 있을 때만)
+        study_screen = self._screens.get("study_screen")
+        if study_screen is not None:
+            study_screen.prefetcher.close()
+        self.data_manager.close()
+        super().closeEvent(event)
 
     # --- 화면 열기 함수들 ---
     def open_manual_register(self): 
@@ -121,10 +232,12 @@ class MainWindow(QMainWindow):
         self.stack.setCurrentWidget(self.study_mode_select_screen)
         
     def start_study(self, mode):
+        self.profiler.session_started()
         can_start = self.study_screen.start_new_study_session(mode) 
         if can_start:
             self.stack.setCurrentWidget(self.study_screen)
         else:
+            self.profiler.session_cancelled()
             QMessageBox.information(self, "완료", "오늘 복습할 단어가 없습니다!")
 
     def open_deck_stats(self):
@@ -135,14 +248,25 @@ class MainWindow(QMainWindow):
     def go_to_home_screen(self):
         if self.current_deck: 
             self.home_screen.set_deck_name(self.current_deck)
+            cap = self.data_manager.get_deck_settings(self.current_deck).get("daily_cap")
+            self.home_screen.set_forecast(self.data_manager.get_forecast(self.current_deck), cap, len(MODES))
         self.stack.setCurrentWidget(self.home_screen)
 
+    def change_daily_cap(self, cap):
+        if not self.current_deck:
+            return
+        moved = self.data_manager.set_daily_cap(self.current_deck, cap)
+        self.go_to_home_screen()
+        if moved:
+            QMessageBox.information(self, "복습 상한", f"상한을 넘는 복습 {moved}개를 다음 날들로 나눴습니다.")
+
     def go_to_settings_screen(self): 
         self.stack.setCurrentWidget(self.settings_screen)
 
     def go_to_first_screen(self):
-        decks = self.data_manager.app_data['decks']
-        self.deck_selection_screen.update_deck_list(list(decks.keys()))
+        # 덱 파일은 읽지 않고 이름과 단어 수만 가져옴
+        self.deck_selection_screen.update_deck_list(self.data_manager.get_deck_names(),
+                                                    self.data_manager.get_word_counts())
         self.stack.setCurrentWidget(self.deck_selection_screen)
         
     def go_to_stats_screen(self):
@@ -167,54 +291,26 @@ class MainWindow(QMainWindow):
     def handle_deck_deletion(self, deck_name):
         self.data_manager.delete_deck(deck_name)
         deck_names = self.data_manager.get_deck_names()
-        self.deck_selection_screen.update_deck_list(deck_names)
+        self.deck_selection_screen.update_deck_list(deck_names, self.data_manager.get_word_counts())
     
-    def map_available_voices(self):
-        voice_map = {}
-        print("--- [TTS Voice Engine Debug] ---")
-        print("Searching for available voices on your system...")
-        try:
-            temp_engine = pyttsx3.init()
-            voices = temp_engine.getProperty('voices')
-            print(f"Found {len(voices)} voices in total:")
-
-            for i, voice in enumerate(voices):
-                print(f"  - Voice #{i}: Name: {voice.name}, Langs: {getattr(voice, 'languages', [])}")
-                lang_codes = getattr(voice, 'languages', [])
-                if lang_codes:
-                    short_code = lang_codes[0].replace('-', '_').split('_')[0]
-                    
-                    if short_code not in voice_map:
-                        voice_map[short_code] = voice.id
-            
-            del temp_engine
-            print("\nSuccessfully created voice map:")
-            print(voice_map)
-            print("------------------------------------")
-            return voice_map
-        except Exception as e:
-            print(f"TTS voice mapping failed: {e}")
-            print("------------------------------------")
-            return {}
-
+    @timed("speak")
     def speak(self, text, lang=""):
         try:
-            engine = pyttsx3.init()            
             lang_code = LANGUAGE_MAP.get(lang)
-            
-            if lang_code == 'ja' and text:
-                result = self.kks.convert(text) # 예: '酒' -> [{'orig': '酒', 'hira': 'さけ', ...}]
-                # 변환된 결과에서 히라가나 부분만 추출
-                hiragana_text = "".join([item['hira'] for item in result])
-                print(f"Japanese Kanji to Hiragana: '{text}' -> '{hiragana_text}'") # 디버깅용 출력
-                text = hiragana_text
-
-            if lang_code and lang_code in self.voice_map:
-                engine.setProperty('voice', self.voice_map[lang_code])
-            
-            engine.say(text)
-            engine.runAndWait()
-            engine.stop()
+            prepare = None
+
+            if lang_code == 'ja' and text and self.current_deck:
+                # 등록할 때 미리 변환해 둔 히라가나 읽기를 사용
+                reading = self.data_manager.get_reading(self.current_deck, text)
+                if reading:
+                    text = reading
+                else:
+                    # 읽기가 없는 단어는 GUI 스레드가 아닌 TTS 스레드에서 변환
+                    deck_name = self.current_deck
+                    prepare = lambda t: self.data_manager.get_reading(deck_name, t, convert=True)
+
+            # 재생은 TTS 스레드에 맡기고 바로 돌아옴 (이전 문장은 취소됨)
+            self.tts_worker.speak(text, lang_code, prepare)
         except Exception as e:
             print(f"TTS failed during speak: {e}")
 
@@ -224,6 +320,8 @@ if __name__ == "__main__":
     from PyQt5.QtWidgets import QApplication
     from PyQt5.QtGui import QFontDatabase, QFont 
 
+    startup_timer = StartupTimer(_PROCESS_START)
+    startup_timer.mark("imports")
     app = QApplication(sys.argv)
 
     font_file_name = 'NotoSansKR-SemiBold.ttf'
@@ -289,5 +387,6 @@ if __name__ == "__main__":
     """
 
     app.setStyleSheet(DARK_STYLE)
-    window = MainWindow()
+    startup_timer.mark("qt app + style")
+    window = MainWindow(startup_timer)
     sys.exit(app.exec_())
\ No newline at end of file
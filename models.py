@@ -0,0 +1,248 @@
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from functools import lru_cache
+
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+MODES = ("study_to_native", "native_to_study")
+
+@lru_cache(maxsize=65536)
+def _hour_epoch(prefix):
+    # 'YYYY-MM-DD HH'가 시작되는 epoch 초. 서머타임 전환도 정시 단위이므로 현지 시각 변환은 시간마다 한 번만 함
+    return int(datetime(int(prefix[:4]), int(prefix[5:7]), int(prefix[8:10]), int(prefix[11:13])).timestamp())
+
+def to_epoch(text):
+    """'%Y-%m-%d %H:%M' 문자열을 epoch 초로 바꿉니다. (None은 None)"""
+    if text is None:
+        return None
+    if len(text) == 16 and text[4] == text[7] == "-" and text[10] == " " and text[13] == ":":
+        # 저장 형식 그대로인 문자열은 strptime보다 훨씬 빠르게 직접 나눠서 읽음
+        try:
+            minute = int(text[14:16])
+            if 0 <= minute < 60:
+                return _hour_epoch(text[:13]) + minute * 60
+        except ValueError:
+            pass
+    return int(datetime.strptime(text, TIME_FORMAT).timestamp())
+
+@lru_cache(maxsize=65536)
+def _minute_text(minute):
+    return datetime.fromtimestamp(minute * 60).strftime(TIME_FORMAT)
+
+def to_text(epoch):
+    """epoch 초를 저장 형식 문자열로 바꿉니다. 같은 분은 한 번만 변환합니다."""
+    if epoch is None:
+        return None
+    return _minute_text(int(epoch) // 60)
+
+class _Record(Mapping):
+    """
+    속성으로 읽고 쓰는 모델이지만, 기존 코드가 쓰던 딕셔너리 방식(entry["word"], entry.get(...))도 지원합니다.
+    시각 필드는 속성으로는 epoch 정수, 딕셔너리 방식으로는 기존과 같은 문자열로 보입니다.
+    """
+    __slots__ = ()
+    FIELDS = ()
+    TIME_FIELDS = ()
+    OPTIONAL_FIELDS = () # 값이 None이면 없는 키로 취급 (JSON에도 쓰지 않음)
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if key in self.TIME_FIELDS:
+                return to_text(value)
+            if value is None and key in self.OPTIONAL_FIELDS:
+                raise KeyError(key)
+            return value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            if key in self.TIME_FIELDS and isinstance(value, str):
+                value = to_epoch(value)
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if key not in self.OPTIONAL_FIELDS or getattr(self, key) is not None:
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+class ReviewStats(_Record):
+    """
+    단어 하나, 학습 모드 하나의 복습 통계. 시각은 epoch 초(정수)입니다.
+    SCHEDULER_FIELDS는 복습 주기 계산기(scheduler.py)가 쓰는 상태로, 값이 있을 때만 저장됩니다.
+    """
+    SCHEDULER_FIELDS = ("interval", "reps", "ease", "stability", "difficulty")
+    __slots__ = ("correct_cnt", "incorrect_cnt", "prob_mode", "last_reviewed", "next_review", "extra") + SCHEDULER_FIELDS
+    FIELDS = ("correct_cnt", "incorrect_cnt", "prob_mode", "last_reviewed", "next_review") + SCHEDULER_FIELDS
+    TIME_FIELDS = ("last_reviewed", "next_review")
+    OPTIONAL_FIELDS = frozenset(SCHEDULER_FIELDS)
+    KEYS = frozenset(FIELDS)
+
+    def __init__(self, correct_cnt=0, incorrect_cnt=0, prob_mode="objective",
+                 last_reviewed=None, next_review=None, extra=None):
+        self.correct_cnt = correct_cnt
+        self.incorrect_cnt = incorrect_cnt
+        self.prob_mode = prob_mode
+        self.last_reviewed = last_reviewed
+        self.next_review = next_review
+        self.interval = None   # 마지막으로 정한 복습 간격 (분)
+        self.reps = None       # 연속으로 맞힌 횟수
+        self.ease = None       # SM-2 난이도 계수
+        self.stability = None  # FSRS 기억 안정도 (일)
+        self.difficulty = None # FSRS 난이도 (1~10)
+        self.extra = None
+        if extra:
+            for key, value in extra.items():
+                self[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, cls):
+            return data
+        extra = None if data.keys() <= cls.KEYS else {k: v for k, v in data.items() if k not in cls.KEYS}
+        stats = cls(data.get("correct_cnt", 0), data.get("incorrect_cnt", 0), data.get("prob_mode"),
+                    to_epoch(data.get("last_reviewed")), to_epoch(data.get("next_review")), extra)
+        for key in cls.SCHEDULER_FIELDS:
+            if key in data:
+                setattr(stats, key, data[key])
+        return stats
+
+    def to_dict(self):
+        # Mapping 방식(__iter__/__getitem__)을 거치지 않고 속성에서 바로 만듦 (저장할 때 단어마다 불림)
+        data = {
+            "correct_cnt": self.correct_cnt,
+            "incorrect_cnt": self.incorrect_cnt,
+            "prob_mode": self.prob_mode,
+            "last_reviewed": to_text(self.last_reviewed),
+            "next_review": to_text(self.next_review),
+        }
+        for key in self.SCHEDULER_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+class WordRecord(_Record):
+    """
+    단어 하나의 데이터. review_stats는 학습 모드 -> ReviewStats 딕셔너리이고,
+    created_at은 epoch 초(정수)입니다. JSON으로는 to_dict()의 기존 형식 그대로 저장됩니다.
+    """
+    __slots__ = ("id", "word", "meaning", "example", "created_at", "review_stats", "extra")
+    FIELDS = ("word", "meaning", "example", "created_at", "review_stats", "id")
+    TIME_FIELDS = ("created_at",)
+    OPTIONAL_FIELDS = frozenset(("id",))
+    KEYS = frozenset(FIELDS)
+
+    def __init__(self, word, meaning, example="", created_at=None, review_stats=None, word_id=None, extra=None):
+        self.id = word_id
+        self.word = word
+        self.meaning = meaning
+        self.example = example
+        self.created_at = created_at
+        self.review_stats = review_stats if review_stats is not None else {}
+        self.extra = extra
+
+    @classmethod
+    def new(cls, word, meanings, example="", now=None):
+        """새 단어를 만듭니다. 두 학습 모드 모두 1분 뒤에 처음 복습합니다."""
+        now = int(time.time()) if now is None else int(now)
+        return cls(word, list(meanings), example, now,
+                   {mode: ReviewStats(next_review=now + 60) for mode in MODES})
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, cls):
+            return data
+        if isinstance(data, LazyRecord):
+            return data.to_record()
+        extra = None if data.keys() <= cls.KEYS else {k: v for k, v in data.items() if k not in cls.KEYS}
+        review_stats = {mode: ReviewStats.from_dict(stats) for mode, stats in data.get("review_stats", {}).items()}
+        word_id = data.get("id")
+        return cls(data["word"], data.get("meaning", []), data.get("example", ""),
+                   to_epoch(data.get("created_at")), review_stats, word_id, extra)
+
+    def to_dict(self):
+        data = {
+            "word": self.word,
+            "meaning": self.meaning,
+            "example": self.example,
+            "created_at": to_text(self.created_at),
+            "review_stats": {mode: stats.to_dict() if isinstance(stats, ReviewStats) else stats
+                             for mode, stats in self.review_stats.items()},
+        }
+        if self.id is not None:
+            data["id"] = self.id
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+class LazyRecord:
+    """
+    저장소가 아직 WordRecord로 만들지 않은 단어 한 줄. 단어와 ID만 바로 읽을 수 있고,
+    나머지는 to_record()가 처음 불릴 때 한 번만 만듭니다. (WordIndex가 처음 꺼낼 때 바꿈)
+    """
+    __slots__ = ("word", "id", "_record")
+
+    def __init__(self, word, word_id):
+        self.word = word
+        self.id = word_id
+        self._record = None
+
+    def _make_record(self):
+        raise NotImplementedError
+
+    @property
+    def converted(self):
+        return self._record is not None
+
+    def to_record(self):
+        if self._record is None:
+            self._record = self._make_record()
+        return self._record
+
+    def __getitem__(self, key):
+        # 단어 목록을 훑는 코드(저널 재생 등)가 entry["word"]로 읽을 수 있게 함
+        if key == "word" and self._record is None:
+            return self.word
+        return self.to_record()[key]
+
+    def get(self, key, default=None):
+        return self.to_record().get(key, default)
+
+    def to_dict(self):
+        return self.to_record().to_dict()
+
+def plain_deck(deck):
+    """
+    덱을 json.dumps로 바로 쓸 수 있는 형태로 바꿉니다. WordRecord는 to_dict()로 바꾸고,
+    아직 WordRecord로 바뀌지 않은(파일에서 읽은 그대로인) 단어는 그대로 씁니다.
+    """
+    words = deck.get("words")
+    if not words:
+        return deck
+    return {**deck, "words": [entry.to_dict() if isinstance(entry, (WordRecord, LazyRecord)) else entry
+                              for entry in words]}
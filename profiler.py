@@ -0,0 +1,131 @@
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+# 결과 파일은 data/profiles/<시각>_<이름>.pstats 와 .collapsed로 저장됩니다.
+PROFILE_DIR = "data/profiles"
+# 샘플링 간격(초). 200Hz면 앱이 느려지는 정도는 거의 느껴지지 않습니다.
+SAMPLE_INTERVAL = 0.005
+SESSION_LABEL = "study_session"
+
+def frame_name(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class StackSampler:
+    """
+    다른 스레드(보통 Qt 이벤트 루프를 돌리는 메인 스레드)의 호출 스택을 일정 간격으로 읽어
+    같은 스택이 몇 번 보였는지 셉니다. 결과는 flamegraph.pl, speedscope 등이 읽는
+    'collapsed stack' 형식(바깥;...;안쪽 횟수)으로 저장합니다.
+    """
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                names.append(frame_name(frame))
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, n in self.stacks.most_common():
+                f.write(f"{stack} {n}\n")
+
+class Profiler:
+    """
+    cProfile과 스택 샘플링을 함께 켜고 끄는 프로파일링 모드.
+    start()/stop()으로 직접 구간을 정하거나, arm_session()으로 다음 학습 세션 하나를 잡을 수 있습니다.
+    (메인 스레드에서 호출해야 하며, cProfile은 호출한 스레드만 측정합니다)
+    """
+    def __init__(self, directory=PROFILE_DIR, interval=SAMPLE_INTERVAL):
+        self.directory = directory
+        self.interval = interval
+        self.label = None
+        self.session_armed = False
+        self.last_saved = None # 마지막으로 저장한 (pstats 경로, collapsed 경로)
+        self._profile = None
+        self._sampler = None
+        self._started_at = None
+
+    @property
+    def running(self):
+        return self._profile is not None
+
+    def start(self, label="manual"):
+        if self.running:
+            raise RuntimeError("이미 프로파일링 중입니다.")
+        profile = cProfile.Profile()
+        profile.enable() # 다른 프로파일러가 켜져 있으면 여기서 ValueError
+        self._profile = profile
+        self._sampler = StackSampler(threading.get_ident(), self.interval)
+        self._sampler.start()
+        self.label = label
+        self._started_at = time.strftime("%Y%m%d_%H%M%S")
+
+    def stop(self, save=True):
+        """프로파일링을 멈추고 save=True면 결과 파일 두 개의 경로를 반환합니다."""
+        if not self.running:
+            return None
+        self._profile.disable()
+        self._sampler.stop()
+        profile, sampler, self._profile, self._sampler = self._profile, self._sampler, None, None
+        if not save:
+            return None
+
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, f"{self._started_at}_{self.label}")
+        profile.dump_stats(base + ".pstats")
+        sampler.write_collapsed(base + ".collapsed")
+        self.last_saved = (base + ".pstats", base + ".collapsed")
+        return self.last_saved
+
+    # --- 학습 세션 하나를 잡는 모드 ---
+    def arm_session(self, armed=True):
+        self.session_armed = armed
+
+    def session_started(self):
+        if self.session_armed and not self.running:
+            self.start(SESSION_LABEL)
+
+    def session_cancelled(self):
+        # 복습할 단어가 없어 세션이 열리지 않았으면 버리고 다음 세션을 기다림
+        if self.running and self.label == SESSION_LABEL:
+            self.stop(save=False)
+
+    def session_finished(self):
+        if self.running and self.label == SESSION_LABEL:
+            self.session_armed = False
+            return self.stop()
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 .pstats 파일의 요약을 출력합니다.")
+    parser.add_argument("path", help="프로파일링 결과 파일 (.pstats)")
+    parser.add_argument("--sort", default="cumulative", help="정렬 기준 (cumulative, tottime, ncalls 등)")
+    parser.add_argument("--limit", type=int, default=30, help="출력할 함수 수")
+    args = parser.parse_args()
+    pstats.Stats(args.path).strip_dirs().sort_stats(args.sort).print_stats(args.limit)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import random
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from answer_matcher import normalized_answers
+from instrumentation import count
+
+# 지금 문제를 푸는 동안 다음 PREFETCH_COUNT개 문제를 미리 만들어 둡니다.
+PREFETCH_COUNT = 3
+# 객관식 보기 수 (오답 3개 + 정답 1개)
+CHOICE_COUNT = 4
+# 이만큼 풀었고 정답률이 이 이상이면 주관식으로 냅니다.
+SUBJECTIVE_MIN_REVIEWS = 10
+SUBJECTIVE_MIN_ACCURACY = 0.85
+
+# 화면에 문제 하나를 띄우는 데 필요한 값들. choices는 주관식이면 None이고,
+# normalized_answers는 주관식 답 비교용으로 미리 정규화한 정답들입니다. (answer_matcher.py)
+Question = namedtuple("Question", "entry subjective text lang prompt choices correct_answers normalized_answers reading")
+
+def build_question(data_manager, deck_name, mode, entry):
+    """단어 하나로 문제(Question)를 만듭니다. GUI를 쓰지 않으므로 작업 스레드에서 호출해도 됩니다."""
+    stats = entry.review_stats[mode]
+    total_reviews = stats.correct_cnt + stats.incorrect_cnt
+    accuracy = stats.correct_cnt / total_reviews if total_reviews > 0 else 0
+    subjective = total_reviews >= SUBJECTIVE_MIN_REVIEWS and accuracy >= SUBJECTIVE_MIN_ACCURACY
+
+    deck_settings = data_manager.get_deck_settings(deck_name)
+    if mode == 'study_to_native':
+        text = entry['word']
+        lang = deck_settings.get("study_lang")
+        prompt = "의 뜻을 입력하세요." if subjective else "의 뜻으로 올바른 것은?"
+        correct_answers = entry['meaning']
+    else:
+        text = random.choice(entry['meaning'])
+        lang = deck_settings.get("native_lang")
+        prompt = "에 해당하는 단어를 입력하세요." if subjective else "에 해당하는 단어는?"
+        correct_answers = [entry['word']]
+
+    choices = None
+    if not subjective:
+        # 덱마다 미리 만들어 둔 보기 후보에서 정답을 제외하고 추출하고,
+        # 덱 설정에 따라 정답과 비슷한 '헷갈리는 보기'를 우선 사용
+        pool = data_manager.get_distractor_pool(deck_name, mode)
+        hard_for = random.choice(correct_answers) if deck_settings.get("hard_distractors") else None
+        choices = pool.sample(correct_answers, CHOICE_COUNT - 1, hard_for=hard_for)
+        choices.append(random.choice(correct_answers))
+        random.shuffle(choices)
+
+    # 일본어 문제면 등록 시 저장해 둔 히라가나 읽기를 함께 표시
+    reading = None
+    if lang == "日本語":
+        reading = data_manager.get_reading(deck_name, text)
+        if reading == text:
+            reading = None
+    normalized = normalized_answers(correct_answers) if subjective else None
+    return Question(entry, subjective, text, lang, prompt, choices, correct_answers, normalized, reading)
+
+class QuestionPrefetcher:
+    """
+    학습 세션의 다음 문제들을 작업 스레드 하나에서 미리 만들어 두는 파이프라인.
+    prefetch()로 곧 나올 단어들을 알려 주면 아직 만들지 않은 것만 만들기 시작하고,
+    take()는 미리 만든 문제를 돌려줍니다. (아직 만드는 중이면 끝날 때까지, 없으면 바로 만듦)
+    """
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.deck_name = None
+        self.mode = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="question-prefetch")
+        self._futures = {} # id(단어 데이터) -> Future
+
+    def reset(self, deck_name, mode):
+        """새 세션을 시작할 때 이전에 만들던 문제를 모두 버립니다."""
+        self._cancel_all()
+        self.deck_name = deck_name
+        self.mode = mode
+
+    def prefetch(self, entries):
+        """곧 나올 단어들(나올 순서대로)의 문제를 미리 만듭니다. 목록에서 빠진 단어의 작업은 취소합니다."""
+        upcoming = {id(entry): entry for entry in entries}
+        for key in [k for k in self._futures if k not in upcoming]:
+            self._futures.pop(key).cancel()
+        for key, entry in upcoming.items():
+            if key not in self._futures:
+                self._futures[key] = self._executor.submit(
+                    build_question, self.data_manager, self.deck_name, self.mode, entry)
+
+    def take(self, entry):
+        future = self._futures.pop(id(entry), None)
+        if future is not None and not future.cancelled():
+            count("prefetch_hit")
+            return future.result()
+        count("prefetch_miss")
+        return build_question(self.data_manager, self.deck_name, self.mode, entry)
+
+    def _cancel_all(self):
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+    def close(self):
+        """아직 시작하지 않은 작업은 취소하고, 만드는 중인 문제는 끝날 때까지 기다린 뒤 작업 스레드를 닫습니다."""
+        self._cancel_all()
+        self._executor.shutdown(wait=True)
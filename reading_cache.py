@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+
+JAPANESE = "日本語"
+
+class ReadingCache:
+    """
+    일본어 단어 → 히라가나 읽기 캐시.
+    최근에 쓴 읽기는 메모리(LRU)에, 전체 읽기는 덱 데이터의 "readings"에 저장되므로
+    단어를 등록할 때 한 번만 pykakasi로 변환하면 학습 중에는 변환할 필요가 없습니다.
+    """
+    def __init__(self, lock=None, maxsize=4096):
+        # 덱 딕셔너리에 키를 추가하므로 DataManager.lock을 함께 사용
+        self.lock = lock or threading.RLock()
+        self.maxsize = maxsize
+        self._lru = OrderedDict()
+        self._kks = None
+        self._kks_lock = threading.Lock()
+
+    def get(self, deck_data, text):
+        """저장된 읽기를 반환합니다. 없으면 None (변환하지 않음)."""
+        key = (id(deck_data), text)
+        with self.lock:
+            reading = self._lru.get(key)
+            if reading is not None:
+                self._lru.move_to_end(key)
+                return reading
+            reading = deck_data.get("readings", {}).get(text)
+            if reading is not None:
+                self._remember(key, reading)
+            return reading
+
+    def get_or_convert(self, deck_data, text):
+        """저장된 읽기가 없으면 변환해서 저장한 뒤 반환합니다."""
+        reading = self.get(deck_data, text)
+        if reading is None:
+            self.fill(deck_data, [text])
+            reading = self.get(deck_data, text)
+        return reading
+
+    def fill(self, deck_data, texts):
+        """읽기가 없는 문자열들을 한꺼번에 변환해 덱에 저장하고, 새로 저장한 개수를 반환합니다."""
+        with self.lock:
+            readings = deck_data.get("readings", {})
+            missing = [t for t in dict.fromkeys(texts) if t and t not in readings]
+        if not missing:
+            return 0
+
+        converted = {text: self._convert(text) for text in missing}
+        with self.lock:
+            deck_data.setdefault("readings", {}).update(converted)
+        return len(converted)
+
+    def warm_up(self):
+        """pykakasi 사전을 미리 읽어 둡니다. (앱 시작 후 백그라운드에서 호출)"""
+        self._convert("")
+
+    def _remember(self, key, reading):
+        self._lru[key] = reading
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def _convert(self, text):
+        with self._kks_lock:
+            if self._kks is None:
+                import pykakasi
+                self._kks = pykakasi.kakasi()
+            # 예: '酒' -> [{'orig': '酒', 'hira': 'さけ', ...}]
+            return "".join(item['hira'] for item in self._kks.convert(text))
+
+def japanese_texts(settings, entries):
+    """덱 언어 설정에 따라 읽기가 필요한 일본어 문자열(단어 또는 뜻)을 모읍니다."""
+    texts = []
+    if settings.get("study_lang") == JAPANESE:
+        texts.extend(entry["word"] for entry in entries)
+    if settings.get("native_lang") == JAPANESE:
+        texts.extend(m for entry in entries for m in entry.get("meaning", []))
+    return texts
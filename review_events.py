@@ -0,0 +1,106 @@
+import os
+import struct
+import threading
+from collections import namedtuple
+from urllib.parse import quote
+
+try:
+    import numpy as np
+except ImportError: # NumPy가 없으면 read_array()만 쓸 수 없음
+    np = None
+
+from models import MODES
+
+EVENTS_DIR = "data/review_events"
+MAGIC = b"MVEVENT1"
+# 답 하나 = 16바이트: 단어 ID, 시각(epoch 초), 응답 시간(ms), 학습 모드 번호, 플래그
+RECORD = struct.Struct("<IIIBBxx")
+FLAG_CORRECT = 1
+FLAG_SUBJECTIVE = 2
+MAX_LATENCY_MS = 0xFFFFFFFF
+
+ReviewEvent = namedtuple("ReviewEvent", "word_id mode timestamp correct latency_ms subjective")
+
+def event_dtype():
+    """RECORD와 같은 배치의 NumPy 구조체 dtype"""
+    return np.dtype([("word_id", "<u4"), ("timestamp", "<u4"), ("latency_ms", "<u4"),
+                     ("mode", "u1"), ("flags", "u1"), ("pad", "V2")])
+
+def _truncate_torn_tail(f):
+    # 기록 도중 종료되어 잘린 마지막 레코드(또는 MAGIC)를 지워 길이를 MAGIC + 레코드 크기의 배수로 맞춤
+    size = f.seek(0, os.SEEK_END)
+    keep = 0 if size < len(MAGIC) else size - (size - len(MAGIC)) % RECORD.size
+    if keep != size:
+        f.truncate(keep)
+        f.seek(keep)
+
+class ReviewEventLog:
+    """
+    답 하나하나를 고정 길이 레코드로 덱별 파일(data/review_events/<덱 이름>.bin)에 덧붙이는 기록.
+    append()는 메모리에만 쌓고, flush()가 덱마다 한 번의 쓰기로 파일 끝에 붙입니다.
+    파일은 덧붙이기만 하므로 중간에 꺼져도 마지막의 잘린 레코드만 버리면 됩니다.
+    덧붙이기 전에는 그 조각을 잘라 내므로, 뒤에 붙는 레코드가 어긋나지 않습니다.
+    """
+    def __init__(self, directory=EVENTS_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._pending = {} # 덱 이름 -> 아직 쓰지 않은 레코드 바이트
+
+    def path(self, deck_name):
+        return os.path.join(self.directory, quote(deck_name, safe="") + ".bin")
+
+    def append(self, deck_name, word_id, mode, timestamp, correct, latency_ms=0, subjective=False):
+        flags = (FLAG_CORRECT if correct else 0) | (FLAG_SUBJECTIVE if subjective else 0)
+        record = RECORD.pack(word_id, int(timestamp), min(max(int(latency_ms), 0), MAX_LATENCY_MS),
+                             MODES.index(mode), flags)
+        with self._lock:
+            self._pending.setdefault(deck_name, bytearray()).extend(record)
+
+    def flush(self):
+        """쌓아 둔 레코드를 덱별 파일 끝에 붙이고 디스크에 내려 씁니다."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            for deck_name, records in pending.items():
+                path = self.path(deck_name)
+                os.makedirs(self.directory, exist_ok=True)
+                with open(path, "ab") as f:
+                    _truncate_torn_tail(f)
+                    if f.tell() == 0:
+                        f.write(MAGIC)
+                    f.write(records)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    def delete(self, deck_name):
+        with self._lock:
+            self._pending.pop(deck_name, None)
+            try:
+                os.remove(self.path(deck_name))
+            except FileNotFoundError:
+                pass
+
+    def _read_bytes(self, deck_name):
+        self.flush()
+        try:
+            with open(self.path(deck_name), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return b""
+        if len(data) < len(MAGIC):
+            return b"" # MAGIC을 쓰다가 종료됨
+        if not data.startswith(MAGIC):
+            raise ValueError(f"복습 기록 파일 형식이 아닙니다: {self.path(deck_name)}")
+        data = data[len(MAGIC):]
+        return data[:len(data) - len(data) % RECORD.size] # 마지막에 잘린 레코드는 버림
+
+    def read(self, deck_name):
+        """덱의 모든 복습 기록을 ReviewEvent 목록으로 반환합니다."""
+        return [ReviewEvent(word_id, MODES[mode], timestamp, bool(flags & FLAG_CORRECT), latency_ms,
+                            bool(flags & FLAG_SUBJECTIVE))
+                for word_id, timestamp, latency_ms, mode, flags in RECORD.iter_unpack(self._read_bytes(deck_name))]
+
+    def read_array(self, deck_name):
+        """덱의 모든 복습 기록을 NumPy 구조체 배열로 반환합니다. (복사 없이 바이트를 그대로 해석)"""
+        if np is None:
+            raise RuntimeError("read_array()에는 NumPy가 필요합니다.")
+        return np.frombuffer(self._read_bytes(deck_name), dtype=event_dtype())
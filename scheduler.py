@@ -0,0 +1,295 @@
+import math
+
+try:
+    import numpy as np
+except ImportError: # NumPy가 없으면 덱 전체 재계산도 카드 하나씩 계산
+    np = None
+
+from models import ReviewStats
+
+DEFAULT_SCHEDULER = "legacy"
+# 복습 간격은 1분 이상, 100년 이하로 자릅니다.
+MIN_INTERVAL = 1
+MAX_INTERVAL = 36500 * 1440
+# SM-2의 ease ** (연속 정답 - 2)에서 지수 상한 (값이 넘치지 않게)
+MAX_EXPONENT = 60
+
+class _ScalarMath:
+    """NumPy 함수 중 계산식에 쓰는 것들의 숫자 하나짜리 버전. 같은 계산식을 배열과 숫자에 함께 씁니다."""
+    maximum = staticmethod(max)
+    minimum = staticmethod(min)
+    exp = staticmethod(math.exp)
+    power = staticmethod(pow)
+
+    @staticmethod
+    def where(condition, a, b):
+        return a if condition else b
+
+class Scheduler:
+    """
+    복습 주기 계산기의 공통 부분. 답을 하나 처리하는 review()와,
+    계산기/파라미터를 바꿨을 때 덱 전체의 다음 복습 시각을 다시 맞추는 reschedule()을 제공합니다.
+    하위 클래스는 상태 추정(_initial_state), 상태 갱신(_update), 간격 계산(_interval)만 구현합니다.
+    """
+    name = ""
+    DEFAULT_PARAMS = {}
+    STATE_FIELDS = () # ReviewStats에 저장하는 계산기 상태 (interval 제외)
+
+    def __init__(self, params=None):
+        unknown = set(params or {}) - set(self.DEFAULT_PARAMS)
+        if unknown:
+            raise ValueError(f"{self.name} 계산기에 없는 파라미터입니다: {', '.join(sorted(unknown))}")
+        self.params = {**self.DEFAULT_PARAMS, **(params or {})}
+
+    def review(self, stats, is_correct, now):
+        """답 하나의 결과로 통계와 상태를 갱신하고 다음 복습 시각을 정합니다. 새 간격(분)을 반환합니다."""
+        state = self._current_state(stats)
+        elapsed = (now - stats.last_reviewed) / 86400 if stats.last_reviewed is not None else None
+        state = self._update(state, is_correct, elapsed)
+        interval = self._clip(_ScalarMath, self._interval(_ScalarMath, state))
+
+        if is_correct:
+            stats.correct_cnt += 1
+        else:
+            stats.incorrect_cnt += 1
+        stats.last_reviewed = now
+        stats.next_review = now + interval * 60
+        self._store(stats, state, interval)
+        return interval
+
+    def reschedule(self, stats_list, keep_state=True):
+        """
+        이미 복습한 카드들의 다음 복습 시각을 이 계산기 기준으로 다시 계산합니다.
+        keep_state가 False면(다른 계산기에서 바꾼 경우) 지금까지의 횟수와 간격으로 상태를 새로 추정합니다.
+        NumPy가 있으면 덱 전체를 배열로 한 번에 계산합니다. 다시 계산한 카드 수를 반환합니다.
+        """
+        reviewed = [s for s in stats_list if s.last_reviewed is not None]
+        for stats in reviewed:
+            for field in ReviewStats.SCHEDULER_FIELDS:
+                if field != "interval" and field not in self.STATE_FIELDS:
+                    setattr(stats, field, None)
+        if not reviewed:
+            return 0
+
+        if np is None:
+            for stats in reviewed:
+                state = self._current_state(stats) if keep_state else self._estimate(stats)
+                self._apply(stats, state, self._clip(_ScalarMath, self._interval(_ScalarMath, state)))
+            return len(reviewed)
+
+        correct = np.array([s.correct_cnt for s in reviewed], dtype=float)
+        incorrect = np.array([s.incorrect_cnt for s in reviewed], dtype=float)
+        intervals = np.array([_last_interval(s) for s in reviewed], dtype=float)
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            state = self._initial_state(np, correct, incorrect, intervals)
+            if keep_state:
+                # 이미 상태가 있는 카드는 추정값 대신 그 상태를 씀
+                for field in self.STATE_FIELDS:
+                    current = np.array([_nan_if_none(getattr(s, field)) for s in reviewed], dtype=float)
+                    state[field] = np.where(np.isnan(current), state[field], current)
+            new_intervals = self._clip(np, self._interval(np, state))
+
+        # 반올림/정수 변환까지 배열에서 끝내고, 카드에는 값만 옮겨 적음
+        next_reviews = np.array([s.last_reviewed for s in reviewed], dtype=np.int64) + new_intervals * 60
+        columns = [(field, (state[field].astype(int) if field == "reps" else state[field].round(4)).tolist())
+                   for field in self.STATE_FIELDS]
+        for stats, interval, next_review in zip(reviewed, new_intervals.tolist(), next_reviews.tolist()):
+            stats.interval = interval
+            stats.next_review = next_review
+        for field, values in columns:
+            for stats, value in zip(reviewed, values):
+                setattr(stats, field, value)
+        return len(reviewed)
+
+    def _current_state(self, stats):
+        # 저장된 상태가 하나라도 비어 있으면 지금까지의 기록으로 추정
+        if stats.last_reviewed is None or all(getattr(stats, f) is not None for f in self.STATE_FIELDS):
+            return {field: getattr(stats, field) for field in self.STATE_FIELDS}
+        return self._estimate(stats)
+
+    def _estimate(self, stats):
+        return self._initial_state(_ScalarMath, stats.correct_cnt, stats.incorrect_cnt, _last_interval(stats))
+
+    def _apply(self, stats, state, interval):
+        stats.next_review = stats.last_reviewed + interval * 60
+        self._store(stats, state, interval)
+
+    def _store(self, stats, state, interval):
+        stats.interval = interval
+        for field in self.STATE_FIELDS:
+            value = state[field]
+            setattr(stats, field, int(value) if field == "reps" else round(float(value), 4))
+
+    @staticmethod
+    def _clip(xp, interval):
+        interval = xp.minimum(xp.maximum(interval, MIN_INTERVAL), MAX_INTERVAL)
+        return interval.round().astype(int) if xp is np else int(round(interval))
+
+    def _initial_state(self, xp, correct, incorrect, interval):
+        """상태가 없는 카드의 상태를 정답/오답 횟수와 마지막 간격(분)으로 추정합니다."""
+        return {}
+
+    def _update(self, state, is_correct, elapsed_days):
+        """답 하나로 상태를 갱신합니다. elapsed_days는 지난 복습부터 지난 일 수 (처음이면 None)"""
+        return state
+
+    def _interval(self, xp, state):
+        """상태로부터 다음 복습까지의 간격(분)을 계산합니다."""
+        raise NotImplementedError
+
+def _last_interval(stats):
+    # 마지막으로 정한 간격(분). 예전 데이터는 다음 복습 시각 - 마지막 복습 시각
+    if stats.interval is not None:
+        return stats.interval
+    if stats.next_review is None or stats.last_reviewed is None:
+        return 0
+    return max(stats.next_review - stats.last_reviewed, 0) // 60
+
+def _nan_if_none(value):
+    return math.nan if value is None else value
+
+class LegacyScheduler(Scheduler):
+    """기존 방식: 맞히면 60 * 2^(정답 횟수)분, 틀리면 30분 뒤에 다시 복습합니다."""
+    name = "legacy"
+    DEFAULT_PARAMS = {"base_minutes": 60, "miss_minutes": 30}
+
+    def review(self, stats, is_correct, now):
+        if is_correct:
+            stats.correct_cnt += 1
+            interval = self.params["base_minutes"] * (2 ** min(stats.correct_cnt, MAX_EXPONENT))
+        else:
+            stats.incorrect_cnt += 1
+            interval = self.params["miss_minutes"]
+        interval = self._clip(_ScalarMath, interval)
+        stats.last_reviewed = now
+        stats.next_review = now + interval * 60
+        return interval
+
+    def reschedule(self, stats_list, keep_state=True):
+        # 기존 방식은 상태를 쓰지 않으므로, 다른 계산기의 상태만 지우고 복습 시각은 그대로 둠
+        for stats in stats_list:
+            for field in ReviewStats.SCHEDULER_FIELDS:
+                setattr(stats, field, None)
+        return 0
+
+class SM2Scheduler(Scheduler):
+    """
+    SuperMemo SM-2. 맞히면 1일, 6일, 이후 6일 * ease^(연속 정답 - 2)로 간격을 늘리고,
+    틀리면 연속 정답을 0으로 되돌려 relearn_minutes 뒤에 다시 묻습니다.
+    답의 품질(0~5)은 정답이면 correct_quality, 오답이면 incorrect_quality로 봅니다.
+    """
+    name = "sm2"
+    DEFAULT_PARAMS = {
+        "initial_ease": 2.5, "min_ease": 1.3,
+        "first_interval": 1440, "second_interval": 6 * 1440, "relearn_minutes": 10,
+        "correct_quality": 4, "incorrect_quality": 1,
+    }
+    STATE_FIELDS = ("reps", "ease")
+
+    def _ease_delta(self, quality):
+        return 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+
+    def _initial_state(self, xp, correct, incorrect, interval):
+        p = self.params
+        # 오답마다 ease가 한 번씩 줄었다고 보고, 마지막 간격이 relearn보다 길면 마지막 답은 정답으로 봄
+        ease = xp.maximum(p["min_ease"], p["initial_ease"] + correct * self._ease_delta(p["correct_quality"])
+                          + incorrect * self._ease_delta(p["incorrect_quality"]))
+        reps = xp.where(interval > p["relearn_minutes"], correct, 0 * correct)
+        return {"reps": reps, "ease": ease}
+
+    def _update(self, state, is_correct, elapsed_days):
+        p = self.params
+        reps, ease = state["reps"], state["ease"]
+        if reps is None:
+            reps, ease = 0, p["initial_ease"]
+        quality = p["correct_quality"] if is_correct else p["incorrect_quality"]
+        ease = max(p["min_ease"], ease + self._ease_delta(quality))
+        reps = reps + 1 if is_correct else 0
+        return {"reps": reps, "ease": ease}
+
+    def _interval(self, xp, state):
+        p = self.params
+        reps, ease = state["reps"], state["ease"]
+        grown = p["second_interval"] * xp.power(ease, xp.minimum(xp.maximum(reps - 2, 0), MAX_EXPONENT))
+        return xp.where(reps <= 0, p["relearn_minutes"] + 0 * ease,
+                        xp.where(reps == 1, p["first_interval"] + 0 * ease, grown))
+
+class FSRSScheduler(Scheduler):
+    """
+    FSRS-4.5. 카드마다 기억 안정도(S, 일)와 난이도(D)를 두고,
+    회상 확률이 desired_retention으로 떨어지는 시점을 다음 복습으로 정합니다.
+    정답은 Good(3), 오답은 Again(1)으로 처리합니다.
+    """
+    name = "fsrs"
+    DECAY = -0.5
+    FACTOR = 19 / 81 # 0.9 ** (1 / DECAY) - 1
+    DEFAULT_PARAMS = {
+        "w": [0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+              0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755],
+        "desired_retention": 0.9,
+        "relearn_minutes": 10,
+    }
+    STATE_FIELDS = ("reps", "stability", "difficulty")
+
+    def _initial_difficulty(self, xp, grade):
+        w = self.params["w"]
+        return xp.minimum(xp.maximum(w[4] - (grade - 3) * w[5], 1), 10)
+
+    def _initial_state(self, xp, correct, incorrect, interval):
+        w = self.params["w"]
+        # 마지막 간격을 지금의 안정도로 봄 (desired_retention 0.9에서 간격 = 안정도)
+        last_ok = interval > self.params["relearn_minutes"]
+        stability = xp.where(last_ok, xp.maximum(interval / 1440, 0.1), w[0] + 0 * interval)
+        difficulty = self._initial_difficulty(xp, 3) + 0 * interval
+        reps = xp.where(last_ok, correct, 0 * correct)
+        return {"reps": reps, "stability": stability, "difficulty": difficulty}
+
+    def retrievability(self, elapsed_days, stability):
+        """안정도 stability인 기억을 elapsed_days일 뒤에 떠올릴 확률"""
+        return (1 + self.FACTOR * elapsed_days / stability) ** self.DECAY
+
+    def first_state(self, xp, correct):
+        """처음 답했을 때의 (안정도, 난이도). correct는 정답 여부 (배열도 가능)"""
+        w = self.params["w"]
+        grade = xp.where(correct, 3, 1)
+        return xp.where(correct, w[2], w[0]), self._initial_difficulty(xp, grade)
+
+    def next_state(self, xp, stability, difficulty, correct, elapsed_days):
+        """
+        (안정도, 난이도)인 카드를 elapsed_days일 뒤에 답했을 때의 새 (안정도, 난이도).
+        xp에 numpy를 넘기면 여러 카드를 한 번에 계산합니다. (scheduler_optimizer.py에서 사용)
+        """
+        w = self.params["w"]
+        grade = xp.where(correct, 3, 1)
+        r = self.retrievability(xp.maximum(elapsed_days, 0), stability)
+        recalled = stability * (1 + xp.exp(w[8]) * (11 - difficulty) * stability ** -w[9]
+                                * (xp.exp(w[10] * (1 - r)) - 1))
+        forgotten = xp.minimum(stability, w[11] * difficulty ** -w[12] * ((stability + 1) ** w[13] - 1)
+                               * xp.exp(w[14] * (1 - r)))
+        stability = xp.maximum(xp.where(correct, recalled, forgotten), 0.01)
+        difficulty = difficulty - w[6] * (grade - 3)
+        difficulty = w[7] * self._initial_difficulty(xp, 3) + (1 - w[7]) * difficulty
+        return stability, xp.minimum(xp.maximum(difficulty, 1), 10)
+
+    def _update(self, state, is_correct, elapsed_days):
+        reps, stability, difficulty = state["reps"], state["stability"], state["difficulty"]
+        if stability is None:
+            stability, difficulty = self.first_state(_ScalarMath, is_correct)
+            reps = 0
+        else:
+            stability, difficulty = self.next_state(_ScalarMath, stability, difficulty, is_correct, elapsed_days or 0)
+        return {"reps": reps + 1 if is_correct else 0, "stability": stability, "difficulty": difficulty}
+
+    def _interval(self, xp, state):
+        retention = self.params["desired_retention"]
+        days = state["stability"] / self.FACTOR * (retention ** (1 / self.DECAY) - 1)
+        return xp.where(state["reps"] <= 0, self.params["relearn_minutes"] + 0 * days, days * 1440)
+
+SCHEDULERS = {cls.name: cls for cls in (LegacyScheduler, SM2Scheduler, FSRSScheduler)}
+
+def create_scheduler(name=None, params=None):
+    """이름("legacy", "sm2", "fsrs")과 파라미터로 복습 주기 계산기를 만듭니다."""
+    cls = SCHEDULERS.get(name or DEFAULT_SCHEDULER)
+    if cls is None:
+        raise ValueError(f"알 수 없는 복습 주기 계산기입니다: {name}")
+    return cls(params)
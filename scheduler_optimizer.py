@@ -0,0 +1,165 @@
+import argparse
+
+try:
+    import numpy as np
+except ImportError: # 최적화는 NumPy가 있어야 실행할 수 있음
+    np = None
+
+from review_events import FLAG_CORRECT, FLAG_SUBJECTIVE
+from scheduler import FSRSScheduler
+
+# 같은 카드의 두 번째 답부터 예측 대상이 되며, 이보다 적으면 파라미터를 바꾸지 않습니다.
+MIN_PREDICTIONS = 100
+# 좌표 하강법: 가중치마다 (1 ± step)배를 시도하고, 한 바퀴마다 step을 절반으로 줄입니다.
+PASSES = 5
+INITIAL_STEP = 0.5
+CALIBRATION_BINS = 10
+
+def build_steps(events):
+    """
+    복습 기록(review_events.event_dtype 배열)을 카드(단어 ID, 학습 모드)별 답 순서로 정리합니다.
+    k번째 원소는 k번째 답이 있는 카드들의 (정답 여부, 지난 답부터 지난 일 수) 배열이며,
+    카드를 답 수가 많은 순으로 놓기 때문에 k번째 배열은 항상 k-1번째 배열의 앞부분 카드들입니다.
+    """
+    order = np.lexsort((events["timestamp"], events["word_id"], events["mode"]))
+    events = events[order]
+    keys = events["mode"].astype(np.int64) << 32 | events["word_id"]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    lengths = np.diff(np.r_[starts, len(events)])
+
+    # 답 수가 많은 카드부터 오도록 카드 순서를 바꿈
+    by_length = np.argsort(-lengths, kind="stable")
+    starts, lengths = starts[by_length], lengths[by_length]
+    correct = (events["flags"] & FLAG_CORRECT) != 0
+    timestamps = events["timestamp"].astype(float)
+
+    steps = []
+    for k in range(int(lengths.max()) if len(lengths) else 0):
+        rows = starts[:np.searchsorted(-lengths, -k, side="left")] + k # 답이 k+1개 이상인 카드
+        elapsed = (timestamps[rows] - timestamps[rows - 1]) / 86400 if k else np.zeros(len(rows))
+        steps.append((correct[rows], elapsed))
+    return steps
+
+def predict(scheduler, steps):
+    """모든 카드를 한꺼번에 따라가며 두 번째 답부터의 (예측 회상 확률, 실제 정답 여부)를 반환합니다."""
+    if len(steps) < 2:
+        return np.zeros(0), np.zeros(0, dtype=bool)
+    predicted, observed = [], []
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        stability, difficulty = scheduler.first_state(np, steps[0][0])
+        for correct, elapsed in steps[1:]:
+            n = len(correct)
+            stability, difficulty = stability[:n], difficulty[:n]
+            predicted.append(scheduler.retrievability(elapsed, stability))
+            observed.append(correct)
+            stability, difficulty = scheduler.next_state(np, stability, difficulty, correct, elapsed)
+    return np.concatenate(predicted), np.concatenate(observed)
+
+def log_loss(predicted, observed):
+    p = np.clip(np.nan_to_num(predicted, nan=0.5), 1e-6, 1 - 1e-6)
+    return float(-np.mean(np.where(observed, np.log(p), np.log(1 - p))))
+
+def calibration(predicted, observed, bins=CALIBRATION_BINS):
+    """예측 확률 구간별 [구간 하한, 개수, 평균 예측, 실제 정답률] 목록"""
+    index = np.minimum((predicted * bins).astype(int), bins - 1)
+    table = []
+    for b in range(bins):
+        mask = index == b
+        count = int(mask.sum())
+        if count:
+            table.append([b / bins, count, float(predicted[mask].mean()), float(observed[mask].mean())])
+    return table
+
+def fit_fsrs(steps, params=None, passes=PASSES):
+    """
+    FSRS 가중치를 복습 기록에 맞춥니다. 손실은 예측 회상 확률의 log loss이며,
+    가중치 하나씩 늘리고 줄여 보는 좌표 하강법을 씁니다. (카드 전체는 매번 NumPy로 한 번에 계산)
+    반환값: (맞춘 파라미터, 처음 손실, 맞춘 뒤 손실)
+    """
+    params = dict(FSRSScheduler(params).params)
+    weights = list(params["w"])
+
+    def loss_for(w):
+        return log_loss(*predict(FSRSScheduler({**params, "w": w}), steps))
+
+    initial = best = loss_for(weights)
+    step = INITIAL_STEP
+    for _ in range(passes):
+        for i in range(len(weights)):
+            for factor in (1 + step, 1 - step):
+                candidate = list(weights)
+                candidate[i] = weights[i] * factor
+                if i == 7: # 평균 회귀 비율은 0~1
+                    candidate[i] = min(candidate[i], 0.9)
+                loss = loss_for(candidate)
+                if loss < best:
+                    weights, best = candidate, loss
+                    break
+        step /= 2
+    params["w"] = [round(w, 4) for w in weights]
+    return params, initial, best
+
+def optimize_deck(data_manager, deck_name, passes=PASSES, write=True):
+    """
+    덱의 복습 기록으로 FSRS 파라미터를 맞추고 예측/실제 회상률 보고서(딕셔너리)를 반환합니다.
+    write=True이고 기록이 충분하면 덱의 복습 주기 계산기를 맞춘 파라미터의 FSRS로 바꿉니다.
+    """
+    if np is None:
+        raise RuntimeError("파라미터 최적화에는 NumPy가 필요합니다.")
+    events = data_manager.review_events.read_array(deck_name)
+    report = {"deck": deck_name, "events": int(len(events)), "written": False}
+    if len(events):
+        subjective = (events["flags"] & FLAG_SUBJECTIVE) != 0
+        correct = (events["flags"] & FLAG_CORRECT) != 0
+        report["observed_recall"] = {
+            "objective": float(correct[~subjective].mean()) if (~subjective).any() else None,
+            "subjective": float(correct[subjective].mean()) if subjective.any() else None,
+        }
+    steps = build_steps(events) if len(events) else []
+    predicted, observed = predict(FSRSScheduler(), steps)
+    report["predictions"] = int(len(predicted))
+    if len(predicted) < MIN_PREDICTIONS:
+        return report
+
+    settings = data_manager.get_deck_settings(deck_name)
+    current = settings.get("scheduler_params") if settings.get("scheduler") == FSRSScheduler.name else None
+    params, initial_loss, loss = fit_fsrs(steps, current, passes)
+    fitted_predicted, _ = predict(FSRSScheduler(params), steps)
+    report.update({
+        "params": params,
+        "log_loss_before": initial_loss,
+        "log_loss_after": loss,
+        "mean_predicted": float(fitted_predicted.mean()),
+        "mean_observed": float(observed.mean()),
+        "calibration": calibration(fitted_predicted, observed),
+    })
+    if write and loss < initial_loss:
+        data_manager.set_deck_scheduler(deck_name, FSRSScheduler.name, params)
+        report["written"] = True
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="복습 기록으로 덱의 FSRS 복습 주기 파라미터를 맞춥니다.")
+    parser.add_argument("deck", help="파라미터를 맞출 덱 이름")
+    parser.add_argument("--passes", type=int, default=PASSES, help="좌표 하강 반복 횟수")
+    parser.add_argument("--dry-run", action="store_true", help="보고서만 출력하고 덱 설정은 바꾸지 않음")
+    args = parser.parse_args()
+
+    from data_manager import DataManager
+    data_manager = DataManager()
+    report = optimize_deck(data_manager, args.deck, args.passes, write=not args.dry_run)
+    data_manager.close()
+
+    print(f"복습 기록: {report['events']}개, 예측 대상: {report['predictions']}개")
+    if "params" not in report:
+        print(f"기록이 부족해 파라미터를 맞추지 않았습니다. (예측 대상 {MIN_PREDICTIONS}개 이상 필요)")
+        return
+    print(f"log loss: {report['log_loss_before']:.4f} -> {report['log_loss_after']:.4f}")
+    print(f"평균 예측 회상률 {report['mean_predicted']:.3f} / 실제 {report['mean_observed']:.3f}")
+    print("예측 구간   개수   예측    실제")
+    for low, count, predicted, observed in report["calibration"]:
+        print(f"{low:.1f}~{low + 0.1:.1f} {count:7d}  {predicted:.3f}  {observed:.3f}")
+    print("덱 설정에 저장했습니다." if report["written"] else "덱 설정은 바꾸지 않았습니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import threading
+
+# 이 길이 이상의 검색어는 3-gram 색인으로 후보를 좁히고, 더 짧으면 미리 만든 검색 문자열을 훑습니다.
+GRAM_SIZE = 3
+# 검색 결과를 이 개수씩 나눠서 돌려줍니다. (화면에 먼저 찾은 결과부터 표시)
+RESULT_CHUNK = 500
+
+def search_text(entry):
+    """단어와 뜻을 소문자로 합친 검색용 문자열. (단어와 뜻 사이를 넘나드는 일치는 막음)"""
+    return entry.get("word", "").lower() + "\n" + " ".join(entry.get("meaning", [])).lower()
+
+def grams(text):
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+class SearchIndex:
+    """
+    덱 하나의 단어/뜻 검색 색인. 3-gram -> 단어 ID 집합의 역색인을 유지합니다.
+    단어가 추가/수정/삭제될 때 해당 단어만 다시 색인하므로 덱 전체를 다시 만들 필요가 없습니다.
+
+    search()는 작업 스레드에서 호출해도 되도록, 색인을 읽는 부분만 락을 잡고
+    실제 문자열 비교는 락 밖에서 합니다.
+    """
+    def __init__(self, words):
+        self._lock = threading.Lock()
+        self._texts = {}    # 단어 ID -> 검색 문자열 (단어 등록 순서 유지)
+        self._words = {}    # 단어 ID -> 단어
+        self._postings = {} # 3-gram -> 단어 ID 집합
+        for entry in words:
+            self._add(entry)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _add(self, entry):
+        word_id = entry["id"]
+        text = search_text(entry)
+        self._texts[word_id] = text
+        self._words[word_id] = entry["word"]
+        for gram in grams(text):
+            self._postings.setdefault(gram, set()).add(word_id)
+
+    def _remove(self, word_id):
+        text = self._texts.get(word_id)
+        if text is None:
+            return
+        for gram in grams(text):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(word_id)
+                if not ids:
+                    del self._postings[gram]
+
+    def update(self, entry):
+        """단어가 추가되거나 뜻이 바뀌었을 때 그 단어만 다시 색인합니다."""
+        with self._lock:
+            self._remove(entry["id"])
+            self._add(entry)
+
+    def remove(self, entry):
+        with self._lock:
+            self._remove(entry["id"])
+            self._texts.pop(entry["id"], None)
+            self._words.pop(entry["id"], None)
+
+    def _candidates(self, query):
+        with self._lock:
+            if len(query) < GRAM_SIZE:
+                return list(self._texts.items())
+            postings = sorted((self._postings.get(g, ()) for g in grams(query)), key=len)
+            ids = set(postings[0]).intersection(*postings[1:])
+            return [(word_id, self._texts[word_id]) for word_id in sorted(ids)]
+
+    def search(self, query, is_cancelled=None, chunk_size=RESULT_CHUNK):
+        """
+        query가 단어나 뜻에 포함된 단어들을 등록 순서대로 chunk_size개씩 돌려주는 제너레이터.
+        is_cancelled()가 True를 돌려주면 중간에 멈춥니다.
+        """
+        query = query.strip().lower()
+        found = []
+        for word_id, text in self._candidates(query):
+            if query in text:
+                word = self._words.get(word_id)
+                if word is not None:
+                    found.append(word)
+            if len(found) >= chunk_size:
+                if is_cancelled and is_cancelled():
+                    return
+                yield found
+                found = []
+        if found and not (is_cancelled and is_cancelled()):
+            yield found
@@ -0,0 +1,330 @@
+import json
+import os
+import zlib
+from urllib.parse import quote, unquote
+
+import data_manager
+from data_manager import (DATA_FILE, JOURNAL_FILE, JsonBackend, LazyDecks, _fsync_dir, default_app_data,
+                          rotate_generations)
+from models import plain_deck
+
+MANIFEST_FILE = "data/manifest.json"
+DECK_DIR = "data/decks"
+MANIFEST_VERSION = 1
+
+def _encode(data):
+    # 들여쓰기 없이 쓰면 C로 구현된 인코더를 그대로 사용 (덱 파일은 사람이 읽을 일이 적음)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _write_atomic(path, data):
+    """임시 파일에 다 쓰고 디스크에 반영한 뒤, 이전 파일들을 .1, .2, ...로 밀고 이름을 바꿉니다."""
+    temp_file = path + ".tmp"
+    with open(temp_file, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    rotate_generations(path)
+    os.replace(temp_file, path)
+
+def _generations(path):
+    """path와 그 이전 세대 파일들 (최신부터)"""
+    return [path] + [f"{path}.{n}" for n in range(1, data_manager.SNAPSHOT_GENERATIONS + 1)]
+
+def _read_first(paths, parse):
+    """
+    paths를 차례로 읽어 처음으로 parse에 성공한 (경로, 원본 바이트, 결과)를 반환합니다. 모두 실패하면 None.
+    읽을 수 없는 파일은 다음 저장 때 세대 목록에 섞이거나 덮어써지지 않도록 .corrupt로 옮겨 둡니다.
+    """
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            return path, raw, parse(raw)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e: # JSONDecodeError 포함
+            print(f"손상된 파일을 건너뜁니다: {path} ({e})")
+            if os.path.exists(path):
+                os.replace(path, _corrupt_name(path))
+    return None
+
+def _corrupt_name(path):
+    # 전에 옮겨 둔 깨진 파일도 덮어쓰지 않음 (.corrupt, .corrupt1, .corrupt2, ...)
+    target, n = path + ".corrupt", 0
+    while os.path.exists(target):
+        n += 1
+        target = f"{path}.corrupt{n}"
+    return target
+
+class ShardedBackend(JsonBackend):
+    """
+    덱마다 파일 하나(data/decks/<덱 이름>.json)에 저장하고, 덱 이름과 단어 수, 덱 밖의 데이터는
+    작은 매니페스트(data/manifest.json)에 두는 저장소.
+    시작할 때는 매니페스트만 읽고 덱 파일은 덱을 처음 열 때 읽으며, 저장할 때는 내용이 바뀐 덱 파일만 다시 씁니다.
+    복습 결과는 JsonBackend와 같은 저널에 쌓고, 아직 읽지 않은 덱의 저널 기록은 그 덱을 읽을 때 적용합니다.
+    매니페스트와 덱 파일은 JsonBackend처럼 이전 SNAPSHOT_GENERATIONS세대를 .1, .2, ...로 남기고,
+    깨진 파일은 .corrupt로 옮겨 둔 뒤 이전 세대에서 복구합니다.
+    """
+    def __init__(self, manifest_file=MANIFEST_FILE, deck_dir=DECK_DIR, journal_file=JOURNAL_FILE,
+                 json_file=DATA_FILE):
+        super().__init__(manifest_file, journal_file)
+        self.deck_dir = deck_dir
+        self.json_file = json_file
+        self._files = {} # 덱 이름 -> 덱 파일 이름
+        self._summaries = {} # 덱 이름 -> {"word_count": ...} (마지막으로 저장한 때 기준)
+        self._written = {} # 덱 이름 -> 파일에 있는 내용의 (길이, crc32)
+        self._pending = {} # 아직 읽지 않은 덱 이름 -> 적용할 저널 기록 목록
+        self._replayed = set() # 저널 기록을 적용해서 파일과 내용이 달라진 덱 이름
+        self._manifest = None # 마지막으로 쓴 매니페스트 내용
+        self._unreadable = set() # 모든 세대가 깨져서 빈 덱으로 연 덱 (이번 실행에서는 덱 파일을 쓰지 않음)
+        self._migrated = False
+
+    # --- 읽기 ---
+    def load(self):
+        self._migrated = False
+        self._pending = {}
+        self._replayed = set()
+        app_data = super().load()
+        if self._migrated:
+            # 저널은 그대로 두므로 다음 실행에서 다시 재생되어도 같은 값이 됨
+            self.write_snapshot(self.encode(app_data))
+        return app_data
+
+    def _read_snapshot(self):
+        """
+        매니페스트를 읽습니다. 깨졌으면 이전 세대(.1, .2, ...)에서 복구하고, 모두 깨졌으면 덱 파일 목록으로
+        다시 만듭니다. 매니페스트가 없으면 app_data.json을 옮겨 옵니다.
+        """
+        candidates = _generations(self.data_file)
+        if any(os.path.exists(path) for path in candidates):
+            found = _read_first(candidates, self._parse_manifest)
+            if found is None:
+                print("매니페스트를 읽을 수 없어 덱 파일 목록으로 다시 만듭니다.")
+                return self._from_deck_files()
+            path, raw, manifest = found
+            app_data = self._from_manifest(manifest)
+            if path == self.data_file:
+                self._manifest = raw
+            else:
+                print(f"최신 매니페스트를 읽을 수 없어 {path}에서 복구했습니다.")
+                self._adopt_deck_files(app_data)
+            return app_data
+
+        if self.json_file and os.path.exists(self.json_file):
+            app_data = self._migrate_json()
+            if app_data is not None:
+                return app_data
+        if self._deck_files():
+            return self._from_deck_files()
+        # 처음 실행: 매니페스트는 첫 저장 때 만들어짐
+        return self._from_manifest({"app": default_app_data(), "decks": []})
+
+    @staticmethod
+    def _parse_manifest(raw):
+        manifest = json.loads(raw)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"지원하지 않는 매니페스트 버전입니다: {manifest.get('version')}")
+        if not all("name" in item and "file" in item for item in manifest["decks"]):
+            raise ValueError("매니페스트의 덱 목록이 올바르지 않습니다.")
+        return manifest
+
+    def _from_manifest(self, manifest):
+        self._files = {item["name"]: item["file"] for item in manifest["decks"]}
+        self._summaries = {item["name"]: {"word_count": item["word_count"]}
+                           for item in manifest["decks"] if "word_count" in item}
+        self._written = {}
+        self._unreadable = set()
+        self._manifest = None
+        app_data = {k: v for k, v in manifest.get("app", {}).items() if k != "decks"}
+        app_data["decks"] = LazyDecks([item["name"] for item in manifest["decks"]], self._load_deck)
+        return app_data
+
+    def _deck_files(self):
+        """덱 폴더에 있는 덱 파일 이름들. 이전 세대(.json.1 등)만 남은 덱도 포함합니다."""
+        if not os.path.isdir(self.deck_dir):
+            return []
+        files = set()
+        for name in os.listdir(self.deck_dir):
+            base, dot, suffix = name.rpartition(".")
+            if name.endswith(".json"):
+                files.add(name)
+            elif dot and suffix.isdigit() and base.endswith(".json"):
+                files.add(base)
+        return sorted(files)
+
+    def _from_deck_files(self):
+        # 덱 밖의 데이터는 매니페스트에만 있었으므로 비워 둠 (학습 기록은 study_history에 따로 있음)
+        manifest = {"decks": [{"name": unquote(file[:-len(".json")]), "file": file} for file in self._deck_files()]}
+        self._migrated = True
+        return self._from_manifest(manifest)
+
+    def _adopt_deck_files(self, app_data):
+        """이전 세대 매니페스트로 복구했을 때, 그 뒤에 추가된 덱 파일도 목록에 넣고 파일이 없는 덱은 뺍니다."""
+        decks = app_data["decks"]
+        for name in [name for name in decks if not any(map(os.path.exists, _generations(self._deck_path(name))))]:
+            del decks[name]
+            del self._files[name]
+            self._summaries.pop(name, None)
+        listed = set(self._files.values())
+        for file in self._deck_files():
+            name = unquote(file[:-len(".json")])
+            if file not in listed and name not in decks:
+                self._files[name] = file
+                decks.add_unloaded(name)
+        self._migrated = True
+
+    def _migrate_json(self):
+        print(f"{self.json_file}를 읽어 덱별 파일로 나눠 저장합니다.")
+        app_data = JsonBackend(self.json_file, self.journal_file)._read_snapshot()
+        if app_data is None:
+            return None
+        decks = app_data.get("decks", {})
+        app_data["decks"] = LazyDecks(list(decks), self._load_deck)
+        for name, deck in decks.items():
+            app_data["decks"][name] = deck
+        self._files, self._summaries, self._written = {}, {}, {}
+        self._migrated = True
+        return app_data
+
+    def _deck_path(self, deck_name):
+        return os.path.join(self.deck_dir, self._files[deck_name])
+
+    @staticmethod
+    def _parse_deck(raw):
+        deck = json.loads(raw)
+        if not isinstance(deck, dict):
+            raise ValueError("덱 구조가 올바르지 않습니다.")
+        return deck
+
+    def _load_deck(self, deck_name):
+        """
+        덱 파일을 읽고, 그 덱에 쌓여 있던 저널 기록을 적용합니다.
+        깨진 파일은 .corrupt로 옮겨 두고 이전 세대(.1, .2, ...)에서 복구합니다. 모든 세대가 깨졌으면
+        빈 덱으로 열되, 이번 실행에서는 그 덱 파일을 다시 쓰지 않습니다.
+        """
+        candidates = _generations(self._deck_path(deck_name))
+        existed = any(map(os.path.exists, candidates))
+        found = _read_first(candidates, self._parse_deck)
+        if found is None:
+            if existed:
+                print(f"'{deck_name}' 덱 파일을 모두 읽을 수 없어 빈 덱으로 엽니다. 이 덱은 저장하지 않습니다.")
+                self._unreadable.add(deck_name)
+            deck = {"settings": {}, "words": []}
+        else:
+            path, raw, deck = found
+            if path == candidates[0]:
+                self._written[deck_name] = (len(raw), zlib.crc32(raw))
+            else:
+                print(f"'{deck_name}' 덱을 {path}에서 복구했습니다.")
+        self._apply_journal(deck_name, deck, self._pending.pop(deck_name, []))
+        return deck
+
+    # --- 저널 ---
+    def _replay_journal(self, app_data, path):
+        """저널 기록을 덱별로 모아 두었다가, 이미 읽은 덱에는 바로, 나머지는 덱을 읽을 때 적용합니다."""
+        if not os.path.exists(path):
+            return 0
+        decks = app_data.get("decks", {})
+        count = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 종료되어 잘린 마지막 줄은 건너뜁니다.
+                    continue
+                if record.get("deck") in decks:
+                    self._pending.setdefault(record["deck"], []).append(record)
+                    count += 1
+        for name in [name for name in self._pending if decks.is_loaded(name)]:
+            self._apply_journal(name, decks[name], self._pending.pop(name))
+        return count
+
+    def _apply_journal(self, deck_name, deck, records):
+        if not records:
+            return
+        self._replayed.add(deck_name)
+        words = {w["word"]: w for w in deck.get("words", [])}
+        for record in records:
+            entry = words.get(record.get("word"))
+            if entry is not None:
+                data_manager.apply_journal_record(entry, record)
+
+    # --- 쓰기 ---
+    def deck_summary(self, deck_name):
+        return self._summaries.get(deck_name)
+
+    def _file_for(self, deck_name, taken):
+        file = self._files.get(deck_name)
+        if file is None:
+            # 대소문자를 구분하지 않는 파일 시스템에서도 겹치지 않게 함
+            used = {f.casefold() for f in [*self._files.values(), *taken]}
+            file = quote(deck_name, safe="") + ".json"
+            if file.casefold() in used:
+                # 모든 글자를 %XX로 바꾸면 대소문자만 다른 이름도 파일 이름이 달라지고, 이름은 그대로 되살릴 수 있음
+                file = "".join(f"%{b:02X}" for b in deck_name.encode("utf-8")) + ".json"
+        return file
+
+    def encode(self, app_data, dirty_decks=None):
+        """
+        저장할 내용(매니페스트 + 바뀐 덱 파일)을 만듭니다. (DataManager.lock 안에서 호출)
+        dirty_decks(None이면 읽어 둔 모든 덱)와 저널 기록을 적용한 덱, 아직 파일에 쓰지 않은 덱만 다시 인코딩합니다.
+        저널 기록이 남은 덱은 저널을 비우기 전에 읽어서 함께 저장합니다.
+        """
+        decks = app_data.get("decks", {})
+        for name in list(self._pending):
+            if name in decks:
+                decks[name] # 읽으면서 저널 기록이 적용됨
+        self._pending.clear()
+
+        files, summaries, changed = {}, {}, {}
+        for name in decks:
+            files[name] = self._file_for(name, files.values())
+            if decks.is_loaded(name) and name not in self._unreadable:
+                deck = decks[name]
+                summaries[name] = {"word_count": len(deck.get("words", []))}
+                if (dirty_decks is not None and name not in dirty_decks and name not in self._replayed
+                        and name in self._written and files[name] == self._files.get(name)):
+                    continue
+                data = _encode(plain_deck(deck))
+                signature = (len(data), zlib.crc32(data))
+                if self._written.get(name) != signature or files[name] != self._files.get(name):
+                    changed[name] = (data, signature)
+            elif name in self._summaries:
+                summaries[name] = self._summaries[name]
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "decks": [{"name": name, "file": files[name], **summaries.get(name, {})} for name in decks],
+            "app": {k: v for k, v in app_data.items() if k != "decks"},
+        }
+        removed = [file for name, file in self._files.items() if name not in files]
+        return {"manifest": _encode(manifest), "decks": changed, "files": files, "summaries": summaries,
+                "removed": removed}
+
+    def write_snapshot(self, data):
+        """바뀐 덱 파일 -> 매니페스트 -> 삭제된 덱 파일 순으로 반영해, 중간에 종료되어도 매니페스트가 가리키는 파일은 온전합니다."""
+        os.makedirs(self.deck_dir, exist_ok=True)
+        for name, (deck_data, signature) in data["decks"].items():
+            _write_atomic(os.path.join(self.deck_dir, data["files"][name]), deck_data)
+            self._written[name] = signature
+        _fsync_dir(self.deck_dir)
+
+        if data["manifest"] != self._manifest:
+            _write_atomic(self.data_file, data["manifest"])
+            _fsync_dir(os.path.dirname(self.data_file))
+            self._manifest = data["manifest"]
+        self._files = data["files"]
+        self._summaries = data["summaries"]
+
+        for file in data["removed"]:
+            for path in _generations(os.path.join(self.deck_dir, file)):
+                if os.path.exists(path):
+                    os.remove(path)
+        for name in [name for name in self._written if name not in self._files]:
+            del self._written[name]
+        self._replayed.clear()
+        self._unreadable &= set(self._files)
+        # 스냅샷에 반영된 이전 저널은 더 이상 필요 없습니다.
+        if os.path.exists(self.journal_file + ".old"):
+            os.remove(self.journal_file + ".old")
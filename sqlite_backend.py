@@ -0,0 +1,372 @@
+import json
+import os
+import sqlite3
+import threading
+
+from data_manager import LazyDecks, default_app_data, loaded_deck_items
+from models import ReviewStats, WordRecord, to_epoch
+
+DB_FILE = "data/app_data.db"
+JSON_FILE = "data/app_data.json"
+LEGACY_WORDS_FILE = "data/words.json"
+LEGACY_DECK_NAME = "기본 단어장"
+# 덱이 생기기 전의 words.json은 영어 → 한국어 학습 전용이었습니다.
+LEGACY_MODE_MAP = {"eng_to_kor": "study_to_native", "kor_to_eng": "native_to_study"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS decks (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL,
+    settings TEXT NOT NULL DEFAULT '{}',
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS words (
+    id INTEGER PRIMARY KEY,
+    deck_id INTEGER NOT NULL REFERENCES decks(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    meaning TEXT NOT NULL DEFAULT '[]',
+    example TEXT,
+    created_at INTEGER,
+    extra TEXT,
+    UNIQUE (deck_id, word)
+);
+CREATE TABLE IF NOT EXISTS review_stats (
+    word_id INTEGER NOT NULL REFERENCES words(id) ON DELETE CASCADE,
+    deck_id INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    correct_cnt INTEGER NOT NULL DEFAULT 0,
+    incorrect_cnt INTEGER NOT NULL DEFAULT 0,
+    prob_mode TEXT,
+    last_reviewed INTEGER,
+    next_review INTEGER,
+    extra TEXT,
+    PRIMARY KEY (word_id, mode)
+);
+CREATE INDEX IF NOT EXISTS idx_review_due ON review_stats (deck_id, mode, next_review);
+CREATE TABLE IF NOT EXISTS study_log (
+    deck_id INTEGER NOT NULL REFERENCES decks(id) ON DELETE CASCADE,
+    date TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (deck_id, date)
+);
+"""
+
+WORD_KEYS = ("word", "meaning", "example", "created_at", "review_stats")
+# json.dumps(..., ensure_ascii=False)와 같은 결과. 단어마다 부르므로 인코더를 한 번만 만듦
+_dumps = json.JSONEncoder(ensure_ascii=False).encode
+STATS_KEYS = ("correct_cnt", "incorrect_cnt", "prob_mode", "last_reviewed", "next_review")
+
+def _extra_json(data, known_keys):
+    """스키마에 없는 키는 잃어버리지 않도록 JSON으로 따로 보관합니다."""
+    extra = {k: v for k, v in data.items() if k not in known_keys}
+    return json.dumps(extra, ensure_ascii=False) if extra else None
+
+class SqliteBackend:
+    """
+    SQLite 데이터베이스에 덱/단어/복습 통계/학습 기록을 테이블로 저장하는 저장소.
+    덱은 처음 열 때 읽어오고, 복습 결과는 해당 단어의 행 하나만 갱신합니다.
+    """
+    def __init__(self, db_file=DB_FILE):
+        self.db_file = db_file
+        self._conn = None
+        # GUI 스레드와 백그라운드 저장이 같은 연결을 쓰므로 직접 직렬화합니다.
+        self._db_lock = threading.RLock()
+
+    def load(self):
+        """덱 이름 목록만 읽고, 각 덱은 처음 접근할 때 읽어옵니다."""
+        is_new = not os.path.exists(self.db_file)
+        self._connect()
+        if is_new and os.path.exists(JSON_FILE):
+            # 기존 JSON 데이터가 있으면 처음 한 번 옮겨옵니다.
+            migrate_json_to_sqlite(self.db_file, JSON_FILE)
+
+        with self._db_lock:
+            rows = self._conn.execute("SELECT name FROM decks ORDER BY position").fetchall()
+            meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+
+        app_data = default_app_data()
+        for key, value in meta.items():
+            app_data[key] = json.loads(value)
+        app_data["decks"] = LazyDecks([name for (name,) in rows], self._load_deck)
+        return app_data
+
+    def needs_compaction(self):
+        return False
+
+    def has_pending_changes(self):
+        return False
+
+    def deck_summary(self, deck_name):
+        """덱을 읽지 않고 단어 수만 셉니다."""
+        with self._db_lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM words w JOIN decks d ON d.id = w.deck_id WHERE d.name = ?",
+                (deck_name,)).fetchone()
+        return {"word_count": count}
+
+    def prepare_snapshot(self, app_data, dirty_decks=None):
+        """
+        메모리에 올라온 덱 중 바뀐 덱(dirty_decks, None이면 모두)만 행 목록으로 복사합니다.
+        (DataManager.lock 안에서 호출)
+        """
+        decks = app_data.get("decks", {})
+        loaded = [(name, _deck_rows(deck)) for name, deck in loaded_deck_items(decks)
+                  if dirty_decks is None or name in dirty_decks]
+        meta = {k: json.dumps(v, ensure_ascii=False) for k, v in app_data.items() if k != "decks"}
+        return {"deck_names": list(decks.keys()), "loaded": loaded, "meta": meta}
+
+    def write_snapshot(self, snapshot):
+        """바뀐 덱의 바뀐 행만 쓰고, 읽지 않았거나 바뀌지 않은 덱은 건드리지 않습니다."""
+        with self._db_lock, self._conn:
+            for key, value in snapshot["meta"].items():
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+            existing = dict(self._conn.execute("SELECT name, id FROM decks").fetchall())
+            deck_names = snapshot["deck_names"]
+            for name in set(existing) - set(deck_names):
+                self._conn.execute("DELETE FROM decks WHERE id = ?", (existing[name],))
+            for position, name in enumerate(deck_names):
+                if name in existing:
+                    self._conn.execute("UPDATE decks SET position = ? WHERE id = ?", (position, existing[name]))
+
+            for name, rows in snapshot["loaded"]:
+                _write_deck(self._conn, name, deck_names.index(name), rows)
+
+    def record_reviews(self, records):
+        """(덱 이름, 단어, 학습 모드, 복습 통계) 목록의 행들을 한 트랜잭션으로 갱신합니다."""
+        params = [(mode, *_stats_row(stats), deck_name, word) for deck_name, word, mode, stats in records]
+        with self._db_lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO review_stats
+                    (word_id, deck_id, mode, correct_cnt, incorrect_cnt, prob_mode, last_reviewed, next_review, extra)
+                SELECT w.id, w.deck_id, ?, ?, ?, ?, ?, ?, ?
+                FROM words w JOIN decks d ON d.id = w.deck_id
+                WHERE d.name = ? AND w.word = ?
+                ON CONFLICT (word_id, mode) DO UPDATE SET
+                    correct_cnt = excluded.correct_cnt,
+                    incorrect_cnt = excluded.incorrect_cnt,
+                    prob_mode = excluded.prob_mode,
+                    last_reviewed = excluded.last_reviewed,
+                    next_review = excluded.next_review,
+                    extra = excluded.extra
+                """,
+                params,
+            )
+        return False
+
+    def close(self):
+        with self._db_lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(SCHEMA)
+
+    def _load_deck(self, deck_name):
+        """덱 하나의 데이터를 기존 JSON과 같은 구조로 읽어옵니다. 단어는 epoch 시각 그대로 WordRecord로 만듭니다."""
+        with self._db_lock:
+            conn = self._conn
+            deck_id, settings, extra = conn.execute(
+                "SELECT id, settings, extra FROM decks WHERE name = ?", (deck_name,)).fetchone()
+
+            stats_by_word = {}
+            for word_id, mode, correct, incorrect, prob_mode, last, nxt, stats_extra in conn.execute(
+                    "SELECT word_id, mode, correct_cnt, incorrect_cnt, prob_mode, last_reviewed, next_review, extra "
+                    "FROM review_stats WHERE deck_id = ?", (deck_id,)):
+                stats = ReviewStats(correct, incorrect, prob_mode, last, nxt,
+                                    json.loads(stats_extra) if stats_extra else None)
+                stats_by_word.setdefault(word_id, {})[mode] = stats
+
+            words = []
+            for word_id, word, meaning, example, created_at, word_extra in conn.execute(
+                    "SELECT id, word, meaning, example, created_at, extra FROM words "
+                    "WHERE deck_id = ? ORDER BY position", (deck_id,)):
+                extra = json.loads(word_extra) if word_extra else {}
+                words.append(WordRecord(word, json.loads(meaning), example, created_at,
+                                        stats_by_word.get(word_id, {}), extra.pop("id", None), extra or None))
+
+            study_log = {date: json.loads(data) for date, data in conn.execute(
+                "SELECT date, data FROM study_log WHERE deck_id = ? ORDER BY date", (deck_id,))}
+
+        deck = {"settings": json.loads(settings), "words": words, "study_log": study_log}
+        if extra:
+            deck.update(json.loads(extra))
+        return deck
+
+def _attribute_extra_json(data, extra):
+    # _extra_json과 같은 결과를 속성에서 바로 만듦 (Mapping 방식으로 훑으면 단어마다 몇 배 느림)
+    if data.extra:
+        extra.update(data.extra)
+    return _dumps(extra) if extra else None
+
+def _stats_row(stats):
+    if isinstance(stats, ReviewStats):
+        # 이미 epoch 정수이므로 문자열 변환 없이 그대로 씀
+        extra = {key: getattr(stats, key) for key in ReviewStats.SCHEDULER_FIELDS if getattr(stats, key) is not None}
+        return (stats.correct_cnt, stats.incorrect_cnt, stats.prob_mode, stats.last_reviewed, stats.next_review,
+                _attribute_extra_json(stats, extra))
+    return (
+        stats.get("correct_cnt", 0),
+        stats.get("incorrect_cnt", 0),
+        stats.get("prob_mode"),
+        to_epoch(stats.get("last_reviewed")),
+        to_epoch(stats.get("next_review")),
+        _extra_json(stats, STATS_KEYS),
+    )
+
+def _deck_rows(deck):
+    """덱 딕셔너리를 테이블에 넣을 행 목록으로 바꿉니다."""
+    words = []
+    for entry in deck.get("words", []):
+        if isinstance(entry, WordRecord):
+            words.append((
+                entry.word,
+                _dumps(entry.meaning),
+                entry.example,
+                entry.created_at,
+                _attribute_extra_json(entry, {} if entry.id is None else {"id": entry.id}),
+                [(mode, _stats_row(s)) for mode, s in entry.review_stats.items()],
+            ))
+            continue
+        stats = [(mode, _stats_row(s)) for mode, s in entry.get("review_stats", {}).items()]
+        words.append((
+            entry["word"],
+            json.dumps(entry.get("meaning", []), ensure_ascii=False),
+            entry.get("example"),
+            to_epoch(entry.get("created_at")),
+            _extra_json(entry, WORD_KEYS),
+            stats,
+        ))
+    study_log = [(date, json.dumps(log, ensure_ascii=False)) for date, log in deck.get("study_log", {}).items()]
+    return {
+        "settings": json.dumps(deck.get("settings", {}), ensure_ascii=False),
+        "extra": _extra_json(deck, ("settings", "words", "study_log")),
+        "words": words,
+        "study_log": study_log,
+    }
+
+def _write_deck(conn, deck_name, position, rows):
+    """
+    덱 하나를 데이터베이스의 행과 비교해서, 바뀐 행만 INSERT ... ON CONFLICT DO UPDATE로 쓰고
+    없어진 행은 지웁니다. 덱 설정은 덱 행에 따로 씁니다. (트랜잭션 안에서 호출)
+    """
+    conn.execute(
+        "INSERT INTO decks (name, position, settings, extra) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (name) DO UPDATE SET position = excluded.position, "
+        "settings = excluded.settings, extra = excluded.extra",
+        (deck_name, position, rows["settings"], rows["extra"]),
+    )
+    (deck_id,) = conn.execute("SELECT id FROM decks WHERE name = ?", (deck_name,)).fetchone()
+
+    existing = {word: (word_id, (position, meaning, example, created_at, extra))
+                for word_id, word, position, meaning, example, created_at, extra in conn.execute(
+                    "SELECT id, word, position, meaning, example, created_at, extra FROM words WHERE deck_id = ?",
+                    (deck_id,))}
+    existing_stats = {(word_id, mode): tuple(row) for word_id, mode, *row in conn.execute(
+        "SELECT word_id, mode, correct_cnt, incorrect_cnt, prob_mode, last_reviewed, next_review, extra "
+        "FROM review_stats WHERE deck_id = ?", (deck_id,))}
+
+    stats_rows = []
+    last_position = -1
+    for word, meaning, example, created_at, extra, stats in rows["words"]:
+        word_id, old = existing.pop(word, (None, None))
+        # 순서가 그대로인 단어는 이전 위치를 유지해서, 중간 단어를 지워도 뒤의 행을 모두 고쳐 쓰지 않게 함
+        position = old[0] if old is not None and old[0] > last_position else last_position + 1
+        last_position = position
+        values = (position, meaning, example, created_at, extra)
+        if values != old:
+            cursor = conn.execute(
+                "INSERT INTO words (deck_id, word, position, meaning, example, created_at, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (deck_id, word) DO UPDATE SET position = excluded.position, "
+                "meaning = excluded.meaning, example = excluded.example, "
+                "created_at = excluded.created_at, extra = excluded.extra",
+                (deck_id, word, *values),
+            )
+            if word_id is None:
+                word_id = cursor.lastrowid
+        for mode, row in stats:
+            if existing_stats.pop((word_id, mode), None) != row:
+                stats_rows.append((word_id, deck_id, mode, *row))
+    conn.executemany(
+        "INSERT INTO review_stats "
+        "(word_id, deck_id, mode, correct_cnt, incorrect_cnt, prob_mode, last_reviewed, next_review, extra) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT (word_id, mode) DO UPDATE SET correct_cnt = excluded.correct_cnt, "
+        "incorrect_cnt = excluded.incorrect_cnt, prob_mode = excluded.prob_mode, "
+        "last_reviewed = excluded.last_reviewed, next_review = excluded.next_review, extra = excluded.extra",
+        stats_rows,
+    )
+    # 목록에 없는 단어(와 그 복습 통계)와 없어진 학습 모드의 통계를 지움
+    conn.executemany("DELETE FROM words WHERE id = ?", [(word_id,) for word_id, _ in existing.values()])
+    conn.executemany("DELETE FROM review_stats WHERE word_id = ? AND mode = ?", list(existing_stats))
+
+    study_log = dict(conn.execute("SELECT date, data FROM study_log WHERE deck_id = ?", (deck_id,)).fetchall())
+    conn.executemany(
+        "INSERT INTO study_log (deck_id, date, data) VALUES (?, ?, ?) "
+        "ON CONFLICT (deck_id, date) DO UPDATE SET data = excluded.data",
+        [(deck_id, date, data) for date, data in rows["study_log"] if study_log.pop(date, None) != data],
+    )
+    conn.executemany("DELETE FROM study_log WHERE deck_id = ? AND date = ?",
+                     [(deck_id, date) for date in study_log])
+
+def _convert_legacy_words(words):
+    """덱이 없던 시절 words.json의 단어 목록을 현재 단어 구조로 바꿉니다."""
+    converted = []
+    for entry in words:
+        entry = dict(entry)
+        entry["review_stats"] = {
+            LEGACY_MODE_MAP.get(mode, mode): stats
+            for mode, stats in entry.get("review_stats", {}).items()
+        }
+        converted.append(entry)
+    return converted
+
+def migrate_json_to_sqlite(db_file=DB_FILE, json_file=JSON_FILE, legacy_words_file=LEGACY_WORDS_FILE):
+    """
+    기존 app_data.json(과 덱 도입 이전의 words.json)을 SQLite 데이터베이스로 옮깁니다.
+    이미 같은 이름의 덱이 있으면 JSON 쪽 내용으로 덮어씁니다.
+    """
+    app_data = default_app_data()
+    if json_file and os.path.exists(json_file):
+        with open(json_file, 'r', encoding='utf-8') as f:
+            app_data = json.load(f)
+
+    decks = app_data.setdefault("decks", {})
+    if legacy_words_file and os.path.exists(legacy_words_file) and LEGACY_DECK_NAME not in decks:
+        with open(legacy_words_file, 'r', encoding='utf-8') as f:
+            legacy_words = json.load(f)
+        decks[LEGACY_DECK_NAME] = {
+            "settings": {"native_lang": "한국어", "study_lang": "English"},
+            "words": _convert_legacy_words(legacy_words),
+            "study_log": {},
+        }
+
+    backend = SqliteBackend(db_file)
+    backend._connect()
+    with backend._db_lock, backend._conn:
+        positions = backend._conn.execute("SELECT COUNT(*) FROM decks").fetchone()[0]
+        for key, value in app_data.items():
+            if key != "decks":
+                backend._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                      (key, json.dumps(value, ensure_ascii=False)))
+        for offset, (deck_name, deck) in enumerate(decks.items()):
+            _write_deck(backend._conn, deck_name, positions + offset, _deck_rows(deck))
+    backend.close()
+    return list(decks.keys())
+
+if __name__ == "__main__":
+    migrated = migrate_json_to_sqlite()
+    print(f"{DB_FILE}로 {len(migrated)}개의 덱을 옮겼습니다: {', '.join(migrated)}")
@@ -0,0 +1,282 @@
+import json
+import os
+import threading
+from datetime import date, datetime, time, timedelta
+
+HISTORY_LOG = "data/study_history.log"
+ROLLUP_FILE = "data/study_history.json"
+ROLLUP_VERSION = 1
+# 모든 덱을 합친 집계의 키 (덱 이름은 빈 문자열일 수 없음)
+ALL_DECKS = ""
+COUNT_KEYS = ("studied_word_count", "correct_count", "incorrect_count", "session_count", "study_seconds")
+PERIODS = ("day", "week", "month")
+# 같은 날 다시 푼 단어를 세지 않기 위해 최근 며칠의 단어 ID 집합만 메모리와 요약 파일에 둡니다.
+WORD_SET_DAYS = 2
+
+def empty_counts():
+    return {key: 0 for key in COUNT_KEYS}
+
+def period_keys(day):
+    """날짜(date)가 속한 일/주(ISO)/월 키"""
+    year, week, _ = day.isocalendar()
+    return {"day": day.isoformat(), "week": f"{year}-W{week:02d}", "month": f"{day.year}-{day.month:02d}"}
+
+class StudyHistory:
+    """
+    학습 세션과 답 하나하나를 시간순으로 덧붙이기만 하는 기록(study_history.log, 한 줄에 JSON 하나)과,
+    그 기록으로 미리 계산해 둔 덱별/전체 일/주/월 합계.
+      - 답:   {"k": "a", "d": 덱, "w": 단어 ID, "m": 학습 모드, "t": epoch 초, "ok": 정답 여부}
+      - 세션: {"k": "s", "d": 덱, "m": 학습 모드, "start": epoch 초, "end": epoch 초, "c": 정답 수, "i": 오답 수}
+        (이전 전체 학습 기록 data/study_log.json에서 옮긴 세션은 덱이 없어 d가 ALL_DECKS이고 전체 합계에만 더함)
+      - 이전 형식의 날짜별 기록: {"k": "day", "d": 덱, "date": "YYYY-MM-DD", "n": 단어 수, "c": 정답 수, "i": 오답 수}
+      - 덱 삭제: {"k": "drop", "d": 덱}
+    '학습 단어 수'는 하루에 처음 푼 단어만 세며(단어 ID 집합), 주/월 합계는 일별 값의 합입니다.
+    합계는 ROLLUP_FILE에 기록 파일의 어디까지 반영했는지와 함께 저장하므로, 시작할 때는 그 뒤만 읽습니다.
+    """
+    def __init__(self, log_file=HISTORY_LOG, rollup_file=ROLLUP_FILE):
+        self.log_file = log_file
+        self.rollup_file = rollup_file
+        self._lock = threading.RLock()
+        self._pending = [] # 아직 파일에 쓰지 않은 줄
+        self._offset = 0 # 합계에 반영한 기록 파일의 바이트 수
+        self._reset_rollups()
+
+    def _reset_rollups(self):
+        self.rollups = {period: {} for period in PERIODS} # 기간 -> 덱 -> 기간 키 -> 합계
+        self._totals = {} # 덱 -> 합계
+        self._word_sets = {} # 날짜 -> 덱 -> 단어 ID 집합 (최근 WORD_SET_DAYS일)
+
+    # --- 읽기/저장 ---
+    def exists(self):
+        return os.path.exists(self.log_file) or os.path.exists(self.rollup_file)
+
+    def load(self):
+        """저장된 합계를 읽고 그 뒤에 덧붙은 기록만 반영합니다. 합계 파일이 없거나 맞지 않으면 처음부터 다시 계산합니다."""
+        with self._lock:
+            self._reset_rollups()
+            self._offset = 0
+            try:
+                with open(self.rollup_file, "r", encoding="utf-8") as f:
+                    saved = json.load(f)
+                if saved.get("version") == ROLLUP_VERSION and saved["offset"] <= self._log_size():
+                    word_sets = {day: {deck: set(ids) for deck, ids in decks.items()}
+                                 for day, decks in saved["word_sets"].items()}
+                    self.rollups, self._totals = saved["rollups"], saved["totals"]
+                    self._word_sets, self._offset = word_sets, saved["offset"]
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+            self._replay()
+
+    def rebuild(self):
+        """기록 파일 전체를 다시 읽어 합계를 새로 계산합니다."""
+        with self._lock:
+            self.flush()
+            self._reset_rollups()
+            self._offset = 0
+            self._replay()
+
+    def _log_size(self):
+        try:
+            return os.path.getsize(self.log_file)
+        except FileNotFoundError:
+            return 0
+
+    def _replay(self):
+        if not os.path.exists(self.log_file):
+            return
+        with open(self.log_file, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            # 기록 도중 종료되어 잘린 마지막 줄은 지워서, 다음 기록이 그 뒤에 이어 붙지 않게 함
+            with open(self.log_file, "r+b") as f:
+                f.truncate(self._offset + end)
+        for line in data[:end].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue
+        self._offset += end
+
+    def flush(self):
+        """쌓아 둔 기록을 파일 끝에 붙이고 디스크에 내려 씁니다."""
+        with self._lock:
+            if not self._pending:
+                return
+            lines, self._pending = self._pending, []
+            os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+            with open(self.log_file, "ab") as f:
+                f.write("".join(lines).encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                self._offset = f.tell()
+
+    def save(self):
+        """기록을 내려 쓰고, 지금까지의 합계를 어디까지 반영했는지와 함께 저장합니다."""
+        with self._lock:
+            self.flush()
+            data = json.dumps({
+                "version": ROLLUP_VERSION,
+                "offset": self._offset,
+                "rollups": self.rollups,
+                "totals": self._totals,
+                "word_sets": {day: {deck: sorted(ids) for deck, ids in decks.items()}
+                              for day, decks in self._word_sets.items()},
+            }, ensure_ascii=False, separators=(",", ":"))
+        temp_file = self.rollup_file + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.rollup_file)
+
+    def clear(self):
+        """기록과 합계를 모두 지웁니다. (백업 복원용)"""
+        with self._lock:
+            self._pending = []
+            for path in (self.log_file, self.rollup_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._reset_rollups()
+            self._offset = 0
+
+    # --- 기록 ---
+    def _append(self, event):
+        with self._lock:
+            self._pending.append(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._apply(event)
+
+    def record_answer(self, deck_name, word_id, mode, timestamp, is_correct):
+        self._append({"k": "a", "d": deck_name, "w": word_id, "m": mode, "t": int(timestamp), "ok": bool(is_correct)})
+
+    def record_session(self, deck_name, mode, start, end, correct, incorrect):
+        """세션 하나(시작/끝 시각)를 기록합니다. 정답/오답 수는 답마다 이미 더해졌으므로 세션 수와 시간만 더합니다."""
+        self._append({"k": "s", "d": deck_name, "m": mode, "start": int(start), "end": int(end),
+                      "c": correct, "i": incorrect})
+
+    def import_daily(self, deck_name, day, counts):
+        """이전 형식(덱의 study_log)의 하루 합계를 기록으로 옮깁니다."""
+        self._append({"k": "day", "d": deck_name, "date": day, "n": counts.get("studied_word_count", 0),
+                      "c": counts.get("correct_count", 0), "i": counts.get("incorrect_count", 0)})
+
+    def import_sessions(self, study_log):
+        """
+        이전 형식의 전체 학습 기록(data/study_log.json: 날짜 -> {"study_sessions": [{"start": "HH:MM", "end": "HH:MM"}],
+        "study_minutes": 분})의 세션을 덱 없는 세션 기록으로 옮깁니다. 모두 읽은 뒤에 한꺼번에 덧붙입니다.
+        이전 형식은 세션마다 분 단위로 올려 더했으므로, 세션 시간의 합이 study_minutes보다 짧으면 마지막 세션을 늘려 맞춥니다.
+        """
+        events = []
+        for day, log in sorted(study_log.items()):
+            moment = date.fromisoformat(day)
+            def epoch(text):
+                hour, minute = map(int, text.split(":"))
+                return int(datetime.combine(moment, time(hour, minute)).timestamp())
+
+            spans = []
+            for session in log.get("study_sessions", []):
+                start, end = epoch(session["start"]), epoch(session["end"])
+                spans.append([start, end if end >= start else end + 86400]) # 자정을 넘긴 세션
+            missing = log.get("study_minutes", 0) * 60 - sum(end - start for start, end in spans)
+            if missing > 0:
+                if not spans:
+                    spans.append([epoch("00:00")] * 2)
+                spans[-1][1] += missing
+            events.extend({"k": "s", "d": ALL_DECKS, "m": None, "start": start, "end": end, "c": 0, "i": 0}
+                          for start, end in spans)
+        for event in events:
+            self._append(event)
+        return len(events)
+
+    def remove_deck(self, deck_name):
+        """삭제된 덱의 합계를 빼고, 다시 계산할 때도 빠지도록 기록을 남깁니다."""
+        self._append({"k": "drop", "d": deck_name})
+
+    # --- 합계 갱신 ---
+    def _apply(self, event):
+        kind, deck_name = event["k"], event["d"]
+        if kind == "a":
+            moment = datetime.fromtimestamp(event["t"])
+            counts = {"correct_count": 1} if event["ok"] else {"incorrect_count": 1}
+            if self._add_word(moment.date().isoformat(), deck_name, event["w"]):
+                counts["studied_word_count"] = 1
+            self._add(deck_name, moment.date(), counts)
+        elif kind == "s":
+            self._add(deck_name, datetime.fromtimestamp(event["start"]).date(),
+                      {"session_count": 1, "study_seconds": max(0, event["end"] - event["start"])})
+        elif kind == "day":
+            self._add(deck_name, date.fromisoformat(event["date"]),
+                      {"studied_word_count": event["n"], "correct_count": event["c"], "incorrect_count": event["i"]})
+        elif kind == "drop":
+            self._drop(deck_name)
+
+    def _add_word(self, day, deck_name, word_id):
+        # 오늘 처음 푼 단어인지 (set이므로 O(1))
+        words = self._word_sets.get(day)
+        if words is None:
+            words = self._word_sets[day] = {}
+            for old in sorted(self._word_sets)[:-WORD_SET_DAYS]:
+                del self._word_sets[old]
+        seen = words.setdefault(deck_name, set())
+        if word_id in seen:
+            return False
+        seen.add(word_id)
+        return True
+
+    def _add(self, deck_name, day, counts, sign=1):
+        keys = period_keys(day)
+        for name in dict.fromkeys((deck_name, ALL_DECKS)): # 덱 없는 기록은 전체 합계에 한 번만 더함
+            for period in PERIODS:
+                bucket = self.rollups[period].setdefault(name, {}).setdefault(keys[period], empty_counts())
+                for key, value in counts.items():
+                    bucket[key] += sign * value
+            total = self._totals.setdefault(name, empty_counts())
+            for key, value in counts.items():
+                total[key] += sign * value
+
+    def _drop(self, deck_name):
+        for period in PERIODS:
+            buckets = self.rollups[period].pop(deck_name, {})
+            everything = self.rollups[period].get(ALL_DECKS, {})
+            for key, counts in buckets.items():
+                for name, value in counts.items():
+                    everything[key][name] -= value
+        totals = self._totals.pop(deck_name, empty_counts())
+        everything = self._totals.setdefault(ALL_DECKS, empty_counts())
+        for name, value in totals.items():
+            everything[name] -= value
+        for words in self._word_sets.values():
+            words.pop(deck_name, None)
+
+    # --- 조회 ---
+    def daily_log(self, deck_name=None):
+        """덱(없으면 전체)의 날짜("YYYY-MM-DD")별 합계를 복사 없이 반환합니다."""
+        return self.rollups["day"].get(deck_name or ALL_DECKS, {})
+
+    def totals(self, deck_name=None):
+        """덱(없으면 전체)의 누적 학습 단어 수, 정답 수, 오답 수, 세션 수, 학습 시간(초)을 반환합니다."""
+        return self._totals.get(deck_name or ALL_DECKS, empty_counts())
+
+    def period_counts(self, period, day, deck_name=None):
+        """day(date)가 속한 일/주/월("day", "week", "month")의 합계를 반환합니다."""
+        return self.rollups[period].get(deck_name or ALL_DECKS, {}).get(period_keys(day)[period], empty_counts())
+
+    def daily_range(self, start, end, deck_name=None):
+        """start~end(date, 끝 포함) 중 기록이 있는 날의 {날짜: 합계}. 전체 기록이 아니라 날 수만큼만 봅니다."""
+        log = self.daily_log(deck_name)
+        result = {}
+        day = start
+        while day <= end:
+            counts = log.get(day.isoformat())
+            if counts is not None:
+                result[day.isoformat()] = counts
+            day += timedelta(days=1)
+        return result
+
+    def to_study_logs(self):
+        """덱별 날짜 합계를 이전 형식(덱의 study_log)으로 반환합니다. (JSON 백업용)"""
+        return {
+            deck_name: {day: {key: counts[key] for key in ("studied_word_count", "correct_count", "incorrect_count")}
+                        for day, counts in days.items()}
+            for deck_name, days in self.rollups["day"].items() if deck_name != ALL_DECKS
+        }
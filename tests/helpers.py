@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from data_manager import DataManager
+
+NOW = 1_700_000_000
+
+class StorageTestCase(unittest.TestCase):
+    """임시 디렉터리를 작업 디렉터리로 해서 data/ 아래 파일만 씁니다."""
+    def setUp(self):
+        # 정리는 나중에 등록한 것부터 하므로, 열어 둔 DataManager를 모두 닫은 뒤에 디렉터리를 지움
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        os.makedirs("data")
+
+    def open(self, backend):
+        data_manager = DataManager(backend)
+        self.addCleanup(data_manager.close)
+        return data_manager
+
+    def fill(self, data_manager):
+        data_manager.add_deck("영단어")
+        data_manager.add_deck("日本語")
+        for i in range(5):
+            data_manager.upsert_word("영단어", f"word{i}", [f"뜻{i}", "공통"], f"example {i}", now=NOW + i)
+        data_manager.upsert_word("日本語", "酒", ["술"], now=NOW)
+        data_manager.set_deck_scheduler("영단어", "sm2")
+        # 답 하나: 계산기 상태와 분 단위가 아닌 시각까지 그대로 남아야 함
+        self.answer(data_manager, "영단어", "word1", "study_to_native", True, NOW + 17)
+        data_manager.delete_word("영단어", "word3")
+        data_manager.save_data()
+
+    def answer(self, data_manager, deck_name, word, mode, is_correct, now):
+        entry = data_manager.get_word(deck_name, word)
+        data_manager.get_scheduler(deck_name).review(entry.review_stats[mode], is_correct, now)
+        data_manager.record_answer(deck_name, entry, mode, is_correct, now=now)
+        return entry
+
+    def snapshot(self, data_manager):
+        return {name: ([w.to_dict() for w in data_manager.iter_words(name)], data_manager.get_deck_settings(name))
+                for name in data_manager.get_deck_names()}
+
+    def check_round_trip(self, backend):
+        data_manager = self.open(backend)
+        self.fill(data_manager)
+        expected = self.snapshot(data_manager)
+        data_manager.close()
+
+        reopened = self.open(backend)
+        self.assertEqual(self.snapshot(reopened), expected)
+        self.assertEqual(reopened.count_words("영단어"), 4)
+        self.assertIsNone(reopened.get_word("영단어", "word3"))
+        stats = reopened.get_word("영단어", "word1").review_stats["study_to_native"]
+        self.assertEqual((stats.correct_cnt, stats.reps), (1, 1))
+        return reopened
@@ -0,0 +1,58 @@
+import random
+import unittest
+
+from answer_matcher import bounded_distance, find_near_miss, normalize
+
+def full_distance(a, b):
+    # 비교용: 인접 글자 뒤바꿈까지 포함한 편집 거리를 표 전체로 계산
+    d = [[i + j if i == 0 or j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1]
+
+class NormalizeTest(unittest.TestCase):
+    def test_case_width_and_spaces(self):
+        self.assertEqual(normalize("  Ｈｅｌｌｏ   World "), "hello world")
+
+    def test_accents_removed(self):
+        self.assertEqual(normalize("Café"), normalize("cafe"))
+
+    def test_katakana_folded_but_dakuten_kept(self):
+        self.assertEqual(normalize("サケ"), normalize("さけ"))
+        self.assertNotEqual(normalize("さけ"), normalize("さげ"))
+
+    def test_hangul_decomposed(self):
+        # 받침 하나 차이는 자모 한 글자 차이
+        self.assertEqual(bounded_distance(normalize("사과"), normalize("사곽"), 3), 1)
+
+class BoundedDistanceTest(unittest.TestCase):
+    def test_matches_full_table(self):
+        rng = random.Random(0)
+        for _ in range(3000):
+            a = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 8)))
+            b = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 8)))
+            limit = rng.randint(0, 4)
+            self.assertEqual(bounded_distance(a, b, limit), min(full_distance(a, b), limit + 1), (a, b, limit))
+
+    def test_transposition_is_one(self):
+        self.assertEqual(bounded_distance("receive", "recieve", 2), 1)
+
+    def test_over_limit(self):
+        self.assertEqual(bounded_distance("abcdefgh", "hgfedcba", 1), 2)
+        self.assertEqual(bounded_distance("short", "much longer answer", 2), 3)
+
+class FindNearMissTest(unittest.TestCase):
+    def test_closest_answer_within_ratio(self):
+        self.assertEqual(find_near_miss("aplpe", ["apple", "maple"]), "apple")
+
+    def test_short_answers_must_match(self):
+        self.assertIsNone(find_near_miss("cta", ["cat"]))
+
+    def test_far_answer_is_not_near(self):
+        self.assertIsNone(find_near_miss("banana", ["apple"]))
+
+if __name__ == "__main__":
+    unittest.main()
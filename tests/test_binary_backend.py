@@ -0,0 +1,131 @@
+import json
+import os
+import unittest
+
+import binary_backend
+from binary_backend import BinaryBackend
+from data_manager import DataManager
+from models import ReviewStats, WordRecord, plain_deck
+from question_prefetch import build_question
+from tests.helpers import NOW, StorageTestCase
+
+class BinaryBackendTest(StorageTestCase):
+    def test_round_trip(self):
+        self.check_round_trip("binary")
+
+    def test_journal_is_replayed_after_crash(self):
+        data_manager = DataManager("binary")
+        self.fill(data_manager)
+        data_manager.get_word("日本語", "酒") # 덱을 풀어 둠 (WordRecord)
+        entry = self.answer(data_manager, "日本語", "酒", "native_to_study", False, NOW + 120)
+        data_manager.flush_reviews(wait=True)
+        expected = entry.review_stats["native_to_study"].to_dict()
+        # 스냅샷을 쓰지 않고 종료된 것처럼 저널만 남김
+        data_manager._writer_stopping = True
+        data_manager.backend.close()
+        data_manager.history.save()
+
+        reopened = self.open("binary")
+        entry = reopened.get_word("日本語", "酒")
+        stats = entry.review_stats["native_to_study"]
+        self.assertIsInstance(stats, ReviewStats)
+        self.assertEqual(stats.to_dict(), expected)
+        # 다시 푼 답도 계산기와 문제 만들기에서 그대로 쓸 수 있어야 함
+        self.answer(reopened, "日本語", "酒", "native_to_study", True, NOW + 3600)
+        self.assertEqual(stats.correct_cnt, 1)
+        build_question(reopened, "日本語", "native_to_study", entry)
+
+    def test_converts_existing_json(self):
+        data_manager = self.open("json")
+        self.fill(data_manager)
+        expected = self.snapshot(data_manager)
+        data_manager.close()
+
+        converted = self.open("binary")
+        self.assertTrue(os.path.exists("data/app_data.bin"))
+        self.assertEqual(self.snapshot(converted), expected)
+
+    def test_recovers_previous_generation(self):
+        data_manager = self.open(BinaryBackend())
+        self.fill(data_manager)
+        expected = self.snapshot(data_manager)
+        data_manager.upsert_word("日本語", "水", ["물"], now=NOW)
+        data_manager.save_data()
+        data_manager.close()
+        with open("data/app_data.bin", "r+b") as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b"\xff\xff\xff") # 마지막 덱의 체크섬이 맞지 않게 됨
+
+        reopened = self.open("binary")
+        self.assertEqual(self.snapshot(reopened), expected)
+        self.assertTrue(os.path.exists("data/app_data.bin.corrupt"))
+
+    def test_recovers_from_truncated_snapshot(self):
+        data_manager = self.open(BinaryBackend())
+        self.fill(data_manager)
+        expected = self.snapshot(data_manager)
+        data_manager.upsert_word("日本語", "水", ["물"], now=NOW)
+        data_manager.save_data()
+        data_manager.close()
+        with open("data/app_data.bin", "r+b") as f:
+            f.truncate(10) # 버전 번호 중간에서 잘림 (struct.error)
+
+        reopened = self.open("binary")
+        self.assertEqual(self.snapshot(reopened), expected)
+        self.assertTrue(os.path.exists("data/app_data.bin.corrupt"))
+
+    def test_unread_words_are_written_back_unchanged(self):
+        data_manager = self.open("binary")
+        self.fill(data_manager)
+        expected = self.snapshot(data_manager)
+        data_manager.close()
+
+        reopened = self.open("binary")
+        reopened.upsert_word("영단어", "new", ["새"], now=NOW) # 나머지 단어는 꺼내지 않은 채로 저장
+        reopened.save_data()
+        reopened.close()
+        words, settings = self.snapshot(self.open("binary"))["영단어"]
+        self.assertEqual((words[:-1], settings), expected["영단어"])
+        self.assertEqual(words[-1]["word"], "new")
+
+    def test_export_import_json(self):
+        data_manager = self.open("binary")
+        self.fill(data_manager)
+        expected = self.snapshot(data_manager)
+        data_manager.export_json("backup.json")
+        with open("backup.json", encoding="utf-8") as f:
+            backup = json.load(f)
+        self.assertEqual(sorted(backup["decks"]), ["日本語", "영단어"])
+
+        data_manager.delete_deck("영단어")
+        data_manager.import_json("backup.json")
+        self.assertEqual(self.snapshot(data_manager), expected)
+
+class EncodeDeckTest(unittest.TestCase):
+    def make_words(self):
+        words = [WordRecord.new(f"w{i}", [f"뜻{i}"], now=NOW + i * 61) for i in range(20)]
+        for i, entry in enumerate(words):
+            entry.id = i + 1
+        words[3].review_stats["study_to_native"].interval = 1440
+        words[5].review_stats["native_to_study"].ease = 2.5
+        words[7].extra = {"tag": "과일"} # 열에 맞지 않는 단어는 헤더에 그대로 보관
+        words[9].meaning = ["a\0b"]
+        return words
+
+    def test_records_and_dicts_encode_the_same(self):
+        words = self.make_words()
+        deck = {"settings": {"study_lang": "English"}, "words": words}
+        as_dicts = {"settings": deck["settings"], "words": [w.to_dict() for w in words]}
+        data = binary_backend.encode_deck(deck)
+        self.assertEqual(data, binary_backend.encode_deck(as_dicts))
+
+        decoded = binary_backend.decode_deck(data)
+        self.assertEqual(plain_deck(decoded), as_dicts)
+        # 꺼내지 않은 단어는 읽어 둔 열 값으로, 꺼낸 단어는 WordRecord로 다시 인코딩해도 같음
+        self.assertEqual(binary_backend.encode_deck(decoded), data)
+        decoded["words"][3].to_record().word = "changed"
+        as_dicts["words"][3]["word"] = "changed"
+        self.assertEqual(binary_backend.encode_deck(decoded), binary_backend.encode_deck(as_dicts))
+
+if __name__ == "__main__":
+    unittest.main()
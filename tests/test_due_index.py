@@ -0,0 +1,59 @@
+import unittest
+
+from due_index import DueIndex, day_of, day_start
+from models import WordRecord
+
+NOW = 1_700_000_000
+MODE = "study_to_native"
+
+def word(name, due_at):
+    entry = WordRecord.new(name, ["뜻"], now=NOW - 3600)
+    entry.review_stats[MODE].next_review = due_at
+    return entry
+
+class DueIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.words = [word("c", NOW + 120), word("a", NOW - 100), word("b", NOW - 100), word("d", NOW + 3 * 86400)]
+        self.index = DueIndex(self.words, MODE)
+
+    def test_due_words_in_time_then_insertion_order(self):
+        self.assertEqual(self.index.count_due(NOW), 2)
+        self.assertEqual([w.word for w in self.index.due_words(NOW)], ["a", "b"])
+        self.assertEqual([w.word for w in self.index.due_words(NOW + 120)], ["a", "b", "c"])
+        self.assertEqual([due for due, _ in self.index.next_due(2)], [NOW - 100, NOW - 100])
+
+    def test_dict_entries(self):
+        index = DueIndex([w.to_dict() for w in self.words], MODE)
+        # 문자열 시각은 분 단위
+        self.assertEqual([w["word"] for w in index.due_words(NOW)], ["a", "b"])
+
+    def test_update_and_remove(self):
+        self.words[0].review_stats[MODE].next_review = NOW - 1000
+        self.index.update(self.words[0])
+        self.assertEqual([w.word for w in self.index.due_words(NOW)], ["c", "a", "b"])
+        self.index.remove("a")
+        self.index.remove("없는 단어")
+        self.assertEqual([w.word for w in self.index.due_words(NOW)], ["c", "b"])
+        self.assertEqual(len(self.index), 3)
+
+    def test_histogram_follows_updates(self):
+        today = day_of(NOW)
+        self.assertEqual(self.index.count_on_day(today + 3), 1)
+        forecast = self.index.forecast(5, NOW)
+        self.assertEqual(sum(forecast), 4)
+        self.assertEqual(forecast[3], 1)
+
+        self.words[3].review_stats[MODE].next_review = day_start(today + 1) + 60
+        self.index.update(self.words[3])
+        self.assertEqual(self.index.count_on_day(today + 3), 0)
+        self.assertEqual(self.index.count_on_day(today + 1), 1)
+        self.index.remove("d")
+        self.assertEqual(self.index.forecast(5, NOW)[1:], [0, 0, 0, 0])
+
+    def test_day_boundaries(self):
+        today = day_of(NOW)
+        self.assertEqual(day_of(day_start(today)), today)
+        self.assertEqual(day_of(day_start(today) - 1), today - 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import unittest
+
+from data_manager import JsonBackend
+from tests.helpers import NOW, StorageTestCase
+
+class JsonBackendTest(StorageTestCase):
+    def test_round_trip(self):
+        self.check_round_trip("json")
+
+    def test_recovers_previous_generation(self):
+        data_manager = self.open("json")
+        self.fill(data_manager)
+        data_manager.upsert_word("영단어", "last", ["마지막"], now=NOW)
+        data_manager.save_data()
+        data_manager.close()
+        with open("data/app_data.json", "w", encoding="utf-8") as f:
+            f.write("{broken")
+
+        reopened = self.open("json")
+        # 직전 세대(.1)에는 마지막 단어가 없음
+        self.assertEqual(reopened.count_words("영단어"), 4)
+        self.assertTrue(os.path.exists("data/app_data.json.corrupt"))
+
+    def test_generations_are_bounded(self):
+        data_manager = self.open(JsonBackend())
+        data_manager.add_deck("덱")
+        for i in range(10):
+            data_manager.upsert_word("덱", f"w{i}", ["뜻"], now=NOW)
+            data_manager.save_data()
+        files = sorted(f for f in os.listdir("data") if f.startswith("app_data.json"))
+        self.assertEqual(files, ["app_data.json", "app_data.json.1", "app_data.json.2", "app_data.json.3"])
+
+    def test_all_generations_broken_starts_empty(self):
+        with open("data/app_data.json", "w", encoding="utf-8") as f:
+            f.write("")
+        data_manager = self.open("json")
+        self.assertEqual(data_manager.get_deck_names(), [])
+        self.assertTrue(os.path.exists("data/app_data.json.corrupt"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from models import ReviewStats, WordRecord, plain_deck, to_epoch, to_text
+
+NOW = 1_700_000_000
+
+class TimeTextTest(unittest.TestCase):
+    def test_round_trip_to_minute(self):
+        self.assertEqual(to_epoch(to_text(NOW)), NOW - NOW % 60)
+        self.assertIsNone(to_epoch(None))
+        self.assertIsNone(to_text(None))
+
+    def test_other_formats_fall_back_to_strptime(self):
+        with self.assertRaises(ValueError):
+            to_epoch("2024-13-01 10:00")
+
+class WordRecordTest(unittest.TestCase):
+    def make_dict(self):
+        return {
+            "word": "apple",
+            "meaning": ["사과"],
+            "example": "an apple",
+            "created_at": "2024-05-01 09:30",
+            "review_stats": {
+                "study_to_native": {"correct_cnt": 2, "incorrect_cnt": 1, "prob_mode": "objective",
+                                    "last_reviewed": "2024-05-02 10:00", "next_review": "2024-05-03 10:00",
+                                    "interval": 1440, "ease": 2.36},
+                "native_to_study": {"correct_cnt": 0, "incorrect_cnt": 0, "prob_mode": None,
+                                    "last_reviewed": None, "next_review": "2024-05-01 09:31"},
+            },
+            "id": 7,
+            "tag": "과일", # 모르는 키도 그대로 보관
+        }
+
+    def test_dict_round_trip(self):
+        data = self.make_dict()
+        record = WordRecord.from_dict(data)
+        self.assertEqual(record.to_dict(), data)
+        self.assertEqual(dict(record), data)
+        self.assertEqual(record.review_stats["study_to_native"].interval, 1440)
+        self.assertIsNone(record.review_stats["native_to_study"].ease)
+
+    def test_mapping_access_uses_text_times(self):
+        record = WordRecord.from_dict(self.make_dict())
+        stats = record["review_stats"]["study_to_native"]
+        self.assertEqual(stats["next_review"], "2024-05-03 10:00")
+        self.assertEqual(stats.next_review, to_epoch("2024-05-03 10:00"))
+        stats["next_review"] = "2024-06-01 00:00"
+        self.assertEqual(stats.next_review, to_epoch("2024-06-01 00:00"))
+        self.assertNotIn("stability", stats)
+        with self.assertRaises(KeyError):
+            stats["stability"]
+
+    def test_new_word(self):
+        record = WordRecord.new("cat", ("고양이",), now=NOW)
+        self.assertIsNone(record.id)
+        self.assertNotIn("id", record)
+        self.assertEqual(set(record.review_stats), {"study_to_native", "native_to_study"})
+        self.assertTrue(all(s.next_review == NOW + 60 for s in record.review_stats.values()))
+
+    def test_plain_deck(self):
+        data = self.make_dict()
+        deck = {"settings": {}, "words": [WordRecord.from_dict(data), {"word": "raw"}]}
+        self.assertEqual(plain_deck(deck)["words"], [data, {"word": "raw"}])
+        self.assertIsInstance(ReviewStats.from_dict(data["review_stats"]["study_to_native"]), ReviewStats)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import unittest
+
+from review_events import RECORD, ReviewEvent, ReviewEventLog
+from tests.helpers import NOW, StorageTestCase
+
+class ReviewEventLogTest(StorageTestCase):
+    def append_some(self, log, start, count):
+        for i in range(count):
+            log.append("덱", start + i, "native_to_study" if i % 2 else "study_to_native", NOW + i, i % 3 != 0,
+                       latency_ms=100 + i, subjective=i % 2 == 1)
+        log.flush()
+
+    def expected(self, start, count):
+        return [ReviewEvent(start + i, "native_to_study" if i % 2 else "study_to_native", NOW + i, i % 3 != 0,
+                            100 + i, i % 2 == 1) for i in range(count)]
+
+    def test_round_trip(self):
+        log = ReviewEventLog()
+        self.append_some(log, 1, 5)
+        self.assertEqual(ReviewEventLog().read("덱"), self.expected(1, 5))
+
+    def test_torn_record_is_cut_before_next_append(self):
+        log = ReviewEventLog()
+        self.append_some(log, 1, 3)
+        with open(log.path("덱"), "ab") as f:
+            f.write(b"\x01\x02\x03") # 쓰다가 종료된 레코드 조각
+        reopened = ReviewEventLog()
+        self.assertEqual(reopened.read("덱"), self.expected(1, 3))
+        self.append_some(reopened, 10, 4)
+        self.assertEqual(reopened.read("덱"), self.expected(1, 3) + self.expected(10, 4))
+        self.assertEqual((os.path.getsize(log.path("덱")) - 8) % RECORD.size, 0)
+
+    def test_torn_magic(self):
+        os.makedirs("data/review_events")
+        log = ReviewEventLog()
+        with open(log.path("덱"), "wb") as f:
+            f.write(b"MVEV")
+        self.assertEqual(log.read("덱"), [])
+        self.append_some(log, 1, 2)
+        self.assertEqual(log.read("덱"), self.expected(1, 2))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+
+import scheduler
+from models import ReviewStats
+
+NOW = 1_700_000_000
+
+class LegacySchedulerTest(unittest.TestCase):
+    """기존 방식은 예전 학습 화면의 계산(맞히면 60 * 2^정답 횟수분, 틀리면 30분)과 같아야 합니다."""
+    def setUp(self):
+        self.scheduler = scheduler.create_scheduler("legacy")
+
+    def test_is_default(self):
+        self.assertIsInstance(scheduler.create_scheduler(), scheduler.LegacyScheduler)
+
+    def test_correct_doubles_with_correct_count(self):
+        stats = ReviewStats()
+        for corrects in range(1, 8):
+            interval = self.scheduler.review(stats, True, NOW)
+            self.assertEqual(interval, 60 * 2 ** corrects)
+            self.assertEqual(stats.correct_cnt, corrects)
+            self.assertEqual(stats.last_reviewed, NOW)
+            self.assertEqual(stats.next_review, NOW + 60 * 2 ** corrects * 60)
+
+    def test_wrong_is_thirty_minutes(self):
+        stats = ReviewStats(correct_cnt=5)
+        interval = self.scheduler.review(stats, False, NOW)
+        self.assertEqual(interval, 30)
+        self.assertEqual((stats.correct_cnt, stats.incorrect_cnt), (5, 1))
+        self.assertEqual(stats.next_review, NOW + 30 * 60)
+        # 틀린 뒤에도 정답 횟수는 그대로이므로 다음 정답은 이어서 늘어남
+        self.assertEqual(self.scheduler.review(stats, True, NOW), 60 * 2 ** 6)
+
+    def test_stores_no_state(self):
+        stats = ReviewStats()
+        self.scheduler.review(stats, True, NOW)
+        self.assertTrue(all(getattr(stats, f) is None for f in ReviewStats.SCHEDULER_FIELDS))
+
+    def test_reschedule_keeps_times_and_clears_state(self):
+        stats = ReviewStats(3, 1, "objective", NOW, NOW + 3600)
+        stats.ease, stats.reps = 2.5, 3
+        self.assertEqual(self.scheduler.reschedule([stats]), 0)
+        self.assertEqual(stats.next_review, NOW + 3600)
+        self.assertIsNone(stats.ease)
+        self.assertIsNone(stats.reps)
+
+    def test_huge_correct_count_is_clipped(self):
+        stats = ReviewStats(correct_cnt=1000)
+        self.assertEqual(self.scheduler.review(stats, True, NOW), scheduler.MAX_INTERVAL)
+
+class SM2SchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = scheduler.create_scheduler("sm2")
+
+    def test_intervals_grow_and_reset(self):
+        stats = ReviewStats(next_review=NOW + 60)
+        now = NOW
+        intervals = []
+        for ok in (True, True, True, False, True):
+            intervals.append(self.scheduler.review(stats, ok, now))
+            now = stats.next_review
+        self.assertEqual(intervals[:2], [1440, 6 * 1440])
+        self.assertGreater(intervals[2], intervals[1])
+        self.assertEqual(intervals[3], 10)
+        self.assertEqual(intervals[4], 1440)
+        self.assertEqual(stats.reps, 1)
+        self.assertGreaterEqual(stats.ease, 1.3)
+
+    def test_unknown_param_rejected(self):
+        with self.assertRaises(ValueError):
+            scheduler.create_scheduler("sm2", {"nope": 1})
+
+class FSRSSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = scheduler.create_scheduler("fsrs")
+
+    def test_first_answers(self):
+        stats = ReviewStats()
+        self.assertEqual(self.scheduler.review(stats, False, NOW), 10)
+        self.assertEqual(stats.reps, 0)
+        stats = ReviewStats()
+        interval = self.scheduler.review(stats, True, NOW)
+        # retention 0.9에서는 간격이 안정도(w[2]일)와 같음
+        self.assertEqual(interval, round(self.scheduler.params["w"][2] * 1440))
+
+    def test_lower_retention_means_longer_interval(self):
+        relaxed = scheduler.create_scheduler("fsrs", {"desired_retention": 0.8})
+        self.assertGreater(relaxed.review(ReviewStats(), True, NOW), self.scheduler.review(ReviewStats(), True, NOW))
+
+class RescheduleTest(unittest.TestCase):
+    """NumPy로 덱 전체를 다시 계산한 결과는 카드 하나씩 계산한 결과와 같아야 합니다."""
+    def make_stats(self):
+        stats_list = []
+        for i in range(50):
+            last = NOW - i * 7919
+            interval = 30 if i % 4 == 0 else 60 * 2 ** (i % 7)
+            stats_list.append(ReviewStats(i % 7, i % 3, "objective", last, last + interval * 60))
+        stats_list.append(ReviewStats(next_review=NOW)) # 아직 복습하지 않은 카드는 그대로
+        return stats_list
+
+    @unittest.skipIf(scheduler.np is None, "NumPy가 없음")
+    def test_numpy_matches_scalar(self):
+        for name in ("sm2", "fsrs"):
+            with self.subTest(name):
+                vectorized, scalar = self.make_stats(), self.make_stats()
+                calc = scheduler.create_scheduler(name)
+                self.assertEqual(calc.reschedule(vectorized, keep_state=False), 50)
+                np, scheduler.np = scheduler.np, None
+                try:
+                    calc.reschedule(scalar, keep_state=False)
+                finally:
+                    scheduler.np = np
+                self.assertEqual([s.to_dict() for s in vectorized], [s.to_dict() for s in scalar])
+                self.assertEqual(vectorized[-1].next_review, NOW)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+import sharded_backend
+from data_manager import DataManager
+from models import plain_deck
+from tests.helpers import NOW, StorageTestCase
+
+class ShardedBackendTest(StorageTestCase):
+    def test_round_trip(self):
+        self.check_round_trip("sharded")
+
+    def test_journal_is_replayed_for_unopened_deck(self):
+        data_manager = DataManager("sharded")
+        self.fill(data_manager)
+        entry = self.answer(data_manager, "日本語", "酒", "native_to_study", False, NOW + 120)
+        data_manager.flush_reviews(wait=True)
+        expected = entry.review_stats["native_to_study"].to_dict()
+        # 스냅샷을 쓰지 않고 종료된 것처럼 저널만 남김
+        data_manager._writer_stopping = True
+        data_manager.backend.close()
+        data_manager.history.save()
+
+        reopened = self.open("sharded")
+        self.assertEqual(reopened.get_word_counts(), {"영단어": 4, "日本語": 1})
+        self.assertEqual(reopened.get_word("日本語", "酒").review_stats["native_to_study"].to_dict(), expected)
+
+    def encoded_decks(self, data_manager, change):
+        """change()를 실행하고 저장할 때 다시 인코딩한 덱 이름들"""
+        encoded = []
+        def spy(deck):
+            encoded.append(next(name for name, d in data_manager.app_data["decks"].loaded_items() if d is deck))
+            return plain_deck(deck)
+        with mock.patch.object(sharded_backend, "plain_deck", side_effect=spy):
+            change()
+            data_manager.save_data()
+        return sorted(set(encoded))
+
+    def test_only_dirty_decks_are_encoded(self):
+        data_manager = self.open("sharded")
+        self.fill(data_manager)
+        data_manager.get_word("日本語", "酒")
+        self.assertEqual(self.encoded_decks(data_manager, lambda: None), [])
+
+        answer = lambda: self.answer(data_manager, "日本語", "酒", "native_to_study", True, NOW + 120)
+        self.assertEqual(self.encoded_decks(data_manager, answer), ["日本語"])
+        settings = lambda: data_manager.update_deck_settings("영단어", "한국어", "English")
+        self.assertEqual(self.encoded_decks(data_manager, settings), ["영단어"])
+        delete = lambda: data_manager.delete_word("영단어", "word0")
+        self.assertEqual(self.encoded_decks(data_manager, delete), ["영단어"])
+        data_manager.close()
+
+        reopened = self.open("sharded")
+        self.assertEqual(reopened.get_deck_settings("영단어")["study_lang"], "English")
+        self.assertIsNone(reopened.get_word("영단어", "word0"))
+        self.assertEqual(reopened.get_word("日本語", "酒").review_stats["native_to_study"].correct_cnt, 1)
+
+    def test_assigned_word_ids_are_saved(self):
+        words = [{"word": w, "meaning": [w], "example": "", "created_at": None, "review_stats": {}} for w in "ab"]
+        with open("data/app_data.json", "w", encoding="utf-8") as f:
+            json.dump({"decks": {"A": {"settings": {}, "words": words}}}, f)
+        data_manager = self.open("sharded")
+        self.assertEqual(self.encoded_decks(data_manager, lambda: data_manager.count_words("A")), ["A"])
+        data_manager.close()
+
+        with open("data/decks/A.json", encoding="utf-8") as f:
+            self.assertEqual([w["id"] for w in json.load(f)["words"]], [1, 2])
+
+class ShardedRecoveryTest(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        data_manager = DataManager("sharded")
+        data_manager.add_deck("A")
+        data_manager.add_deck("B")
+        for i in range(4):
+            data_manager.upsert_word("A", f"w{i}", [f"m{i}"], now=NOW)
+            data_manager.save_data()
+        data_manager.upsert_word("B", "b", ["bb"], now=NOW)
+        data_manager.save_data()
+        data_manager.close()
+
+    def deck_files(self, prefix="A.json"):
+        return sorted(f for f in os.listdir("data/decks") if f.startswith(prefix))
+
+    def corrupt(self, *names):
+        for name in names:
+            with open(name, "w", encoding="utf-8") as f:
+                f.write("{broken " + name)
+
+    def test_recovers_older_deck_generation(self):
+        self.corrupt("data/decks/A.json", "data/decks/A.json.1")
+        data_manager = self.open("sharded")
+        self.assertEqual(data_manager.count_words("A"), 2)
+        self.assertEqual(data_manager.count_words("B"), 1)
+        self.assertIn("A.json.corrupt", self.deck_files())
+        self.assertIn("A.json.1.corrupt", self.deck_files())
+
+    def test_unreadable_deck_is_not_overwritten(self):
+        names = [os.path.join("data/decks", f) for f in self.deck_files()]
+        self.corrupt(*names)
+        broken = set()
+        for name in names:
+            with open(name, encoding="utf-8") as f:
+                broken.add(f.read())
+
+        data_manager = self.open("sharded")
+        self.assertEqual(data_manager.count_words("A"), 0)
+        data_manager.upsert_word("A", "lost", ["x"], now=NOW)
+        data_manager.save_data()
+        data_manager.close()
+
+        kept = set()
+        for name in self.deck_files():
+            self.assertIn(".corrupt", name)
+            with open(os.path.join("data/decks", name), encoding="utf-8") as f:
+                kept.add(f.read())
+        self.assertEqual(kept, broken)
+        self.assertIn("A", self.open("sharded").get_deck_names())
+
+    def test_recovers_manifest(self):
+        self.corrupt("data/manifest.json")
+        data_manager = self.open("sharded")
+        self.assertEqual(sorted(data_manager.get_deck_names()), ["A", "B"])
+        self.assertEqual(data_manager.count_words("A"), 4)
+        self.assertTrue(os.path.exists("data/manifest.json.corrupt"))
+
+    def test_rebuilds_manifest_from_deck_files(self):
+        self.corrupt(*[os.path.join("data", f) for f in os.listdir("data") if f.startswith("manifest.json")])
+        data_manager = self.open("sharded")
+        self.assertEqual(sorted(data_manager.get_deck_names()), ["A", "B"])
+        self.assertEqual(data_manager.count_words("A"), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import unittest
+
+from tests.helpers import NOW, StorageTestCase
+
+class SqliteBackendTest(StorageTestCase):
+    def test_round_trip(self):
+        self.check_round_trip("sqlite")
+
+    def test_answer_updates_row_without_snapshot(self):
+        data_manager = self.open("sqlite")
+        self.fill(data_manager)
+        entry = self.answer(data_manager, "日本語", "酒", "native_to_study", False, NOW + 120)
+        data_manager.flush_reviews(wait=True)
+        expected = entry.review_stats["native_to_study"].to_dict()
+        self.assertFalse(data_manager.backend.has_pending_changes())
+        data_manager.backend.close()
+
+        reopened = self.open("sqlite")
+        self.assertEqual(reopened.get_word("日本語", "酒").review_stats["native_to_study"].to_dict(), expected)
+
+    def test_deck_count_without_loading(self):
+        data_manager = self.open("sqlite")
+        self.fill(data_manager)
+        data_manager.close()
+
+        reopened = self.open("sqlite")
+        self.assertEqual(reopened.get_word_counts(), {"영단어": 4, "日本語": 1})
+        self.assertEqual(reopened.app_data["decks"].loaded_items(), [])
+
+    def test_migrates_json_and_legacy_words(self):
+        legacy = [{"word": "apple", "meaning": ["사과"], "example": "", "created_at": "2024-05-01 09:30",
+                   "review_stats": {"eng_to_kor": {"correct_cnt": 2, "incorrect_cnt": 0, "prob_mode": "objective",
+                                                   "last_reviewed": None, "next_review": "2024-05-02 09:30"}}}]
+        with open("data/words.json", "w", encoding="utf-8") as f:
+            json.dump(legacy, f)
+        with open("data/app_data.json", "w", encoding="utf-8") as f:
+            json.dump({"decks": {"덱": {"settings": {}, "words": [], "study_log": {}}}}, f)
+
+        data_manager = self.open("sqlite")
+        self.assertEqual(data_manager.get_deck_names(), ["덱", "기본 단어장"])
+        stats = data_manager.get_word("기본 단어장", "apple").review_stats
+        self.assertEqual(list(stats), ["study_to_native"])
+        self.assertEqual(stats["study_to_native"]["next_review"], "2024-05-02 09:30")
+
+    def test_save_writes_only_changed_rows(self):
+        data_manager = self.open("sqlite")
+        data_manager.add_deck("큰 덱")
+        for i in range(50):
+            data_manager.upsert_word("큰 덱", f"w{i:02d}", [f"m{i}"], now=NOW)
+        data_manager.save_data()
+        conn = data_manager.backend._conn
+
+        before = conn.total_changes
+        data_manager.delete_word("큰 덱", "w10")
+        data_manager.upsert_word("큰 덱", "new", ["새"], now=NOW)
+        data_manager.update_deck_settings("큰 덱", "한국어", "English")
+        # 덱 행, 지운 단어(와 통계 2개), 새 단어(와 통계 2개)만 바뀜. 뒤의 단어들은 위치를 고쳐 쓰지 않음
+        self.assertLessEqual(conn.total_changes - before, 10)
+        data_manager.close()
+
+        reopened = self.open("sqlite")
+        words = [w["word"] for w in reopened.iter_words("큰 덱")]
+        self.assertEqual(words, [f"w{i:02d}" for i in range(50) if i != 10] + ["new"])
+        self.assertEqual(reopened.get_deck_settings("큰 덱"), {"native_lang": "한국어", "study_lang": "English"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import unittest
+from datetime import date, datetime
+
+from study_history import StudyHistory
+from tests.helpers import NOW, StorageTestCase
+
+class StudyHistoryTest(StorageTestCase):
+    def test_rollups_count_each_word_once_per_day(self):
+        history = StudyHistory()
+        history.record_answer("덱", 1, "study_to_native", NOW, True)
+        history.record_answer("덱", 1, "native_to_study", NOW + 5, False)
+        history.record_answer("덱", 2, "study_to_native", NOW + 10, True)
+        history.record_session("덱", "study_to_native", NOW, NOW + 300, 2, 1)
+        day = datetime.fromtimestamp(NOW).date()
+        counts = history.period_counts("day", day, "덱")
+        self.assertEqual((counts["studied_word_count"], counts["correct_count"], counts["incorrect_count"]), (2, 2, 1))
+        self.assertEqual((counts["session_count"], counts["study_seconds"]), (1, 300))
+        self.assertEqual(history.period_counts("month", day), counts)
+        self.assertEqual(history.daily_range(day, day), {day.isoformat(): counts})
+
+    def test_saved_rollups_match_rebuild(self):
+        history = StudyHistory()
+        history.import_daily("A", "2024-01-02", {"studied_word_count": 3, "correct_count": 4, "incorrect_count": 1})
+        history.record_answer("B", 1, "study_to_native", NOW, True)
+        history.remove_deck("A")
+        history.save()
+
+        reloaded = StudyHistory()
+        reloaded.load()
+        self.assertEqual(reloaded.totals(), history.totals())
+        self.assertEqual(reloaded.totals("A")["correct_count"], 0)
+        reloaded.rebuild()
+        self.assertEqual(reloaded.rollups, history.rollups)
+        self.assertEqual(reloaded.daily_log("A"), {})
+
+    def test_truncated_line_is_dropped(self):
+        history = StudyHistory()
+        history.record_answer("덱", 1, "study_to_native", NOW, True)
+        history.record_answer("덱", 1, "study_to_native", NOW + 5, False)
+        history.save()
+        with open(history.log_file, "ab") as f:
+            f.write(b'{"k": "a", "d"')
+
+        reloaded = StudyHistory()
+        reloaded.load()
+        totals = reloaded.totals("덱")
+        self.assertEqual((totals["studied_word_count"], totals["correct_count"], totals["incorrect_count"]), (1, 1, 1))
+        reloaded.record_answer("덱", 2, "study_to_native", NOW + 10, True)
+        reloaded.rebuild()
+        self.assertEqual(reloaded.totals("덱")["correct_count"], 2)
+
+    def test_per_deck_logs_are_imported(self):
+        app_data = {"decks": {"덱": {"settings": {}, "words": [], "study_log": {
+            "2024-01-02": {"studied_word_count": 2, "correct_count": 3, "incorrect_count": 1,
+                           "studied_words_today": ["a", "b"]}}}}}
+        with open("data/app_data.json", "w", encoding="utf-8") as f:
+            json.dump(app_data, f)
+
+        data_manager = self.open("json")
+        self.assertEqual(data_manager.history.daily_log("덱")["2024-01-02"]["correct_count"], 3)
+        self.assertEqual(data_manager.history.period_counts("day", date(2024, 1, 2))["studied_word_count"], 2)
+        self.assertNotIn("study_log", data_manager.app_data["decks"]["덱"])
+
+    def test_global_study_log_sessions_are_imported_once(self):
+        self.open("json").close() # 학습 기록이 이미 있어도 옮겨야 함
+        study_log = {
+            "2025-08-06": {"studied_word_count": 5, "correct_count": 0, "study_minutes": 5,
+                           "study_sessions": [{"start": "15:12", "end": "15:12"}, {"start": "15:42", "end": "15:45"}]},
+            "2025-08-07": {"study_minutes": 20, "study_sessions": [{"start": "23:50", "end": "00:10"}]},
+            "2025-08-10": {"study_minutes": 0, "study_sessions": []},
+        }
+        with open("data/study_log.json", "w", encoding="utf-8") as f:
+            json.dump(study_log, f)
+
+        data_manager = self.open("json")
+        history = data_manager.history
+        self.assertEqual((history.totals()["session_count"], history.totals()["study_seconds"]), (3, 1500))
+        self.assertEqual(history.daily_log()["2025-08-06"]["study_seconds"], 300)
+        self.assertEqual(history.daily_log()["2025-08-06"]["studied_word_count"], 0) # 단어 수는 덱별 기록에서 옮김
+        self.assertEqual(history.to_study_logs(), {})
+        self.assertFalse(os.path.exists("data/study_log.json"))
+        self.assertTrue(os.path.exists("data/study_log.json.migrated"))
+        data_manager.close()
+
+        reopened = self.open("json")
+        self.assertEqual(reopened.history.totals()["session_count"], 3)
+        reopened.history.rebuild()
+        self.assertEqual(reopened.history.totals()["study_seconds"], 1500)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import queue
+import threading
+
+try:
+    import winsound # Windows에서만 제공
+except ImportError:
+    winsound = None
+
+TTS_CACHE_DIR = "data/tts_cache"
+
+class TTSWorker(threading.Thread):
+    """
+    pyttsx3 엔진 하나를 계속 붙잡고, 큐로 들어오는 문장을 차례로 읽어주는 스레드.
+    GUI 스레드는 speak()로 요청만 넣고 바로 돌아가며,
+    새 요청이 들어오면 재생 중이거나 대기 중인 이전 문장은 취소됩니다.
+
+    Windows에서는 합성한 음성을 (문장, 음성)별 wav 파일로 캐시해 두고
+    다음부터는 합성 없이 바로 재생합니다.
+    """
+    def __init__(self, voice_map=None, cache_dir=TTS_CACHE_DIR):
+        super().__init__(daemon=True)
+        # voice_map이 없으면 스레드가 시작된 뒤 시스템 음성 목록에서 만듦
+        self.voice_map = voice_map
+        self.ready_callback = None
+        self.cache_dir = cache_dir
+        self._queue = queue.Queue()
+        self._generation = 0 # 요청마다 1씩 증가. 처리 중인 번호와 다르면 취소된 요청
+        self._speaking_generation = 0
+        self._engine = None
+        self._current_voice = None
+
+    def speak(self, text, lang_code=None, prepare=None):
+        """
+        문장 읽기를 요청합니다. 이전 요청은 모두 취소됩니다.
+        prepare(text)가 주어지면 읽기 직전에 이 스레드에서 호출해 읽을 문장을 바꿉니다.
+        """
+        if not text:
+            return
+        self._generation += 1
+        self._stop_playback()
+        self._queue.put((self._generation, text, lang_code, prepare))
+
+    def cancel(self):
+        """재생 중이거나 대기 중인 문장을 모두 취소합니다."""
+        self._generation += 1
+        self._stop_playback()
+
+    def shutdown(self):
+        self.cancel()
+        self._queue.put(None)
+
+    def run(self):
+        if self.voice_map is None:
+            self.voice_map = self.map_available_voices()
+        if self.ready_callback:
+            self.ready_callback()
+
+        while True:
+            request = self._queue.get()
+            if request is None:
+                break
+            generation, text, lang_code, prepare = request
+            if generation != self._generation:
+                continue # 더 새로운 요청이 들어와 있음
+            try:
+                if prepare is not None:
+                    text = prepare(text) or text
+                self._speak(generation, text, self.voice_map.get(lang_code))
+            except Exception as e:
+                print(f"TTS failed during speak: {e}")
+
+    def map_available_voices(self):
+        voice_map = {}
+        print("--- [TTS Voice Engine Debug] ---")
+        print("Searching for available voices on your system...")
+        try:
+            voices = self._get_engine(None).getProperty('voices')
+            print(f"Found {len(voices)} voices in total:")
+
+            for i, voice in enumerate(voices):
+                print(f"  - Voice #{i}: Name: {voice.name}, Langs: {getattr(voice, 'languages', [])}")
+                lang_codes = getattr(voice, 'languages', [])
+                if lang_codes:
+                    short_code = lang_codes[0].replace('-', '_').split('_')[0]
+                    
+                    if short_code not in voice_map:
+                        voice_map[short_code] = voice.id
+            
+            print("\nSuccessfully created voice map:")
+            print(voice_map)
+            print("------------------------------------")
+            return voice_map
+        except Exception as e:
+            print(f"TTS voice mapping failed: {e}")
+            print("------------------------------------")
+            return {}
+
+    def _get_engine(self, voice_id):
+        # pyttsx3 엔진은 만든 스레드에서만 사용해야 하므로 이 스레드에서 한 번만 생성.
+        # (pyttsx3.init()은 드라이버마다 같은 엔진을 돌려주므로 음성은 속성으로 바꿈)
+        if self._engine is None:
+            import pyttsx3
+            self._engine = pyttsx3.init()
+            self._engine.connect('started-word', self._on_word)
+        if voice_id and voice_id != self._current_voice:
+            self._engine.setProperty('voice', voice_id)
+            self._current_voice = voice_id
+        return self._engine
+
+    def _on_word(self, name, location, length):
+        # 읽는 도중 새 요청이 들어오면 현재 문장을 멈춤 (엔진 스레드 안에서 호출됨)
+        if self._speaking_generation != self._generation:
+            self._engine.stop()
+
+    def _speak(self, generation, text, voice_id):
+        self._speaking_generation = generation
+        engine = self._get_engine(voice_id)
+
+        if winsound is None:
+            engine.say(text)
+            engine.runAndWait()
+            return
+
+        path = self._cache_path(text, voice_id)
+        if not os.path.exists(path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = path + ".tmp.wav"
+            engine.save_to_file(text, temp_path)
+            engine.runAndWait()
+            os.replace(temp_path, path)
+
+        if generation == self._generation:
+            # 비동기 재생: 다음 재생 요청이나 _stop_playback()이 현재 소리를 끊음
+            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+
+    def _cache_path(self, text, voice_id):
+        key = hashlib.sha1(f"{voice_id}|{text}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.wav")
+
+    def _stop_playback(self):
+        if winsound is not None:
+            winsound.PlaySound(None, 0)
@@ -31,7 +31,7 @@ class DeckSelectionScreen(QWidget):
         content_layout.addLayout(self.deck_list_layout)
         main_layout.addLayout(content_layout)
 
-    def update_deck_list(self, deck_names):
+    def update_deck_list(self, deck_names, word_counts=None):
         for i in reversed(range(self.deck_list_layout.count())): 
             item = self.deck_list_layout.takeAt(i)
             if item.widget():
@@ -48,7 +48,8 @@ class DeckSelectionScreen(QWidget):
             deck_row = QHBoxLayout()
             
             # 덱 이름 버튼
-            deck_button = QPushButton(name)
+            count = (word_counts or {}).get(name)
+            deck_button = QPushButton(name if count is None else f"{name}  ({count}단어)")
             deck_button.setStyleSheet("text-align: left; padding: 10px;")
             deck_button.clicked.connect(lambda _, n=name: self.deck_selected.emit(n, False))
             
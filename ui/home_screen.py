@@ -1,14 +1,16 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QSpinBox
 from PyQt5.QtCore import Qt 
+from datetime import date, timedelta
 
 class HomeScreen(QWidget):
-    def __init__(self, switch_to_register_callback, switch_to_csv_callback, switch_to_wordlist_callback, switch_to_study_mode_callback, switch_to_deck_stats_callback):
+    def __init__(self, switch_to_register_callback, switch_to_csv_callback, switch_to_wordlist_callback, switch_to_study_mode_callback, switch_to_deck_stats_callback, set_daily_cap_callback=None):
         super().__init__()  
         self.switch_to_register_callback = switch_to_register_callback
         self.switch_to_csv_callback = switch_to_csv_callback
         self.switch_to_wordlist_callback = switch_to_wordlist_callback
         self.switch_to_study_mode_callback = switch_to_study_mode_callback
         self.switch_to_deck_stats_callback = switch_to_deck_stats_callback
+        self.set_daily_cap_callback = set_daily_cap_callback
 
         layout = QVBoxLayout()
 
@@ -17,6 +19,26 @@ class HomeScreen(QWidget):
         self.title.setStyleSheet("font-size: 24px; font-weight: bold;")
         layout.addWidget(self.title)
 
+        # 앞으로 며칠 동안의 복습 예정 단어 수
+        self.forecast_label = QLabel("")
+        self.forecast_label.setAlignment(Qt.AlignCenter)
+        self.forecast_label.setWordWrap(True)
+        layout.addWidget(self.forecast_label)
+
+        # 하루 복습 상한 (0이면 없음). 적용하면 넘치는 복습을 다음 날들로 나눔
+        cap_layout = QHBoxLayout()
+        cap_layout.addStretch()
+        cap_layout.addWidget(QLabel("하루 복습 상한 (모드별)"))
+        self.daily_cap_spinbox = QSpinBox()
+        self.daily_cap_spinbox.setRange(0, 9999)
+        self.daily_cap_spinbox.setSpecialValueText("없음")
+        cap_layout.addWidget(self.daily_cap_spinbox)
+        cap_apply_button = QPushButton("적용")
+        cap_apply_button.clicked.connect(self.apply_daily_cap)
+        cap_layout.addWidget(cap_apply_button)
+        cap_layout.addStretch()
+        layout.addLayout(cap_layout)
+
         # --- 기능 버튼들 ---
         csv_button = QPushButton("📥 CSV로 단어 등록")
         csv_button.clicked.connect(self.switch_to_csv_callback)
@@ -47,3 +69,21 @@ class HomeScreen(QWidget):
         main.py로부터 덱 이름을 받아와 제목 라벨의 텍스트를 변경합니다.
         """
         self.title.setText(deck_name)
+
+    def set_forecast(self, counts, cap=None, modes=1):
+        """
+        오늘부터 날마다 복습할 단어 수 목록을 받아 표시합니다.
+        하루 상한(cap)은 학습 모드마다 적용되므로, counts가 modes개 모드의 합이면 cap * modes를 넘는 날을 ⚠️로 표시합니다.
+        """
+        today = date.today()
+        parts = []
+        for i, count in enumerate(counts):
+            label = "오늘" if i == 0 else "내일" if i == 1 else (today + timedelta(days=i)).strftime("%m/%d")
+            warning = " ⚠️" if cap and count > cap * modes else ""
+            parts.append(f"{label} {count}{warning}")
+        self.forecast_label.setText("복습 예정: " + " · ".join(parts) if parts else "")
+        self.daily_cap_spinbox.setValue(cap or 0)
+
+    def apply_daily_cap(self):
+        if self.set_daily_cap_callback:
+            self.set_daily_cap_callback(self.daily_cap_spinbox.value() or None)
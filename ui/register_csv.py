@@ -1,11 +1,38 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox
-import csv
-from datetime import datetime, timedelta
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox, QProgressDialog
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+
+from csv_importer import import_csv
+
+class CsvImportWorker(QThread):
+    """CSV 가져오기를 GUI 스레드 밖에서 실행하고 진행 상황을 시그널로 알립니다."""
+    progress = pyqtSignal(int, int, dict) # 읽은 바이트, 전체 바이트, 중간 결과
+    finished_import = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, data_manager, deck_name, file_path):
+        super().__init__()
+        self.data_manager = data_manager
+        self.deck_name = deck_name
+        self.file_path = file_path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            result = import_csv(self.data_manager, self.deck_name, self.file_path,
+                                progress=self.progress.emit, is_cancelled=lambda: self._cancelled)
+            self.finished_import.emit(result)
+        except Exception as e:
+            self.failed.emit(str(e))
 
 class RegisterCSVScreen(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        self.worker = None
+        self.progress_dialog = None
 
         layout = QVBoxLayout()
         self.label = QLabel("CSV 파일을 업로드하여 단어를 등록합니다.")
@@ -31,57 +58,42 @@ class RegisterCSVScreen(QWidget):
         if not file_path:
             return
 
-        try:
-            with open(file_path, newline='', encoding='utf-8-sig') as csvfile: # utf-8-sig for BOM
-                reader = csv.DictReader(csvfile)
-                new_words_from_csv = list(reader)
-
-            word_list_in_deck = self.main_window.data_manager.get_words_for_deck(deck_name)
-            existing_words_dict = {w['word']: w for w in word_list_in_deck}
-            
-            added_count = 0
-            updated_count = 0
-            duplicate_count = 0
-
-            for row in new_words_from_csv:
-                word = row.get('word', '').strip()
-                if not word: continue
-
-                meanings = [m.strip() for m in row.get('meaning', '').split(';') if m.strip()]
-                example = row.get('example', '').strip()
-
-                if word in existing_words_dict:
-                    entry = existing_words_dict[word]
-                    original_meanings = set(entry.get("meaning", []))
-                    new_meanings_set = set(meanings)
-                    added_meanings = new_meanings_set - original_meanings
-                    
-                    if added_meanings:
-                        entry['meaning'].extend(list(added_meanings))
-                        updated_count += 1
-                    else:
-                        duplicate_count += 1
-                else:
-                    new_word_data = {
-                        "word": word, "meaning": meanings, "example": example,
-                        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                        "review_stats": {
-                            "study_to_native": {"correct_cnt": 0, "incorrect_cnt": 0, "prob_mode" : "objective", "last_reviewed": None, "next_review" :(datetime.now() + timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M")},
-                            "native_to_study": {"correct_cnt": 0, "incorrect_cnt": 0, "prob_mode" : "objective", "last_reviewed": None, "next_review" :(datetime.now() + timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M")}
-                        }
-                    }
-                    word_list_in_deck.append(new_word_data)
-                    added_count += 1
-
-            self.main_window.data_manager.save_data()
-
-            QMessageBox.information(
-                self, "등록 결과",
-                f"총 {len(new_words_from_csv)}개의 단어 처리 완료\n"
-                f"- 신규 등록: {added_count}개\n"
-                f"- 뜻 추가(업데이트): {updated_count}개\n"
-                f"- 중복: {duplicate_count}개"
-            )
+        # 파일 읽기와 병합은 작업 스레드에서 진행하고, 여기서는 진행률만 표시
+        self.progress_dialog = QProgressDialog("CSV 파일을 읽는 중입니다...", "취소", 0, 100, self)
+        self.progress_dialog.setWindowTitle("단어 등록")
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(0)
 
-        except Exception as e:
-            QMessageBox.critical(self, "오류 발생", f"CSV 파일 처리 중 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
+        self.worker = CsvImportWorker(self.main_window.data_manager, deck_name, file_path)
+        self.worker.progress.connect(self.on_import_progress)
+        self.worker.finished_import.connect(self.on_import_finished)
+        self.worker.failed.connect(self.on_import_failed)
+        self.progress_dialog.canceled.connect(self.worker.cancel)
+        self.upload_button.setEnabled(False)
+        self.worker.start()
+
+    def on_import_progress(self, bytes_read, total_bytes, result):
+        self.progress_dialog.setValue(bytes_read * 100 // max(total_bytes, 1))
+        self.progress_dialog.setLabelText(f"{result['total']}개의 단어를 처리했습니다...")
+
+    def on_import_finished(self, result):
+        self._close_progress()
+        title = "등록 취소" if result["cancelled"] else "등록 결과"
+        QMessageBox.information(
+            self, title,
+            f"총 {result['total']}개의 단어 처리 완료\n"
+            f"- 신규 등록: {result['added']}개\n"
+            f"- 뜻 추가(업데이트): {result['updated']}개\n"
+            f"- 중복: {result['duplicate']}개"
+        )
+
+    def on_import_failed(self, message):
+        self._close_progress()
+        QMessageBox.critical(self, "오류 발생", f"CSV 파일 처리 중 오류가 발생했습니다: {message}")
+
+    def _close_progress(self):
+        self.upload_button.setEnabled(True)
+        if self.progress_dialog:
+            self.progress_dialog.canceled.disconnect()
+            self.progress_dialog.close()
+            self.progress_dialog = None
@@ -1,5 +1,4 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QTextEdit, QPushButton, QMessageBox
-from datetime import datetime, timedelta
 
 class RegisterManualScreen(QWidget):
     def __init__(self, main_window):
@@ -55,34 +54,21 @@ class RegisterManualScreen(QWidget):
             QMessageBox.critical(self, "오류", "선택된 덱이 없습니다.")
             return
             
-        word_list = self.main_window.data_manager.get_words_for_deck(deck_name)
-        existing_word_entry = next((item for item in word_list if item["word"] == word), None)
+        data_manager = self.main_window.data_manager
+        # 단어 인덱스로 기존 단어를 바로 찾아, 없으면 추가하고 있으면 새 뜻만 덧붙임
+        status, entry, added_meanings = data_manager.upsert_word(deck_name, word, meanings, example)
 
-        message = ""
-        if existing_word_entry: # 이미 단어가 존재할 경우
-            original_meanings = set(existing_word_entry.get("meaning", []))
-            new_meanings = set(meanings)
-            added_meanings = new_meanings - original_meanings
-            if added_meanings:
-                existing_word_entry['meaning'].extend(list(added_meanings))
-                message = f"기존 단어 '{word}'에 뜻 {len(added_meanings)}개를 추가했습니다."
-            else:
-                message = f"단어 '{word}'는 이미 등록되어 있으며 새로운 뜻이 없습니다."
-        else: # 새로운 단어일 경우
-            new_word_data = {
-                "word": word,
-                "meaning": meanings,
-                "example": example,
-                "created_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                "review_stats": { # 기본 복습 통계
-                    "study_to_native": {"correct_cnt": 0, "incorrect_cnt": 0, "prob_mode" : "objective", "last_reviewed": None, "next_review" :(datetime.now() + timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M")},
-                    "native_to_study": {"correct_cnt": 0, "incorrect_cnt": 0, "prob_mode" : "objective", "last_reviewed": None, "next_review" :(datetime.now() + timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M")}
-                }
-            }
-            word_list.append(new_word_data)
+        if status == "added": # 새로운 단어일 경우
             message = f"새로운 단어 '{word}'를 등록했습니다."
-        
-        self.main_window.data_manager.save_data() # MainWindow를 통해 데이터 저장
+        elif status == "updated": # 이미 단어가 존재할 경우
+            message = f"기존 단어 '{word}'에 뜻 {len(added_meanings)}개를 추가했습니다."
+        else:
+            message = f"단어 '{word}'는 이미 등록되어 있으며 새로운 뜻이 없습니다."
+
+        if status != "duplicate":
+            # 일본어 덱이면 발음 재생에 쓸 히라가나 읽기를 미리 변환
+            data_manager.update_readings(deck_name, [entry])
+            data_manager.save_data() # MainWindow를 통해 데이터 저장
         QMessageBox.information(self, "등록 결과", message)
         
         self.word_input.clear()
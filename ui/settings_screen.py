@@ -1,11 +1,8 @@
-import shutil
 from datetime import datetime
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, 
-                             QFileDialog, QMessageBox)
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
+                             QFileDialog, QMessageBox, QCheckBox, QPlainTextEdit, QComboBox)
 from PyQt5.QtCore import Qt
-
-# 앱의 데이터 파일 경로 (main.py와 동일하게 설정)
-DATA_FILE = "data/app_data.json"
+import instrumentation
 
 class SettingsScreen(QWidget):
     def __init__(self, main_window):
@@ -29,7 +26,53 @@ class SettingsScreen(QWidget):
         restore_button = QPushButton("📂 데이터 복원하기")
         restore_button.clicked.connect(self.restore_data)
         layout.addWidget(restore_button)
-        
+
+        # --- 성능 측정 (저장/불러오기, 문제 만들기, TTS 등의 소요 시간) ---
+        metrics_title = QLabel("⏱️ 성능 측정")
+        metrics_title.setStyleSheet("font-size: 18px; font-weight: bold; margin-top: 20px;")
+        layout.addWidget(metrics_title)
+
+        self.metrics_checkbox = QCheckBox("측정 켜기")
+        self.metrics_checkbox.setChecked(instrumentation.is_enabled())
+        self.metrics_checkbox.toggled.connect(instrumentation.set_enabled)
+        layout.addWidget(self.metrics_checkbox)
+
+        self.metrics_view = QPlainTextEdit()
+        self.metrics_view.setReadOnly(True)
+        self.metrics_view.setMinimumHeight(180)
+        self.metrics_view.setStyleSheet("font-family: monospace;")
+        layout.addWidget(self.metrics_view)
+
+        metrics_buttons = QHBoxLayout()
+        refresh_button = QPushButton("🔄 새로고침")
+        refresh_button.clicked.connect(self.refresh_metrics)
+        reset_button = QPushButton("🧹 초기화")
+        reset_button.clicked.connect(self.reset_metrics)
+        export_button = QPushButton("📤 JSON으로 내보내기")
+        export_button.clicked.connect(self.export_metrics)
+        metrics_buttons.addWidget(refresh_button)
+        metrics_buttons.addWidget(reset_button)
+        metrics_buttons.addWidget(export_button)
+        layout.addLayout(metrics_buttons)
+
+        # --- 프로파일링 (cProfile + 스택 샘플링, 결과는 data/profiles/) ---
+        profile_title = QLabel("🔬 프로파일링")
+        profile_title.setStyleSheet("font-size: 18px; font-weight: bold; margin-top: 20px;")
+        layout.addWidget(profile_title)
+
+        profile_row = QHBoxLayout()
+        self.profile_window_combo = QComboBox()
+        self.profile_window_combo.addItems(["다음 학습 세션 한 번", "지금부터 멈출 때까지"])
+        self.profile_button = QPushButton()
+        self.profile_button.clicked.connect(self.toggle_profiling)
+        profile_row.addWidget(self.profile_window_combo, 1)
+        profile_row.addWidget(self.profile_button)
+        layout.addLayout(profile_row)
+
+        self.profile_status_label = QLabel()
+        self.profile_status_label.setWordWrap(True)
+        layout.addWidget(self.profile_status_label)
+
         layout.addStretch()
 
     def backup_data(self):
@@ -42,8 +85,8 @@ class SettingsScreen(QWidget):
 
         if save_path:
             try:
-                # 2. 현재 데이터 파일을 지정된 경로에 복사 (shutil 라이브러리 사용)
-                shutil.copy(DATA_FILE, save_path)
+                # 2. 저장소 종류와 상관없이 현재 데이터를 JSON 파일로 내보내기
+                self.main_window.data_manager.export_json(save_path)
                 QMessageBox.information(self, "백업 완료", f"데이터를 성공적으로 백업했습니다.\n경로: {save_path}")
             except Exception as e:
                 QMessageBox.critical(self, "백업 실패", f"백업 중 오류가 발생했습니다: {e}")
@@ -64,12 +107,75 @@ class SettingsScreen(QWidget):
 
         if restore_path:
             try:
-                # 3. 선택된 백업 파일을 현재 데이터 파일 위치에 덮어쓰기
-                shutil.copy(restore_path, DATA_FILE)
+                # 3. 선택된 백업 파일의 내용으로 현재 데이터를 교체
+                self.main_window.data_manager.import_json(restore_path)
                 QMessageBox.information(self, "복원 완료", 
                                           "데이터를 성공적으로 복원했습니다.\n\n"
                                           "앱을 재시작해야 변경사항이 적용됩니다.")
                 # 변경사항을 완전히 적용하기 위해 앱 종료
                 self.main_window.close()
             except Exception as e:
-                QMessageBox.critical(self, "복원 실패", f"복원 중 오류가 발생했습니다: {e}")
\ No newline at end of file
+                QMessageBox.critical(self, "복원 실패", f"복원 중 오류가 발생했습니다: {e}")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_metrics()
+        self.refresh_profiler()
+
+    def refresh_metrics(self):
+        snapshot = instrumentation.snapshot()
+        lines = [f"{'작업':16s} {'횟수':>6s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'최대':>9s} (ms)"]
+        for name, t in snapshot["timings"].items():
+            lines.append(f"{name:16s} {t['count']:6d} {t['p50_ms']:9.2f} {t['p95_ms']:9.2f} "
+                         f"{t['p99_ms']:9.2f} {t['max_ms']:9.2f}")
+        for name, value in snapshot["counters"].items():
+            lines.append(f"{name:16s} {value:6d}")
+        if len(lines) == 1:
+            lines.append("측정된 작업이 없습니다." if snapshot["enabled"] else "측정을 켜면 여기에 결과가 표시됩니다.")
+        self.metrics_view.setPlainText("\n".join(lines))
+
+    def reset_metrics(self):
+        instrumentation.reset()
+        self.refresh_metrics()
+
+    def export_metrics(self):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        save_path, _ = QFileDialog.getSaveFileName(self, '측정 결과 저장', f"voca_metrics_{timestamp}.json",
+                                                   'JSON Files (*.json)')
+        if save_path:
+            try:
+                instrumentation.export_json(save_path)
+                QMessageBox.information(self, "내보내기 완료", f"측정 결과를 저장했습니다.\n경로: {save_path}")
+            except Exception as e:
+                QMessageBox.critical(self, "내보내기 실패", f"저장 중 오류가 발생했습니다: {e}")
+
+    def toggle_profiling(self):
+        profiler = self.main_window.profiler
+        try:
+            if profiler.running:
+                profiler.stop()
+            elif profiler.session_armed:
+                profiler.arm_session(False)
+            elif self.profile_window_combo.currentIndex() == 0:
+                profiler.arm_session()
+            else:
+                profiler.start()
+        except Exception as e:
+            QMessageBox.critical(self, "프로파일링 실패", f"프로파일링 중 오류가 발생했습니다: {e}")
+        self.refresh_profiler()
+
+    def refresh_profiler(self):
+        profiler = self.main_window.profiler
+        if profiler.running:
+            self.profile_button.setText("⏹️ 멈추고 저장")
+            status = "프로파일링 중입니다."
+        elif profiler.session_armed:
+            self.profile_button.setText("취소")
+            status = "다음 학습 세션이 끝나면 결과를 저장합니다."
+        else:
+            self.profile_button.setText("▶️ 시작")
+            status = ""
+        self.profile_window_combo.setEnabled(not profiler.running and not profiler.session_armed)
+        if profiler.last_saved:
+            status += f"\n마지막 결과: {profiler.last_saved[0]}\n{profiler.last_saved[1]}"
+        self.profile_status_label.setText(status.strip())
@@ -1,14 +1,14 @@
-import json
-import os
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGridLayout, QGroupBox
 from PyQt5.QtCore import pyqtSignal, Qt, QEvent
+from instrumentation import timed
 
 # -----------------------------------------------------
 # 1. 날짜 별 활동 그래프
 # ----------------------------------------------------- 
 class ContributionGraph(QWidget):
     day_clicked = pyqtSignal(str)
+    NUM_WEEKS = 18
 
     def __init__(self):
         super().__init__()
@@ -18,6 +18,23 @@ class ContributionGraph(QWidget):
         self.setLayout(self.grid_layout)
         self.cells = {}
 
+        # 칸과 월 라벨은 한 번만 만들고, set_data에서는 색과 날짜만 바꿈
+        self.month_labels = []
+        for i in range(self.NUM_WEEKS):
+            month_label = QLabel("")
+            month_label.setAlignment(Qt.AlignCenter)
+            self.grid_layout.addWidget(month_label, 0, i + 1, 1, 4, Qt.AlignLeft)
+            self.month_labels.append(month_label)
+
+        self.day_cells = []
+        self.cell_colors = {}
+        for day_offset in range(self.NUM_WEEKS * 7):
+            cell = QLabel()
+            cell.setFixedSize(16, 16)
+            cell.installEventFilter(self)
+            self.grid_layout.addWidget(cell, day_offset % 7 + 1, day_offset // 7 + 1)
+            self.day_cells.append(cell)
+
     def get_color(self, count):
         if count == 0: return "#EAECEE"
         elif 1 <= count < 10: return "#A3E4D7"
@@ -25,41 +42,46 @@ class ContributionGraph(QWidget):
         elif 30 <= count < 50: return "#48C9B0"
         else: return "#1ABC9C"
 
+    def visible_range(self):
+        """그래프에 보이는 첫 날과 마지막 날(오늘)"""
+        today = datetime.now().date()
+        start_date = today - timedelta(days=today.weekday()) - timedelta(weeks=(self.NUM_WEEKS - 1))
+        return start_date, today
+
     def set_data(self, log_data):
-        for i in reversed(range(self.grid_layout.count())):
-            self.grid_layout.itemAt(i).widget().setParent(None)
         self.cells.clear()
 
         today = datetime.now()
-        num_weeks = 18
+        num_weeks = self.NUM_WEEKS
 
         last_month = ""
-        for i in range(num_weeks):
+        for i, month_label in enumerate(self.month_labels):
             date_of_week = today - timedelta(weeks=(num_weeks - 1 - i))
             current_month = date_of_week.strftime("%b")
             if current_month != last_month:
-                month_label = QLabel(current_month)
-                month_label.setAlignment(Qt.AlignCenter)
-                self.grid_layout.addWidget(month_label, 0, i + 1, 1, 4, Qt.AlignLeft)
+                month_label.setText(current_month)
+                month_label.show()
                 last_month = current_month
+            else:
+                month_label.hide()
         
         start_date = today - timedelta(days=today.weekday()) - timedelta(weeks=(num_weeks - 1))
-        for day_offset in range(num_weeks * 7):
+        for day_offset, cell in enumerate(self.day_cells):
             date = start_date + timedelta(days=day_offset)
-            if date > today: continue
+            if date > today:
+                cell.hide()
+                continue
 
-            row, col = date.weekday() + 1, day_offset // 7
             date_str = date.strftime("%Y-%m-%d")
-            
             count = log_data.get(date_str, {}).get("studied_word_count", 0)
-            
-            cell = QLabel()
-            cell.setFixedSize(16, 16)
-            cell.setStyleSheet(f"background-color: {self.get_color(count)}; border-radius: 3px;")
+
+            # 스타일시트 재적용은 비싸므로 색이 바뀐 칸만 갱신
+            color = self.get_color(count)
+            if self.cell_colors.get(cell) != color:
+                cell.setStyleSheet(f"background-color: {color}; border-radius: 3px;")
+                self.cell_colors[cell] = color
             cell.setToolTip(f"{date_str}\n학습 단어: {count}개")
-            cell.installEventFilter(self)
-            
-            self.grid_layout.addWidget(cell, row, col + 1)
+            cell.show()
             self.cells[cell] = date_str
 
     def eventFilter(self, source, event):
@@ -90,6 +112,9 @@ class StatsScreen(QWidget):
         summary_layout.addWidget(self.total_accuracy_label)
         self.layout.addLayout(summary_layout)
 
+        self.period_label = QLabel("이번 주: 0개 · 이번 달: 0개")
+        self.layout.addWidget(self.period_label)
+
         self.contribution_graph = ContributionGraph()
         self.layout.addWidget(self.contribution_graph)
         
@@ -108,32 +133,24 @@ class StatsScreen(QWidget):
         self.layout.addWidget(self.daily_detail_group)
         self.contribution_graph.day_clicked.connect(self.on_day_clicked)
 
+    @timed("load_stats_data")
     def load_stats_data(self, deck_name=None):
+        history = self.main_window.data_manager.history
         if deck_name: # 특정 덱의 통계를 볼 경우
             self.title_label.setText(f"'{deck_name}' 덱 통계")
-            decks_to_process = {deck_name: self.main_window.data_manager.app_data["decks"][deck_name]}
         else: # 전체 통계를 볼 경우
             self.title_label.setText("전체 통계")
-            decks_to_process = self.main_window.data_manager.app_data.get("decks", {})
-        
-        total_words, total_correct, total_incorrect = 0, 0, 0
-        self.log_data_by_date = {}
-
-        # 모든 덱을 순회하며 로그를 합산
-        for deck_data in decks_to_process.values():
-            log_data = deck_data.get("study_log", {})
-            for date, daily_log in log_data.items():
-                if date not in self.log_data_by_date:
-                    self.log_data_by_date[date] = {"studied_word_count": 0, "correct_count": 0, "incorrect_count": 0}
-                self.log_data_by_date[date]["studied_word_count"] += daily_log.get("studied_word_count", 0)
-                self.log_data_by_date[date]["correct_count"] += daily_log.get("correct_count", 0)
-                self.log_data_by_date[date]["incorrect_count"] += daily_log.get("incorrect_count", 0)
-                
-        # 합산된 데이터를 기반으로 전체 통계 계산
-        for daily_summary in self.log_data_by_date.values():
-            total_words += daily_summary["studied_word_count"]
-            total_correct += daily_summary["correct_count"]
-            total_incorrect += daily_summary["incorrect_count"]
+
+        # 답과 세션마다 갱신되는 합계를 그대로 사용 (그래프에 보이는 날 수만큼만 조회)
+        start_date, end_date = self.contribution_graph.visible_range()
+        self.log_data_by_date = history.daily_range(start_date, end_date, deck_name)
+        totals = history.totals(deck_name)
+        week = history.period_counts("week", end_date, deck_name)["studied_word_count"]
+        month = history.period_counts("month", end_date, deck_name)["studied_word_count"]
+        self.period_label.setText(f"이번 주: {week}개 · 이번 달: {month}개")
+        total_words = totals["studied_word_count"]
+        total_correct = totals["correct_count"]
+        total_incorrect = totals["incorrect_count"]
         
         # 상단 전체 통계 라벨 업데이트
         self.total_words_label.setText(f"총 학습 단어: {total_words}개")
@@ -1,9 +1,8 @@
 from PyQt5.QtWidgets import QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox, QFrame
-from datetime import datetime, timedelta
-import random, difflib
-
-# review_utils.py가 필요하다면 다시 임포트
-# from ui.review_utils import update_study_log, calculate_after_min
+import random, time
+from answer_matcher import find_near_miss
+from instrumentation import timed
+from question_prefetch import CHOICE_COUNT, PREFETCH_COUNT, QuestionPrefetcher
 
 class StudyScreen(QWidget):
     def __init__(self, main_window):
@@ -12,15 +11,20 @@ class StudyScreen(QWidget):
 
         self.mode = None
         self.word_list_for_review = []
-        self.actually_studied_words = []
         self.incorrectly_answered_words = [] 
         self.is_reviewing_mistakes = False 
         self.current_word = None
+        self.current_question = None
+        # 사용자가 지금 문제를 보는 동안 다음 문제들을 작업 스레드에서 미리 만들어 둠
+        self.prefetcher = QuestionPrefetcher(main_window.data_manager)
         self.session_correct = 0
         self.session_incorrect = 0
+        self.session_started_at = 0 # 세션 시작 시각 (epoch 초, 학습 기록용)
 
         self.current_question_text = ""
         self.current_question_lang = ""
+        self.is_subjective = False
+        self.question_shown_at = 0.0 # 응답 시간 측정용 (time.monotonic)
 
         # --- UI 위젯 초기화 ---
         self.layout = QVBoxLayout(self)
@@ -42,9 +46,16 @@ class StudyScreen(QWidget):
         subjective_layout.addWidget(self.answer_input)
         subjective_layout.addWidget(self.submit_button)
         
-        # ---객관식용 위젯
+        # ---객관식용 위젯 (보기 버튼은 미리 만들어 두고 문제마다 글자만 바꿔서 재사용)
         self.objective_widget = QWidget()
         self.objective_layout = QVBoxLayout(self.objective_widget)
+        self.choice_buttons = []
+        for i in range(CHOICE_COUNT):
+            btn = QPushButton()
+            btn.clicked.connect(lambda _, i=i: self.check_objective_answer(self.current_question.choices[i]))
+            self.objective_layout.addWidget(btn)
+            self.choice_buttons.append(btn)
+        self.objective_layout.addStretch(1)
         self.finish_button = QPushButton("학습 종료")
 
         self.layout.addLayout(question_layout)
@@ -63,17 +74,11 @@ class StudyScreen(QWidget):
         self.incorrectly_answered_words = []
         self.session_correct = 0
         self.session_incorrect = 0
-        self.actually_studied_words = []
+        self.session_started_at = time.time()
         
         deck_name = self.main_window.current_deck
-        all_words_in_deck = self.main_window.data_manager.get_words_for_deck(deck_name)
-        
-        now = datetime.now()
-        self.word_list_for_review = [
-            w for w in all_words_in_deck
-            if w.get("review_stats", {}).get(self.mode, {}).get("next_review") and
-               datetime.strptime(w['review_stats'][self.mode]['next_review'], "%Y-%m-%d %H:%M") <= now
-        ]
+        # 복습 시각 순으로 정렬된 인덱스에서 지금 복습할 단어만 가져옴
+        self.word_list_for_review = self.main_window.data_manager.get_due_words(deck_name, self.mode)
         
         self.initial_review_list = list(self.word_list_for_review)
 
@@ -81,108 +86,75 @@ class StudyScreen(QWidget):
             return False
         
         random.shuffle(self.word_list_for_review) # 단어 순서 섞기
+        self.prefetcher.reset(deck_name, self.mode)
         self.next_question()        
         return True
     
+    @timed("next_question")
     def next_question(self):
         if not self.word_list_for_review:
             self.prompt_for_mistake_review()
             return
             
         self.current_word = self.word_list_for_review.pop()
-        stats = self.current_word['review_stats'][self.mode]
-        total_reviews = stats['correct_cnt'] + stats['incorrect_cnt']
-        accuracy = 0
-        if total_reviews > 0:
-            accuracy = stats['correct_cnt'] / total_reviews
-
-        if total_reviews >= 10 and accuracy >= 0.85:
-            self.create_subjective_question()
+        question = self.prefetcher.take(self.current_word)
+        # 다음에 나올 단어들(목록 끝에서부터 꺼냄)의 문제를 미리 만들기 시작
+        self.prefetcher.prefetch(self.word_list_for_review[:-PREFETCH_COUNT - 1:-1])
+
+        self.current_question = question
+        self.is_subjective = question.subjective
+        self.current_question_text = question.text
+        self.current_question_lang = question.lang
+        if self.is_subjective:
+            self.create_subjective_question(question)
         else:
-            self.create_objective_question()
+            self.create_objective_question(question)
+        self.question_shown_at = time.monotonic()
         
-    def create_objective_question(self):
+    def create_objective_question(self, question):
         self.objective_widget.show()
         self.subjective_widget.hide()
-        self._clear_objective_buttons()
 
-        deck_settings = self.main_window.data_manager.get_deck_settings(self.main_window.current_deck)
-
-        if self.mode == 'study_to_native':
-            self.current_question_text = self.current_word['word']
-            self.current_question_lang = deck_settings.get("study_lang")
-            prompt_text = f"'{self.current_question_text}'의 뜻으로 올바른 것은?"
-        else:
-            self.current_question_text = random.choice(self.current_word['meaning'])
-            self.current_question_lang = deck_settings.get("native_lang")
-            prompt_text = f"'{self.current_question_text}'에 해당하는 단어는?"
-
-        self.question_label.setText(prompt_text)
-        
-        correct_answers = self.current_word['meaning'] if self.mode == 'study_to_native' else [self.current_word['word']]
-        choices = self._get_distractors(correct_answers)
-        choices.append(random.choice(correct_answers))
-        random.shuffle(choices)
-        for choice in choices:
-            btn = QPushButton(choice)
-            btn.clicked.connect(lambda _, c=choice: self.check_objective_answer(c))
-            self.objective_layout.addWidget(btn)
-        self.objective_layout.addStretch(1)
+        self.question_label.setText(f"'{question.text}'{question.prompt}" + self._reading_suffix(question))
+        for btn, choice in zip(self.choice_buttons, question.choices):
+            btn.setText(choice)
+            btn.show()
+        # 보기 후보가 모자라는 작은 덱이면 남는 버튼은 숨김
+        for btn in self.choice_buttons[len(question.choices):]:
+            btn.hide()
 
-    def create_subjective_question(self):
+    def create_subjective_question(self, question):
         self.subjective_widget.show()
         self.objective_widget.hide()
         self.answer_input.clear()
         self.answer_input.setFocus()
 
-        deck_settings = self.main_window.data_manager.get_deck_settings(self.main_window.current_deck)
-        
-        if self.mode == 'study_to_native':
-            self.current_question_text = self.current_word['word']
-            self.current_question_lang = deck_settings.get("study_lang")
-            prompt = "의 뜻을 입력하세요."
-        else:
-            self.current_question_text = random.choice(self.current_word['meaning'])
-            self.current_question_lang = deck_settings.get("native_lang")
-            prompt = "에 해당하는 단어를 입력하세요."
-
-        self.question_label.setText(f"'{self.current_question_text}' {prompt}")
+        self.question_label.setText(f"'{question.text}' {question.prompt}" + self._reading_suffix(question))
 
     def check_objective_answer(self, chosen_answer):
-        correct_answers = self.current_word['meaning'] if self.mode == 'study_to_native' else [self.current_word['word']]
-        is_correct = chosen_answer in correct_answers
+        is_correct = chosen_answer in self.current_question.correct_answers
         self.process_answer_result(is_correct)
 
     def check_subjective_answer(self):
         user_answer = self.answer_input.text().strip()
+        question = self.current_question
         
         if self.mode == 'study_to_native':
-            correct_answers = self.current_word['meaning']
-            is_correct = user_answer in correct_answers # 뜻 중 하나만 맞아도 정답
-
-            #아깝게 틀린 경우 확인
-            if not is_correct:
-                for answer in correct_answers:
-                    similarity = difflib.SequenceMatcher(None, user_answer, answer).ratio()
-                    if similarity >= 0.8: # 80% 이상 유사하면 '아까운 오답'
-                        self.process_answer_result(False, was_close=True, suggestion=answer)
-                        return
-            self.process_answer_result(is_correct)
-
+            is_correct = user_answer in question.correct_answers # 뜻 중 하나만 맞아도 정답
         else:
-            correct_answer = self.current_word['word']
-            is_correct = user_answer.lower() == correct_answer.lower()
-            
-            if not is_correct:
-                similarity = difflib.SequenceMatcher(None, user_answer.lower(), correct_answer.lower()).ratio()
-                if similarity >= 0.8:
-                    self.process_answer_result(False, was_close=True, suggestion=correct_answer)
-                    return
-            self.process_answer_result(is_correct)
+            is_correct = user_answer.lower() == question.correct_answers[0].lower()
+
+        #아깝게 틀린 경우 확인 (정규화한 뒤 편집 거리가 허용 범위 안이면 '아까운 오답')
+        if not is_correct:
+            suggestion = find_near_miss(user_answer, question.correct_answers, question.normalized_answers)
+            if suggestion is not None:
+                self.process_answer_result(False, was_close=True, suggestion=suggestion)
+                return
+        self.process_answer_result(is_correct)
     
     def process_answer_result(self, is_correct, was_close=False, suggestion=""):
-        if self.current_word not in self.actually_studied_words:
-            self.actually_studied_words.append(self.current_word)
+        # 결과 창을 띄우기 전까지의 시간이 응답 시간
+        latency_ms = int((time.monotonic() - self.question_shown_at) * 1000)
         
         # 피드백 메시지 생성
         if is_correct:
@@ -206,20 +178,15 @@ class StudyScreen(QWidget):
         if not is_correct and not self.is_reviewing_mistakes:
              self.incorrectly_answered_words.append(self.current_word)
         
-        stats = self.current_word['review_stats'][self.mode]
-        stats['correct_cnt'] += 1 if is_correct else 0
-        stats['incorrect_cnt'] += 1 if not is_correct else 0
-        stats['last_reviewed'] = datetime.now().strftime("%Y-%m-%d %H:%M")
-        
-        corrects = stats['correct_cnt']
-        incorrects = stats['incorrect_cnt']
-        if is_correct:
-            after_min = 60 * (2 ** corrects) if corrects > 0 else 60
-        else:
-            after_min = 30
-        stats['next_review'] = (datetime.now() + timedelta(minutes=after_min)).strftime('%Y-%m-%d %H:%M')
+        # 다음 복습 시각은 덱에 설정된 복습 주기 계산기(scheduler.py)가 정함 (시각은 epoch 정수)
+        stats = self.current_word.review_stats[self.mode]
+        now = int(time.time())
+        scheduler = self.main_window.data_manager.get_scheduler(self.main_window.current_deck)
+        scheduler.review(stats, is_correct, now)
 
-        self.main_window.data_manager.save_data()
+        # 답 기록과 바뀐 단어를 표시만 해 두면 백그라운드에서 모아서 기록 (디스크 쓰기를 기다리지 않음)
+        self.main_window.data_manager.record_answer(self.main_window.current_deck, self.current_word, self.mode,
+                                                    is_correct, latency_ms, self.is_subjective, now)
         self.next_question()
 
     def prompt_for_mistake_review(self):
@@ -244,61 +211,16 @@ class StudyScreen(QWidget):
         deck_name = self.main_window.current_deck
         if not deck_name: return
 
-        deck_data = self.main_window.data_manager.app_data["decks"][deck_name]
-        
-        if "study_log" not in deck_data:
-            deck_data["study_log"] = {}
-        
-        today_str = datetime.now().strftime("%Y-%m-%d")
-
-        # 오늘 날짜의 로그가 없으면 새로 생성
-        if today_str not in deck_data["study_log"]:
-            deck_data["study_log"][today_str] = {
-                "studied_word_count": 0,
-                "correct_count": 0,
-                "incorrect_count": 0,
-                "studied_words_today": [] # 분 단위 기록은 단순화를 위해 일단 제외
-            }
-        
-        # 로그 업데이트
-        today_log = deck_data["study_log"][today_str]
-
-        if "studied_words_today" not in today_log:
-            today_log["studied_words_today"] = []
-
-        if not self.is_reviewing_mistakes:
-            for word_obj in self.actually_studied_words:
-                word = word_obj['word']
-                if word not in today_log["studied_words_today"]:
-                    today_log["studied_words_today"].append(word)
-
-        today_log["correct_count"] += self.session_correct
-        today_log["incorrect_count"] += self.session_incorrect
-        today_log["studied_word_count"] = len(today_log["studied_words_today"])
-
-        self.main_window.data_manager.save_data() # 변경사항 저장
+        self.main_window.data_manager.flush_reviews()
+        # 정답/오답 수와 오늘 학습한 단어는 답마다 이미 학습 기록에 더해졌으므로 세션 자체만 기록
+        self.main_window.data_manager.record_study_session(
+            deck_name, self.mode, self.session_started_at, self.session_correct, self.session_incorrect)
         self.main_window.go_to_home_screen()
+        self.main_window.profiler.session_finished()
     
     def speak_current_word(self):
         if self.current_question_text and self.current_question_lang:
             self.main_window.speak(self.current_question_text, self.current_question_lang)
     
-    def _clear_objective_buttons(self):
-        while self.objective_layout.count():
-            child = self.objective_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-    def _get_distractors(self, correct_answers):
-        # 전체 덱에서 오답 보기를 추출하는 로직
-        all_words_in_deck = self.main_window.data_manager.app_data["decks"][self.main_window.current_deck]["words"]
-        
-        if self.mode == 'study_to_native':
-            distractor_pool = [m for w in all_words_in_deck for m in w['meaning'] if w != self.current_word]
-        else:
-            distractor_pool = [w['word'] for w in all_words_in_deck if w != self.current_word]
-        
-        # 중복 제거 및 정답과 겹치지 않게 처리
-        distractor_pool = list(set(distractor_pool) - set(correct_answers))
-        
-        return random.sample(distractor_pool, min(len(distractor_pool), 3))
\ No newline at end of file
+    def _reading_suffix(self, question):
+        return f"\n({question.reading})" if question.reading else ""
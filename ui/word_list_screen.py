@@ -1,14 +1,66 @@
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QListWidget, QPushButton,
+    QWidget, QVBoxLayout, QLabel, QListView, QPushButton,
     QMessageBox, QHBoxLayout, QDialog, QLineEdit, QTextEdit
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QThread, QTimer, pyqtSignal
+
+# 마지막 입력 후 이 시간(ms)이 지나야 검색을 시작합니다.
+SEARCH_DELAY_MS = 200
+
+class WordListModel(QAbstractListModel):
+    """단어 문자열 목록만 가지고, 화면에 보이는 줄만 그리도록 QListView에 넘기는 모델."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.words = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.words)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.words[index.row()]
+        return None
+
+    def set_words(self, words):
+        self.beginResetModel()
+        self.words = list(words)
+        self.endResetModel()
+
+    def append_words(self, words):
+        if not words:
+            return
+        start = len(self.words)
+        self.beginInsertRows(QModelIndex(), start, start + len(words) - 1)
+        self.words.extend(words)
+        self.endInsertRows()
+
+class SearchWorker(QThread):
+    """검색 색인에서 결과를 찾는 대로 조금씩 보내는 작업 스레드."""
+    results = pyqtSignal(int, list) # 검색 번호, 이번에 찾은 단어들
+
+    def __init__(self, data_manager, deck_name, query, generation):
+        super().__init__()
+        self.data_manager = data_manager
+        self.deck_name = deck_name
+        self.query = query
+        self.generation = generation
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        # 색인이 아직 없으면 처음 한 번은 여기(작업 스레드)에서 만들어짐
+        index = self.data_manager.get_search_index(self.deck_name)
+        for words in index.search(self.query, is_cancelled=lambda: self._cancelled):
+            self.results.emit(self.generation, words)
 
 class WordListScreen(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
-        self.all_words_in_deck = [] # 현재 덱의 단어 목록을 저장할 변수
+        self.search_generation = 0 # 늦게 도착한 이전 검색 결과를 버리기 위한 번호
+        self.search_workers = []
 
         self.layout = QVBoxLayout(self)
 
@@ -18,10 +70,19 @@ class WordListScreen(QWidget):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("검색할 단어 또는 뜻을 입력하세요...")
-        self.search_input.textChanged.connect(self.filter_words) # 텍스트가 변경될 때마다 filter_words 함수 호출
         self.layout.addWidget(self.search_input)
 
-        self.word_list_widget = QListWidget()
+        # 입력할 때마다 검색하지 않고, 입력이 멈추면 filter_words 함수 호출
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.filter_words)
+        self.search_input.textChanged.connect(self.search_timer.start)
+
+        self.word_model = WordListModel(self)
+        self.word_list_widget = QListView()
+        self.word_list_widget.setModel(self.word_model)
+        self.word_list_widget.setUniformItemSizes(True) # 줄 높이를 한 번만 계산
         self.layout.addWidget(self.word_list_widget)
 
         self.detail_label = QLabel("단어를 선택하면 상세 정보가 표시됩니다.")
@@ -45,46 +106,63 @@ class WordListScreen(QWidget):
         self.home_button.clicked.connect(self.main_window.go_to_home_screen)
         self.layout.addWidget(self.home_button)
 
-        self.word_list_widget.itemSelectionChanged.connect(self.show_word_details)
+        self.word_list_widget.selectionModel().selectionChanged.connect(self.show_word_details)
         
     def load_words(self):
         deck_name = self.main_window.current_deck
         if not deck_name:
-            self.word_list_widget.clear()
+            self._cancel_searches()
+            self.word_model.set_words([])
             self.title.setText("선택된 덱이 없습니다")
             return
             
         self.title.setText(f"📖 '{deck_name}' 덱 단어 목록")
-        self.all_words_in_deck = self.main_window.data_manager.get_words_for_deck(deck_name)
-        
-        self.word_list_widget.clear()
         self.filter_words() 
         
     def filter_words(self):
-        search_text = self.search_input.text().lower()
-        self.word_list_widget.clear()
-
-        for entry in self.all_words_in_deck:
-            word = entry.get("word", "").lower()
-            meanings = " ".join(entry.get("meaning", [])).lower()
-            
-            # 검색어가 비어있거나, 단어 또는 뜻에 포함되어 있으면 목록에 추가
-            if not search_text or search_text in word or search_text in meanings:
-                self.word_list_widget.addItem(entry["word"])
+        self.search_timer.stop()
+        self._cancel_searches()
+        deck_name = self.main_window.current_deck
+        search_text = self.search_input.text().strip()
+
+        if not search_text or not deck_name:
+            # 검색어가 비어있으면 덱의 모든 단어를 그대로 표시
+            words = self.main_window.data_manager.iter_words(deck_name) if deck_name else ()
+            self.word_model.set_words(entry["word"] for entry in words)
+        else:
+            # 검색은 작업 스레드에서 하고, 찾은 결과는 on_search_results에서 목록 끝에 붙임
+            self.word_model.set_words([])
+            worker = SearchWorker(self.main_window.data_manager, deck_name, search_text, self.search_generation)
+            worker.results.connect(self.on_search_results)
+            worker.finished.connect(lambda: self.search_workers.remove(worker))
+            self.search_workers.append(worker)
+            worker.start()
         
         self.detail_label.setText("단어를 선택하면 상세 정보가 표시됩니다.")
         self.delete_button.setEnabled(False)
         self.edit_button.setEnabled(False)
 
+    def on_search_results(self, generation, words):
+        if generation == self.search_generation:
+            self.word_model.append_words(words)
+
+    def _cancel_searches(self):
+        self.search_generation += 1
+        for worker in self.search_workers:
+            worker.cancel()
+
+    def _selected_word(self):
+        indexes = self.word_list_widget.selectionModel().selectedIndexes()
+        return indexes[0].data() if indexes else None
+
     def show_word_details(self):
-        selected_items = self.word_list_widget.selectedItems()
-        if not selected_items:
+        selected_word_text = self._selected_word()
+        if not selected_word_text:
             self.delete_button.setEnabled(False)
             self.edit_button.setEnabled(False)
             return
 
-        selected_word_text = selected_items[0].text()
-        entry = next((word for word in self.all_words_in_deck if word["word"] == selected_word_text), None)
+        entry = self.main_window.data_manager.get_word(self.main_window.current_deck, selected_word_text)
         if not entry: return
 
         word = entry.get("word", "")
@@ -100,27 +178,25 @@ class WordListScreen(QWidget):
         self.edit_button.setEnabled(True)
 
     def delete_selected_word(self):
-        selected_word_text = self.word_list_widget.currentItem().text()
-
-        word_to_delete_index = -1
-        for i, word in enumerate(self.all_words_in_deck):
-            if word["word"] == selected_word_text:
-                word_to_delete_index = i
-                break
-        if word_to_delete_index == -1: return
+        selected_word_text = self._selected_word()
+        if not selected_word_text: return
+        data_manager = self.main_window.data_manager
+        deck_name = self.main_window.current_deck
+        if data_manager.get_word(deck_name, selected_word_text) is None: return
         
         confirm = QMessageBox.question(self, "삭제 확인", f"'{selected_word_text}' 단어를 정말 삭제하시겠습니까?")
         if confirm == QMessageBox.Yes:
-            del self.all_words_in_deck[word_to_delete_index]
-            self.main_window.data_manager.save_data()
+            data_manager.delete_word(deck_name, selected_word_text)
+            data_manager.save_data()
             QMessageBox.information(self, "삭제 완료", f"'{selected_word_text}' 단어가 삭제되었습니다.")
             self.load_words()
 
     def edit_selected_word(self):
-        if not self.word_list_widget.currentItem(): return
-        selected_word_text = self.word_list_widget.currentItem().text()
+        selected_word_text = self._selected_word()
+        if not selected_word_text: return
+        deck_name = self.main_window.current_deck
 
-        entry = next((word for word in self.all_words_in_deck if word["word"] == selected_word_text), None)
+        entry = self.main_window.data_manager.get_word(deck_name, selected_word_text)
         if not entry: return
 
         # --- 수정 다이얼로그 생성 ---
@@ -141,10 +217,11 @@ class WordListScreen(QWidget):
         dialog_layout.addWidget(save_button)
 
         def save_changes():
-            # 원본 데이터(entry)를 직접 수정
-            entry["meaning"] = [m.strip() for m in meaning_input.toPlainText().splitlines() if m.strip()]
-            entry["example"] = example_input.toPlainText().strip()
-            
+            self.main_window.data_manager.update_word(
+                deck_name, entry["word"],
+                meanings=[m.strip() for m in meaning_input.toPlainText().splitlines() if m.strip()],
+                example=example_input.toPlainText().strip()
+            )
             self.main_window.data_manager.save_data() # 변경사항 저장
             dialog.accept() # 다이얼로그 닫기
             self.load_words() # 목록 새로고침
@@ -0,0 +1,106 @@
+from models import LazyRecord, WordRecord
+
+def make_word_entry(word, meanings, example="", now=None):
+    """새 단어의 기본 데이터(복습 통계 포함)를 만듭니다. now는 epoch 초입니다."""
+    return WordRecord.new(word, meanings, example, now)
+
+class WordIndex:
+    """
+    덱 하나의 단어 목록(deck["words"])에 대한 단어 → 위치, 단어 ID → 위치 인덱스.
+    단어마다 덱 안에서 바뀌지 않는 정수 ID("id")를 붙여 관리합니다.
+    파일에서 읽은 딕셔너리(또는 LazyRecord) 항목은 처음 꺼낼 때(get, get_by_id, 순회) WordRecord로 바꾸므로,
+    덱을 읽고 바로 저장하는 경우에는 변환 비용이 들지 않습니다.
+
+    삭제는 목록 중간을 지우지 않고 그 자리를 None(묘비)으로 표시만 하며,
+    묘비는 저장하기 직전에 compact()로 한꺼번에 정리합니다.
+    """
+    def __init__(self, deck_data):
+        self.deck_data = deck_data
+        self.words = deck_data.setdefault("words", [])
+        self.tombstones = 0
+        self.assigned_ids = 0 # ID가 없어서 새로 붙인 단어 수 (덱 데이터가 바뀐 것이므로 저장해야 함)
+        self._rebuild()
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __iter__(self):
+        words = self.words
+        return (self._record(pos) for pos in range(len(words)) if words[pos] is not None)
+
+    def _rebuild(self):
+        # WordRecord와 LazyRecord는 속성으로 바로 읽음 (Mapping 방식으로 읽으면 단어마다 몇 배 느림)
+        # 단어마다 튜플을 만들지 않도록 열마다 따로 모음 (순환 참조 검사가 덜 돎)
+        live = [e for e in self.words if e is not None]
+        positions = [pos for pos, e in enumerate(self.words) if e is not None]
+        words = [e["word"] if type(e) is dict else e.word for e in live]
+        ids = [e.get("id") if type(e) is dict else e.id for e in live]
+        next_id = max([self.deck_data.get("next_word_id", 1)] + [i + 1 for i in ids if isinstance(i, int)])
+
+        for i, word_id in enumerate(ids):
+            if isinstance(word_id, int):
+                continue
+            ids[i] = word_id = next_id
+            next_id += 1
+            self.assigned_ids += 1
+            entry = self.words[positions[i]]
+            if type(entry) is dict:
+                entry["id"] = word_id
+            else:
+                if isinstance(entry, LazyRecord) and entry.converted:
+                    entry = self._record(positions[i])
+                entry.id = word_id # 아직 바꾸지 않은 LazyRecord는 바꿀 때 이 ID를 씀
+        self.positions = dict(zip(words, positions)) # 단어 -> 목록 위치
+        self.id_positions = dict(zip(ids, positions)) # 단어 ID -> 목록 위치
+        self.deck_data["next_word_id"] = next_id
+
+    def _record(self, pos):
+        entry = self.words[pos]
+        if not isinstance(entry, WordRecord):
+            # 파일에서 읽은 딕셔너리는 처음 꺼낼 때 한 번만 WordRecord로 바꿔 둠
+            entry = self.words[pos] = WordRecord.from_dict(entry)
+        return entry
+
+    def get(self, word):
+        pos = self.positions.get(word)
+        return None if pos is None else self._record(pos)
+
+    def get_by_id(self, word_id):
+        pos = self.id_positions.get(word_id)
+        return None if pos is None else self._record(pos)
+
+    def records(self):
+        """모든 항목을 WordRecord로 바꾼 단어 목록(묘비 포함)을 반환합니다."""
+        for pos, entry in enumerate(self.words):
+            if entry is not None and not isinstance(entry, WordRecord):
+                self.words[pos] = WordRecord.from_dict(entry)
+        return self.words
+
+    def add(self, entry):
+        """새 단어를 목록 끝에 추가하고 ID를 붙입니다."""
+        entry["id"] = self.deck_data["next_word_id"]
+        self.deck_data["next_word_id"] += 1
+        self.words.append(entry)
+        self.positions[entry["word"]] = len(self.words) - 1
+        self.id_positions[entry["id"]] = len(self.words) - 1
+        return entry
+
+    def delete(self, word):
+        """단어 자리를 묘비(None)로 바꾸고, 삭제한 항목을 반환합니다."""
+        pos = self.positions.pop(word, None)
+        if pos is None:
+            return None
+        entry = self._record(pos)
+        self.id_positions.pop(entry.get("id"), None)
+        self.words[pos] = None
+        self.tombstones += 1
+        return entry
+
+    def compact(self):
+        """묘비를 목록에서 실제로 지우고 위치를 다시 계산합니다."""
+        if not self.tombstones:
+            return
+        self.words[:] = [entry for entry in self.words if entry is not None]
+        self.tombstones = 0
+        self.assigned_ids = 0 # ID가 없어서 새로 붙인 단어 수 (덱 데이터가 바뀐 것이므로 저장해야 함)
+        self._rebuild()